@@ -0,0 +1,171 @@
+"""
+Microbenchmark: analyze_text token feature extraction.
+
+Parses synthetic transcripts of 100 to 10,000 tokens once, then times the
+original per-token Python loop against the doc.to_array based extraction on the
+same Doc, and checks that both produce identical results.
+
+Usage:
+    cd demo
+    python benchmarks/bench_analyze_text.py --tokens 100 1000 10000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_transcript, BANK_WORDS
+from processQuest.SpeechAnalysis import (
+    DERIVATIONAL_SUFFIXES,
+    _analyze_doc,
+    lookup_frequencies,
+    syntax_nlp,
+)
+
+def legacy_analyze_doc(doc, lexicon_index):
+    """The original per-token analyze_text loop, kept here as the reference"""
+    total_tokens = 0
+    total_nouns = 0
+    total_verbs = 0
+    total_filler_words = 0
+    total_open_class_words = 0
+    total_closed_class_words = 0
+    repetitions = 0
+    morpheme_count = 0
+    phrase_reps = 0
+
+    noun_tags = {"NOUN", "PROPN"}
+    verb_tags = {"VERB", "AUX"}
+    filler_words_tags = {"INTJ"}
+    open_class_tags = noun_tags | {"VERB", "ADJ", "ADV"}
+
+    previous_word = None
+    tokens_alpha_lower = []
+    sentences = list(doc.sents)
+    subordinating_conjunctions = {"although", "because", "since", "unless", "while", "if", "when", "that",
+                                  "which", "who"}
+    total_sentence_words = 0
+    nouns_for_frequency = []
+
+    for sentence in sentences:
+        for token in sentence:
+            if not token.is_alpha:
+                continue
+            word = token.text
+            tag = token.pos_
+            total_tokens += 1
+            tokens_alpha_lower.append(word.lower())
+            if tag in noun_tags:
+                total_nouns += 1
+                nouns_for_frequency.append(word)
+            if tag in verb_tags:
+                total_verbs += 1
+            if tag in filler_words_tags:
+                total_filler_words += 1
+            if tag in open_class_tags:
+                total_open_class_words += 1
+            else:
+                total_closed_class_words += 1
+            if word.lower() == previous_word:
+                repetitions += 1
+            previous_word = word.lower()
+
+            bound_morphemes = 0
+            morph_dict = token.morph.to_dict()
+            if morph_dict.get("Number") == "Plur":
+                bound_morphemes += 1
+            if "Tense" in morph_dict:
+                if "Past" in morph_dict["Tense"]:
+                    bound_morphemes += 1
+                if "Pres" in morph_dict["Tense"] and token.tag_ not in ["VBZ", "VBP"]:
+                    bound_morphemes += 1
+            if morph_dict.get("Degree"):
+                bound_morphemes += 1
+            if morph_dict.get("Poss"):
+                bound_morphemes += 1
+            for suffix in DERIVATIONAL_SUFFIXES.keys():
+                if word.endswith(suffix) and len(word) > len(suffix) + 1:
+                    bound_morphemes += 1
+            morpheme_count += 1 + bound_morphemes
+
+        total_sentence_words += len([token for token in sentence if token.is_alpha])
+
+    embedded_clauses = sum(1 for token in doc if token.text.lower() in subordinating_conjunctions)
+    num_sentences = len(sentences)
+    mean_length_of_utterance = (total_sentence_words / num_sentences) if num_sentences else 0
+    verb_index = (total_verbs / num_sentences) if num_sentences else 0
+    open_closed_ratio = (total_open_class_words / total_closed_class_words) if total_closed_class_words else 0
+
+    i = 0
+    n = len(tokens_alpha_lower)
+    while i < n:
+        event_detected = False
+        for L in range(min(5, (n - i) // 2), 1, -1):
+            if tokens_alpha_lower[i:i+L] == tokens_alpha_lower[i+L:i+2*L]:
+                phrase_reps += 1
+                i += 2 * L
+                event_detected = True
+                break
+        if not event_detected:
+            i += 1
+
+    repetition_ratio = ((repetitions + phrase_reps) / morpheme_count) if morpheme_count else 0
+    frequencies = lookup_frequencies(lexicon_index, nouns_for_frequency)
+    avg_noun_frequency = (sum(frequencies) / len(frequencies)) if frequencies else 0
+
+    return {
+        "Total Sentences": num_sentences,
+        "Total Tokens": total_tokens,
+        "Frequency of Nouns": total_nouns,
+        "Frequency of Verbs and auxillary verbs": total_verbs,
+        "Frequency of Filler Words": total_filler_words,
+        "Open-Class Words": total_open_class_words,
+        "Closed-Class Words": total_closed_class_words,
+        "Open/Closed Class Ratio": round(open_closed_ratio, 3),
+        "Total Words": total_open_class_words + total_closed_class_words,
+        "Repetition Ratio": round(repetition_ratio, 3),
+        "Mean Length of Utterance (MLU) (Average number of words per sentence)": round(mean_length_of_utterance, 2),
+        "Embedded Clauses": embedded_clauses,
+        "Verb Index (verbs to utterances ratio)": round(verb_index, 2),
+        "Average Noun Frequency": round(avg_noun_frequency, 2),
+    }
+
+def best_time(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Small stand-in lexicon so the noun lookup is exercised without the spreadsheet
+    lexicon_index = {word: float(len(word)) for word in BANK_WORDS}
+
+    print(f"{'tokens':>8} {'parse (ms)':>12} {'loop (ms)':>12} {'arrays (ms)':>12} {'speedup':>10}")
+    for count in args.tokens:
+        text = synthetic_transcript(count, seed=count)
+
+        start = time.perf_counter()
+        doc = syntax_nlp(text)
+        parse_time = time.perf_counter() - start
+
+        loop_time, expected = best_time(legacy_analyze_doc, doc, lexicon_index, repeat=args.repeat)
+        array_time, actual = best_time(_analyze_doc, doc, lexicon_index, repeat=args.repeat)
+
+        if actual != expected:
+            raise SystemExit(f"Mismatch for {count} tokens:\n{actual}\n{expected}")
+
+        speedup = loop_time / array_time if array_time else float("inf")
+        print(f"{count:>8} {parse_time * 1000:>12.1f} {loop_time * 1000:>12.2f} {array_time * 1000:>12.2f} "
+              f"{speedup:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
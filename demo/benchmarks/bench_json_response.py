@@ -0,0 +1,96 @@
+"""
+Benchmark: response time and payload size of the natures-gaze JSON responses.
+
+A synthetic saccade session (synthetic_gaze_results) is turned into a Flask
+response the way the API does it, for the /api/natures-gaze/results body and
+for the /api/natures-gaze/debug body that embeds the processed file. It is
+serialized with Flask's default provider, the NumPy-aware json provider and
+orjson, each uncompressed, gzip and Brotli (shared/json_response.py). The
+decoded bodies are checked to be equal across serializers.
+
+Usage:
+    cd demo
+    python benchmarks/bench_json_response.py --trials 40 --gaze-points 50 500
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_gaze_results
+from shared.json_response import NumpyJSONProvider, OrjsonProvider, brotli, compress_response, orjson
+
+def debug_body(results):
+    """The /api/natures-gaze/debug body for the same session"""
+    content = results["raw_results"]
+    return {
+        "trial_log": {"exists": True, "path": "saccade_output/saccade_trial_log.json", "size": 4096},
+        "processed_data": {"exists": True, "path": "saccade_output/processed_trial_data.json",
+                           "size": len(json.dumps(content, default=float)), "content": content},
+        "output_directory": {"path": "saccade_output", "exists": True, "files": []},
+    }
+
+def decode(response):
+    data = response.get_data()
+    encoding = response.headers.get("Content-Encoding")
+    if encoding == "gzip":
+        data = gzip.decompress(data)
+    elif encoding == "br":
+        data = brotli.decompress(data)
+    return json.loads(data)
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=40)
+    parser.add_argument("--gaze-points", type=int, nargs="+", default=[50, 500], help="Gaze samples per trial")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask("bench_json_response")
+    providers = [("flask default", DefaultJSONProvider(app)), ("json + numpy", NumpyJSONProvider(app))]
+    if orjson is not None:
+        providers.append(("orjson", OrjsonProvider(app)))
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+    print(f"{'body':>8} {'gaze pts':>9} {'serializer':>14} {'encoding':>9} {'time (ms)':>10} {'size (KB)':>10} "
+          f"{'vs default':>11}")
+    for gaze_points in args.gaze_points:
+        results = synthetic_gaze_results(args.trials, gaze_points, seed=gaze_points)
+        for name, body in (("results", results), ("debug", debug_body(results))):
+            baseline = None
+            expected = None
+            for provider_name, provider in providers:
+                for encoding in encodings:
+                    def respond():
+                        response = provider.response(body)
+                        return compress_response(response, encoding, encodings=[encoding], min_bytes=0)
+
+                    with app.app_context():
+                        seconds, response = best_time(respond, args.repeat)
+                    decoded = decode(response)
+                    if expected is None:
+                        expected = decoded
+                    elif decoded != expected:
+                        raise SystemExit(f"{provider_name} / {encoding} decodes differently for the {name} body")
+
+                    baseline = baseline or seconds
+                    print(f"{name:>8} {gaze_points:>9} {provider_name:>14} {encoding:>9} {seconds * 1000:>10.2f} "
+                          f"{len(response.get_data()) / 1024:>10.1f} {baseline / seconds:>10.1f}x")
+
+if __name__ == '__main__':
+    main()
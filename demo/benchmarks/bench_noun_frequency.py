@@ -0,0 +1,88 @@
+"""
+Benchmark: SUBTLEXus noun frequency lookup.
+
+Compares the original per-noun DataFrame scan used by analyze_text with the
+lexicon index built once by build_lexicon_index.
+
+Usage:
+    cd demo
+    python benchmarks/bench_noun_frequency.py --nouns 50 200 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from processQuest.SpeechAnalysis import build_lexicon_index, lookup_frequencies
+
+SUBTLEXUS_PATH = os.path.join(os.path.dirname(__file__), "../processQuest/SUBTLEXusExcel2007.xlsx")
+COLUMNS = ['Word', 'FREQcount', 'CDcount', 'FREQlow', 'Cdlow', 'SUBTLWF', 'Lg10WF', 'SUBTLCD', 'Lg10CD']
+
+def load_subtlexus():
+    """Load the real spreadsheet when present, otherwise a synthetic 74k-row lexicon"""
+    if os.path.exists(SUBTLEXUS_PATH):
+        df = pd.read_excel(SUBTLEXUS_PATH)
+        df.columns = COLUMNS
+        return df
+
+    print("SUBTLEXus spreadsheet not found, using a synthetic lexicon")
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(74000)]
+    freqs = [round(rng.uniform(0.02, 500), 2) for _ in words]
+    df = pd.DataFrame({column: 0 for column in COLUMNS}, index=range(len(words)))
+    df['Word'] = words
+    df['SUBTLWF'] = freqs
+    return df
+
+def dataframe_scan(subtlexus_df, nouns):
+    """Original analyze_text lookup: one full column scan per noun"""
+    frequencies = []
+    for noun in nouns:
+        match = subtlexus_df[subtlexus_df['Word'].str.lower() == noun.lower()]
+        freq = match['SUBTLWF'].values[0] if not match.empty else 0
+        frequencies.append(freq)
+    return frequencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nouns", type=int, nargs="+", default=[50, 200, 1000],
+                        help="Number of nouns per simulated transcript")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    subtlexus_df = load_subtlexus()
+    vocabulary = subtlexus_df['Word'].dropna().astype(str).tolist()
+    rng = random.Random(args.seed)
+
+    start = time.perf_counter()
+    lexicon_index = build_lexicon_index(subtlexus_df)
+    build_time = time.perf_counter() - start
+    print(f"Index build: {build_time * 1000:.1f} ms for {len(lexicon_index)} words (one-off at startup)")
+
+    print(f"{'nouns':>8} {'scan (ms)':>12} {'index (ms)':>12} {'speedup':>10}")
+    for count in args.nouns:
+        # Mix of known words (with varied casing) and out-of-vocabulary words
+        nouns = [rng.choice(vocabulary).capitalize() if rng.random() < 0.9 else f"zzunknown{i}"
+                 for i in range(count)]
+
+        start = time.perf_counter()
+        scanned = dataframe_scan(subtlexus_df, nouns)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = lookup_frequencies(lexicon_index, nouns)
+        index_time = time.perf_counter() - start
+
+        if [float(f) for f in scanned] != [float(f) for f in indexed]:
+            raise SystemExit(f"Mismatch between DataFrame scan and index for {count} nouns")
+
+        speedup = scan_time / index_time if index_time else float("inf")
+        print(f"{count:>8} {scan_time * 1000:>12.1f} {index_time * 1000:>12.3f} {speedup:>9.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Microbenchmark: analyze_pauses over AWS Transcribe item arrays.
+
+Times the original per-pair loop against the NumPy implementation on synthetic
+Transcribe JSON of graded item counts, and checks both (and the streaming
+iter_pauses) return identical pauses, also for malformed items (missing, empty
+or non-numeric timings, NaN/inf, punctuation and non-dict entries).
+
+Usage:
+    cd demo
+    python benchmarks/bench_pauses.py --items 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_transcribe_json
+from processQuest.SpeechAnalysis import analyze_pauses, iter_pauses
+
+def legacy_analyze_pauses(json, pause_threshold=0.5):
+    """The original analyze_pauses loop, kept here as the reference"""
+    if not isinstance(json, dict):
+        raise ValueError("Expected 'json' to be a dictionary.")
+
+    results = json.get('results')
+    if not results or not isinstance(results, dict):
+        raise ValueError("Missing or invalid 'results' field in JSON.")
+
+    items = results.get('items')
+    if not items or not isinstance(items, list):
+        raise ValueError("Missing or invalid 'items' field in 'results'.")
+
+    words = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if item.get('type') == 'pronunciation':
+            if 'start_time' not in item or 'end_time' not in item:
+                continue
+            words.append(item)
+
+    pauses = []
+    for i in range(len(words) - 1):
+        try:
+            current_end = float(words[i]['end_time'])
+            next_start = float(words[i + 1]['start_time'])
+        except (KeyError, ValueError, TypeError):
+            continue
+
+        gap = next_start - current_end
+        if gap >= pause_threshold:
+            pauses.append({'StartTime': round(current_end, 2), 'EndTime': round(next_start, 2)})
+
+    return pauses
+
+def malformed_transcription(n_items, seed=0):
+    """Synthetic transcription with a share of broken or unusual items"""
+    rng = random.Random(seed)
+    transcription = synthetic_transcribe_json(n_items, seed=seed, pause_rate=0.3)
+    items = transcription["results"]["items"]
+    odd_values = ["", "abc", None, [], {}, "nan", "inf", "-inf", " 1.5 ", "1_000", 3, 2.5, True, "1e3"]
+    for item in items:
+        if item["type"] != "pronunciation" or rng.random() > 0.2:
+            continue
+        choice = rng.random()
+        if choice < 0.3:
+            item[rng.choice(["start_time", "end_time"])] = rng.choice(odd_values)
+        elif choice < 0.5:
+            del item[rng.choice(["start_time", "end_time"])]
+        elif choice < 0.6:
+            item["type"] = "punctuation"
+    items.insert(rng.randrange(len(items)), "not a dict")
+    return transcription
+
+def best_time(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for seed in range(50):
+        transcription = malformed_transcription(200, seed=seed)
+        for threshold in (0, 0.5, 2.0):
+            expected = legacy_analyze_pauses(transcription, threshold)
+            actual = analyze_pauses(transcription, threshold)
+            streamed = list(iter_pauses(transcription["results"]["items"], threshold))
+            if actual != expected or streamed != expected:
+                raise SystemExit(f"Mismatch on malformed input (seed {seed}, threshold {threshold}):\n"
+                                 f"{actual}\n{streamed}\n{expected}")
+    print("Malformed inputs: identical pauses")
+
+    print(f"{'items':>8} {'pauses':>8} {'loop (ms)':>12} {'numpy (ms)':>12} {'speedup':>10}")
+    for count in args.items:
+        transcription = synthetic_transcribe_json(count, seed=count)
+        loop_time, expected = best_time(legacy_analyze_pauses, transcription, repeat=args.repeat)
+        numpy_time, actual = best_time(analyze_pauses, transcription, repeat=args.repeat)
+
+        if actual != expected:
+            raise SystemExit(f"Mismatch for {count} items")
+
+        speedup = loop_time / numpy_time if numpy_time else float("inf")
+        print(f"{count:>8} {len(actual):>8} {loop_time * 1000:>12.2f} {numpy_time * 1000:>12.2f} {speedup:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Memory benchmark: /analyze-pauses body parsed in full vs streamed with ijson.
+
+Serializes synthetic Transcribe JSON of graded item counts as an /analyze-pauses
+request body, then measures the peak traced memory and time of json.loads +
+analyze_pauses against analyze_pauses_stream reading the same bytes, and checks
+both find the same pauses. The body bytes themselves are excluded from the
+peaks (a real server reads them from the socket).
+
+Usage:
+    cd demo
+    python benchmarks/bench_pauses_stream.py --items 10000 100000 500000
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_transcribe_json
+from processQuest.SpeechAnalysis import analyze_pauses, analyze_pauses_stream
+
+def full_parse(body):
+    return analyze_pauses(json.loads(body)["full_transcription"])
+
+def streamed(body):
+    return analyze_pauses_stream(io.BytesIO(body), prefix="full_transcription.results.items.item")
+
+def measure(func, body):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(body)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 100000, 500000])
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'body MiB':>9} {'full MiB':>9} {'stream MiB':>11} {'full (ms)':>10} {'stream (ms)':>12}")
+    for count in args.items:
+        body = json.dumps({"full_transcription": synthetic_transcribe_json(count, seed=count)}).encode()
+
+        expected, full_time, full_peak = measure(full_parse, body)
+        actual, stream_time, stream_peak = measure(streamed, body)
+        if actual != expected:
+            raise SystemExit(f"Mismatch for {count} items")
+
+        print(f"{count:>8} {len(body) / 2 ** 20:>9.1f} {full_peak / 2 ** 20:>9.1f} {stream_peak / 2 ** 20:>11.2f} "
+              f"{full_time * 1000:>10.1f} {stream_time * 1000:>12.1f}")
+
+if __name__ == '__main__':
+    main()
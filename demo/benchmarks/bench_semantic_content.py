@@ -0,0 +1,118 @@
+"""
+Benchmark: analyze_semantic_content_with_word_bank on long transcripts.
+
+Compares the original token x bank Token.similarity double loop with the
+normalized bank matrix product, and checks both give the same results. Some
+bank and transcript words have no vector, including bank words that are
+spoken verbatim, so the zero rows for words without vectors are checked too.
+
+Usage:
+    cd demo
+    python benchmarks/bench_semantic_content.py --tokens 1000 5000 --bank-sizes 100 250
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+from itertools import islice
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from processQuest.SpeechAnalysis import analyze_semantic_content_with_word_bank, vectors_nlp
+
+def legacy_semantic_content(text, bank, speech_duration, similarity_threshold=0.5):
+    """The pre-vectorization implementation, kept here as the reference"""
+    doc = vectors_nlp(text)
+    semantic_units = []
+    bank_tokens = [vectors_nlp(word) for word in bank]
+
+    for token in doc:
+        if token.is_alpha and not token.is_stop:
+            max_similarity = max(token.similarity(ref) for ref in bank_tokens)
+            if max_similarity >= similarity_threshold:
+                semantic_units.append(token.text.lower())
+
+    total_words = len([token for token in doc if token.is_alpha])
+    num_semantic_units = len(semantic_units)
+    idea_density = num_semantic_units / total_words if total_words else 0
+    semantic_efficiency = (
+        num_semantic_units / speech_duration if speech_duration and speech_duration > 0 else None
+    )
+    return {
+        "Semantic Units": num_semantic_units,
+        "Semantic Idea Density": round(idea_density, 2),
+        "Semantic Efficiency": round(semantic_efficiency, 2)
+        if semantic_efficiency is not None else "Duration not provided",
+    }
+
+def sample_vocabulary(size, seed):
+    """Lowercase alphabetic words that have a vector in the loaded model"""
+    vocab = vectors_nlp.vocab
+    words = []
+    for key in islice(vocab.vectors.keys(), 200000):
+        word = vocab.strings[key] if key in vocab.strings else ""
+        if word.isalpha() and word.islower():
+            words.append(word)
+    random.Random(seed).shuffle(words)
+    return words[:size]
+
+def out_of_vocabulary_words(size, seed):
+    """Made-up lowercase words without a vector, e.g. misrecognized or rare words in a transcript"""
+    vocab = vectors_nlp.vocab
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        word = "".join(rng.choice("bcdfghjklmnpqrstvwxz") + rng.choice("aeiou") for _ in range(rng.randint(2, 4)))
+        if not vocab.has_vector(word):
+            words.add(word)
+    return sorted(words)
+
+def time_call(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--bank-sizes", type=int, nargs="+", default=[100, 250])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = sample_vocabulary(5000, args.seed)
+    unknown = out_of_vocabulary_words(max(args.bank_sizes) // 10 + 10, args.seed)
+    fillers = ["the", "and", "um", "is", "a", "there", "she", "of", "uh", "to"]
+
+    print(f"{'tokens':>8} {'bank':>6} {'loop (ms)':>12} {'matrix (ms)':>12} {'speedup':>10}")
+    for bank_size in args.bank_sizes:
+        # A tenth of the bank has no vector; the transcript uses half of those and other unknown words
+        bank = vocabulary[:bank_size - bank_size // 10] + unknown[:bank_size // 10]
+        spoken_unknown = unknown[bank_size // 20:bank_size // 10] + unknown[-10:]
+        for token_count in args.tokens:
+            text = " ".join(rng.choice(fillers) if rng.random() < 0.4
+                            else rng.choice(spoken_unknown) if rng.random() < 0.05
+                            else rng.choice(vocabulary)
+                            for _ in range(token_count))
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # W008 for words without vectors
+                loop_time, expected = time_call(legacy_semantic_content, text, bank, 120.0, repeat=args.repeat)
+            matrix_time, actual = time_call(analyze_semantic_content_with_word_bank, text, bank, 120.0,
+                                            repeat=args.repeat)
+
+            if actual != expected:
+                raise SystemExit(f"Mismatch for {token_count} tokens / {bank_size} bank words: {actual} != {expected}")
+
+            speedup = loop_time / matrix_time if matrix_time else float("inf")
+            print(f"{token_count:>8} {bank_size:>6} {loop_time * 1000:>12.1f} {matrix_time * 1000:>12.1f} "
+                  f"{speedup:>9.0f}x")
+
+if __name__ == '__main__':
+    main()
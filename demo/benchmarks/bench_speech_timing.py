@@ -0,0 +1,62 @@
+"""
+Microbenchmark: one analyze_speech_timing call vs one analyze_pauses call per threshold.
+
+The per-threshold baseline is what a client had to do before: call analyze_pauses
+once for every threshold and aggregate the returned pauses itself (count, total,
+mean). Both are run on synthetic Transcribe JSON of graded item counts and the
+counts and totals are checked to agree.
+
+Usage:
+    cd demo
+    python benchmarks/bench_speech_timing.py --items 1000 10000 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_transcribe_json
+from processQuest.SpeechAnalysis import PAUSE_THRESHOLDS, analyze_pauses, analyze_speech_timing
+
+def per_threshold(transcription, thresholds=PAUSE_THRESHOLDS):
+    """Pause count and total per threshold from separate analyze_pauses calls"""
+    summaries = []
+    for threshold in thresholds:
+        pauses = analyze_pauses(transcription, threshold)
+        total = sum(pause["EndTime"] - pause["StartTime"] for pause in pauses)
+        summaries.append((len(pauses), total))
+    return summaries
+
+def best_time(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'thresholds':>11} {'separate (ms)':>14} {'one pass (ms)':>14} {'speedup':>10}")
+    for count in args.items:
+        transcription = synthetic_transcribe_json(count, seed=count)
+        separate_time, expected = best_time(per_threshold, transcription, repeat=args.repeat)
+        single_time, timing = best_time(analyze_speech_timing, transcription, repeat=args.repeat)
+
+        for (pause_count, total), summary in zip(expected, timing["Pause Summary"]):
+            # Totals differ only by the 0.01 s rounding of each pause's start and end
+            if pause_count != summary["Count"] or abs(total - summary["Total Pause Time"]) > 0.01 * pause_count + 0.01:
+                raise SystemExit(f"Mismatch for {count} items at threshold {summary['Threshold']}")
+
+        speedup = separate_time / single_time if single_time else float("inf")
+        print(f"{count:>8} {len(PAUSE_THRESHOLDS):>11} {separate_time * 1000:>14.2f} {single_time * 1000:>14.2f} "
+              f"{speedup:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
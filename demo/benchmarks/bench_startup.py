@@ -0,0 +1,112 @@
+"""
+Startup benchmark: time to first request per endpoint group of flask_api/app.py.
+
+Every group runs in a fresh Python process that imports the app and sends two
+requests through Flask's test client: the first one pays for whatever the group
+loads lazily (spaCy, the lexicon, pycaret, ...), the second shows the steady
+state. With --warm-up the process calls POST /api/warm-up first, which moves
+that cost out of the first request.
+
+Usage:
+    cd demo
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --only analyze_pauses analyze_text --warm-up
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+DEMO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(DEMO_DIR)
+
+# Endpoint group -> (method, path, JSON body builder)
+GROUPS = {
+    "analyze_pauses": ("POST", "/analyze-pauses", lambda synthetic: {
+        "full_transcription": synthetic.synthetic_transcribe_json(500)}),
+    "speech_timing": ("POST", "/analyze-speech-timing", lambda synthetic: {
+        "full_transcription": synthetic.synthetic_transcribe_json(500)}),
+    "analyze_text": ("POST", "/analyze-text", lambda synthetic: {
+        "transcript": synthetic.synthetic_transcript(200), "audio_segments": [{"end_time": "60"}]}),
+    "semantic_content": ("POST", "/semantic-content", lambda synthetic: {
+        "transcript": synthetic.synthetic_transcript(200), "word_bank": synthetic.synthetic_word_bank(20),
+        "audio_segments": [{"end_time": "60"}]}),
+    "memory_vault": ("POST", "/compute-points", lambda synthetic: {
+        "presented_word": "cookie", "recalled_word": "biscuit"}),
+    "gaze_calibration": ("GET", "/api/gaze/status", None),
+    "natures_gaze": ("GET", "/api/natures-gaze/status", None),
+}
+
+def run_child(group, warm_up):
+    """Runs in the child process: import the app, optionally warm up, send two requests"""
+    start = time.perf_counter()
+    sys.path.insert(0, os.path.join(DEMO_DIR, "flask_api"))
+    import app as app_module
+    from benchmarks import synthetic
+    from shared.model_registry import current_rss_mb
+    import_seconds = time.perf_counter() - start
+
+    client = app_module.app.test_client()
+    warm_up_seconds = None
+    if warm_up:
+        start = time.perf_counter()
+        client.post("/api/warm-up", json={})
+        warm_up_seconds = time.perf_counter() - start
+
+    method, path, body = GROUPS[group]
+    kwargs = {"json": body(synthetic)} if body else {}
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        response = client.open(path, method=method, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    print(json.dumps({
+        "group": group,
+        "status": response.status_code,
+        "import_seconds": round(import_seconds, 3),
+        "warm_up_seconds": round(warm_up_seconds, 3) if warm_up_seconds is not None else None,
+        "first_request_seconds": round(timings[0], 3),
+        "second_request_ms": round(timings[1] * 1000, 2),
+        "rss_mb": round(current_rss_mb(), 1),
+        "subsystems": sorted(name for name, stats in app_module.get_subsystem_stats().items() if stats["loaded"]),
+    }))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(GROUPS), help="Benchmark only these endpoint groups")
+    parser.add_argument("--warm-up", action="store_true", help="Call POST /api/warm-up before the first request")
+    parser.add_argument("--repeat", type=int, default=1, help="Fresh processes per group (best time is reported)")
+    parser.add_argument("--child", choices=sorted(GROUPS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.warm_up)
+        return
+
+    print(f"{'group':>18} {'status':>6} {'import (s)':>10} {'warm-up (s)':>11} {'first (s)':>10} "
+          f"{'import+first':>12} {'second (ms)':>11} {'RSS MB':>8}  loaded")
+    for group in args.only or GROUPS:
+        runs = []
+        for _ in range(args.repeat):
+            command = [sys.executable, os.path.abspath(__file__), "--child", group] + (["--warm-up"] if args.warm_up else [])
+            output = subprocess.run(command, capture_output=True, text=True, cwd=DEMO_DIR)
+            lines = [line for line in output.stdout.splitlines() if line.startswith("{")]
+            if output.returncode or not lines:
+                print(f"{group:>18} failed:\n{output.stderr.strip()[-2000:]}")
+                break
+            runs.append(json.loads(lines[-1]))
+        if not runs:
+            continue
+
+        result = min(runs, key=lambda run: run["import_seconds"] + run["first_request_seconds"])
+        warm_up = f"{result['warm_up_seconds']:.3f}" if result["warm_up_seconds"] is not None else "-"
+        print(f"{group:>18} {result['status']:>6} {result['import_seconds']:>10.3f} {warm_up:>11} "
+              f"{result['first_request_seconds']:>10.3f} "
+              f"{result['import_seconds'] + result['first_request_seconds']:>12.3f} "
+              f"{result['second_request_ms']:>11.2f} {result['rss_mb']:>8.1f}  {', '.join(result['subsystems'])}")
+
+if __name__ == '__main__':
+    main()
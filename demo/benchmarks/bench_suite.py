@@ -0,0 +1,185 @@
+"""
+Benchmark suite: analyze_text, semantic content, analyze_pauses, speech timing and compute_points.
+
+Runs each function on synthetic inputs of graded size (transcript tokens, word
+bank sizes, Transcribe JSON item counts, recall pairs) and reports throughput,
+p50/p99 latency and peak traced memory. Latencies are steady state: every case
+is warmed up once, so model loading and the word bank / word vector caches are
+not part of the numbers.
+
+Results can be saved as a JSON baseline and compared against an earlier one;
+the script exits non-zero when a case's p50 regressed by more than --tolerance.
+
+Usage:
+    cd demo
+    python benchmarks/bench_suite.py --save benchmarks/baselines/before.json
+    python benchmarks/bench_suite.py --compare benchmarks/baselines/before.json
+    python benchmarks/bench_suite.py --quick --only analyze_pauses
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import BANK_WORDS, synthetic_transcript, synthetic_transcribe_json, synthetic_word_bank
+from memoryVault.GeneratePoints import compute_points
+from processQuest.SpeechAnalysis import (analyze_pauses, analyze_semantic_content_with_word_bank, analyze_speech_timing,
+                                         analyze_text)
+from shared.model_registry import get_model_version
+
+# Graded input sizes per function; --quick keeps the smallest two
+SIZES = {
+    "analyze_text": [100, 1000, 5000],  # transcript tokens
+    "semantic_content": [10, 100, 500],  # word bank size, 1000 token transcript
+    "analyze_pauses": [100, 1000, 10000],  # Transcribe JSON items
+    "speech_timing": [100, 1000, 10000],  # Transcribe JSON items
+    "compute_points": [10, 100, 1000],  # distinct presented/recalled pairs
+}
+
+def build_cases(quick=False):
+    """(function, size, unit, units per call, list of argument tuples) for every benchmark case"""
+    # Small stand-in lexicon so the noun lookup is exercised without the spreadsheet
+    lexicon_index = {word: float(len(word)) for word in BANK_WORDS}
+    sizes = {name: values[:2] if quick else values for name, values in SIZES.items()}
+    cases = []
+
+    for tokens in sizes["analyze_text"]:
+        texts = [synthetic_transcript(tokens, seed=seed) for seed in range(3)]
+        cases.append(("analyze_text", tokens, "tokens", tokens,
+                      lambda text: analyze_text(text, lexicon_index=lexicon_index), [(text,) for text in texts]))
+
+    transcript = synthetic_transcript(1000, seed=1)
+    for bank_size in sizes["semantic_content"]:
+        bank = synthetic_word_bank(bank_size, seed=bank_size)
+        cases.append(("semantic_content", bank_size, "bank words", 1000,
+                      analyze_semantic_content_with_word_bank, [(transcript, bank, 60.0)]))
+
+    for n_items in sizes["analyze_pauses"]:
+        transcriptions = [synthetic_transcribe_json(n_items, seed=seed) for seed in range(3)]
+        cases.append(("analyze_pauses", n_items, "items", n_items,
+                      analyze_pauses, [(transcription,) for transcription in transcriptions]))
+
+    for n_items in sizes["speech_timing"]:
+        transcriptions = [synthetic_transcribe_json(n_items, seed=seed) for seed in range(3)]
+        cases.append(("speech_timing", n_items, "items", n_items,
+                      analyze_speech_timing, [(transcription,) for transcription in transcriptions]))
+
+    for n_pairs in sizes["compute_points"]:
+        words = synthetic_word_bank(2 * n_pairs, seed=n_pairs)
+        pairs = [(words[2 * i], words[2 * i + 1]) for i in range(n_pairs)]
+        cases.append(("compute_points", n_pairs, "pairs", 1, compute_points, pairs))
+
+    return cases
+
+def run_case(func, args_list, min_calls, min_seconds):
+    """Latencies (seconds) of repeated calls cycling through args_list, plus peak traced memory"""
+    for args in args_list:
+        func(*args)  # warm-up: model load, caches
+
+    latencies = []
+    start = time.perf_counter()
+    while len(latencies) < min_calls or time.perf_counter() - start < min_seconds:
+        args = args_list[len(latencies) % len(args_list)]
+        call_start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - call_start)
+
+    # Separate pass: tracemalloc slows allocation-heavy code, so it is kept out of the timings
+    tracemalloc.start()
+    func(*args_list[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return np.array(latencies), peak
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    import spacy
+    return {
+        "commit": commit,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "spacy": spacy.__version__,
+        "model": get_model_version(),
+    }
+
+def compare(results, baseline, tolerance):
+    """Print p50 changes against a baseline and return the cases that regressed"""
+    previous = {(entry["function"], entry["size"]): entry for entry in baseline["results"]}
+    regressions = []
+    print(f"\nAgainst baseline {baseline['environment'].get('commit')} ({baseline['environment'].get('created_at')}):")
+    for entry in results:
+        old = previous.get((entry["function"], entry["size"]))
+        if old is None or not old["p50_ms"]:
+            continue
+        change = entry["p50_ms"] / old["p50_ms"] - 1
+        flag = "  REGRESSION" if change > tolerance else ""
+        print(f"{entry['function']:>18} {entry['size']:>7} p50 {old['p50_ms']:>10.3f} -> {entry['p50_ms']:>10.3f} ms "
+              f"({change:+.1%}){flag}")
+        if flag:
+            regressions.append(entry)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(SIZES), help="Benchmark only these functions")
+    parser.add_argument("--quick", action="store_true", help="Only the two smallest sizes per function")
+    parser.add_argument("--min-calls", type=int, default=20)
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'function':>18} {'size':>7} {'unit':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'calls/s':>10} "
+          f"{'units/s':>12} {'peak KiB':>10}")
+    for name, size, unit, units_per_call, func, args_list in build_cases(args.quick):
+        if args.only and name not in args.only:
+            continue
+        latencies, peak = run_case(func, args_list, args.min_calls, args.min_seconds)
+        calls_per_second = len(latencies) / latencies.sum()
+        entry = {
+            "function": name,
+            "size": size,
+            "unit": unit,
+            "calls": len(latencies),
+            "mean_ms": round(latencies.mean() * 1000, 4),
+            "p50_ms": round(np.percentile(latencies, 50) * 1000, 4),
+            "p99_ms": round(np.percentile(latencies, 99) * 1000, 4),
+            "calls_per_second": round(calls_per_second, 2),
+            "units_per_second": round(calls_per_second * units_per_call, 2),
+            "peak_kib": round(peak / 1024, 1),
+        }
+        results.append(entry)
+        print(f"{name:>18} {size:>7} {unit:>10} {entry['p50_ms']:>10.3f} {entry['p99_ms']:>10.3f} "
+              f"{entry['calls_per_second']:>10.1f} {entry['units_per_second']:>12.1f} {entry['peak_kib']:>10.1f}")
+
+    report = {"environment": environment(), "results": results}
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Parity check: count_phrase_repetitions vs the original slice-comparing loop.
+
+Random token id sequences over small alphabets (so repeated phrases are common)
+are scored with both for every max_phrase_length from 2 to --max-length. Each
+sequence is also fed to _scan_phrase_repetitions in chunks with final=False, the
+way a live transcript session resumes, and must give the same total. The script
+fails on the first difference and reports the time of both on long sequences.
+
+Usage:
+    cd demo
+    python benchmarks/check_phrase_repetitions.py --sequences 2000 --max-length 12
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from processQuest.SpeechAnalysis import _scan_phrase_repetitions, count_phrase_repetitions
+
+def legacy_phrase_repetitions(tokens, max_phrase_length):
+    """The original greedy loop (with its fixed 5 made a parameter), kept here as the reference"""
+    phrase_reps = 0
+    i = 0
+    n = len(tokens)
+    while i < n:
+        event_detected = False
+        for L in range(min(max_phrase_length, (n - i) // 2), 1, -1):
+            if tokens[i:i+L] == tokens[i+L:i+2*L]:
+                phrase_reps += 1
+                i += 2 * L
+                event_detected = True
+                break
+        if not event_detected:
+            i += 1
+    return phrase_reps
+
+def chunked_phrase_repetitions(tokens, max_phrase_length, rng):
+    """Total of a resumable scan over random chunks, as TranscriptSession does it"""
+    phrase_reps = 0
+    unscanned = np.zeros(0, dtype=np.uint64)
+    position = 0
+    while position < len(tokens):
+        size = rng.randint(1, 20)
+        unscanned = np.concatenate((unscanned, np.array(tokens[position:position + size], dtype=np.uint64)))
+        position += size
+        found, resume = _scan_phrase_repetitions(unscanned, max_phrase_length, final=False)
+        phrase_reps += found
+        unscanned = unscanned[resume:]
+    return phrase_reps + _scan_phrase_repetitions(unscanned, max_phrase_length)[0]
+
+def random_tokens(rng, length):
+    alphabet = rng.randint(2, 6)
+    tokens = [rng.randrange(alphabet) for _ in range(length)]
+    # Splice in immediately repeated phrases so longer repetitions occur too
+    for _ in range(length // 20):
+        start = rng.randrange(length) if length else 0
+        phrase = tokens[start:start + rng.randint(2, 12)]
+        tokens[start:start] = phrase
+    return tokens
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sequences", type=int, default=2000)
+    parser.add_argument("--max-tokens", type=int, default=300, help="Longest random sequence")
+    parser.add_argument("--max-length", type=int, default=12, help="Largest max_phrase_length checked")
+    parser.add_argument("--timing-tokens", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    checked = 0
+    for _ in range(args.sequences):
+        tokens = random_tokens(rng, rng.randint(0, args.max_tokens))
+        for max_phrase_length in range(2, args.max_length + 1):
+            expected = legacy_phrase_repetitions(tokens, max_phrase_length)
+            actual = count_phrase_repetitions(np.array(tokens, dtype=np.uint64), max_phrase_length)
+            chunked = chunked_phrase_repetitions(tokens, max_phrase_length, rng)
+            if not expected == actual == chunked:
+                raise SystemExit(f"Mismatch for max_phrase_length {max_phrase_length}: legacy {expected}, "
+                                 f"count_phrase_repetitions {actual}, chunked {chunked}, tokens {tokens}")
+            checked += 1
+    print(f"{checked} sequence/length pairs match (legacy loop, count_phrase_repetitions, chunked scan)")
+
+    tokens = random_tokens(rng, args.timing_tokens)
+    array = np.array(tokens, dtype=np.uint64)
+    start = time.perf_counter()
+    legacy_phrase_repetitions(tokens, 5)
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    count_phrase_repetitions(array, 5)
+    new_time = time.perf_counter() - start
+    print(f"{len(tokens)} tokens: legacy loop {legacy_time * 1000:.1f} ms, count_phrase_repetitions "
+          f"{new_time * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
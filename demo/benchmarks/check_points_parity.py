@@ -0,0 +1,97 @@
+"""
+Parity check: compute_points fast vector-table path vs the full spaCy pipeline.
+
+Scores every presented word from the Memory Vault recall sessions against a list
+of recalled words. Each pair is scored with the vector-table lookup and with
+Doc.similarity on fully parsed docs (the original implementation), and the script
+fails if any pair lands in a different 0-4 point band.
+
+Usage:
+    cd demo
+    python benchmarks/check_points_parity.py [--recalled extra words ...]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import warnings
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from memoryVault.GeneratePoints import (
+    _entry_similarity,
+    _is_single_token,
+    _pipeline_entry,
+    _points_from_similarity,
+    _vector_table_entry,
+)
+from shared.model_registry import get_pipeline
+
+RECALL_SESSIONS_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "../../react_frontend/src/pages/games/memoryVault/imports/recallSessions.js",
+)
+
+# Typical recalls: near misses, related words, misspellings, multi-word answers, OOV
+DEFAULT_RECALLED = [
+    "spoon", "fork", "bike", "bicycle", "castle", "palace", "clock", "watch", "crown", "king",
+    "apple", "fruit", "rainbow", "rain", "shark", "fish", "pencil", "pen", "notebook", "book",
+    "volcano", "mountain", "globe", "earth", "hammer", "nail", "lamp", "light", "pineapple",
+    "cannot", "dunno", "teh", "aple", "ice cream", "tea kettle", "light bulb", "", "xqzv",
+]
+
+def load_presented_words():
+    with open(RECALL_SESSIONS_PATH, "r") as f:
+        source = f.read()
+    words = re.findall(r'\b(?:word|audio|picture):\s*"([^"]+)"', source)
+    return sorted({w.lower().strip() for w in words})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recalled", nargs="*", default=[], help="Extra recalled words to check")
+    args = parser.parse_args()
+
+    presented = load_presented_words()
+    recalled = sorted({w.lower().strip() for w in DEFAULT_RECALLED + args.recalled} | set(presented))
+    full_nlp = get_pipeline("full")
+
+    words = sorted(set(presented) | set(recalled))
+    fast_entries = {}
+    start = time.perf_counter()
+    for word in words:
+        if _is_single_token(word):
+            fast_entries[word] = _vector_table_entry(word)
+        else:
+            fast_entries[word] = _pipeline_entry(word)
+    fast_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    full_docs = {word: full_nlp(word) for word in words}
+    full_time = time.perf_counter() - start
+
+    mismatches = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # W008 for words without vectors
+        for presented_word in presented:
+            for recalled_word in recalled:
+                expected = _points_from_similarity(full_docs[presented_word].similarity(full_docs[recalled_word]))
+                actual = _points_from_similarity(
+                    _entry_similarity(fast_entries[presented_word], fast_entries[recalled_word])
+                )
+                if actual != expected:
+                    mismatches.append((presented_word, recalled_word, expected, actual))
+
+    pairs = len(presented) * len(recalled)
+    fast_count = sum(1 for word in words if _is_single_token(word))
+    print(f"{pairs} pairs, {len(words)} words ({fast_count} via the vector table)")
+    print(f"Embedding time: vector table {fast_time * 1000:.1f} ms, full pipeline {full_time * 1000:.1f} ms")
+
+    if mismatches:
+        for presented_word, recalled_word, expected, actual in mismatches:
+            print(f"MISMATCH {presented_word!r} / {recalled_word!r}: pipeline {expected}, fast {actual}")
+        raise SystemExit(1)
+    print("All point bands match")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Parity check: the reversed suffix trie vs the original endswith loop.
+
+Scores random strings with _derivational_suffix_count and with the original
+sum over DERIVATIONAL_SUFFIXES of word.endswith(suffix). Most strings end in
+one or more suffixes, stacked or mixed case, and many are just longer than a
+suffix, so the len(word) > len(suffix) + 1 rule is exercised at its boundary.
+The script fails on the first difference.
+
+Usage:
+    cd demo
+    python benchmarks/check_suffix_parity.py --strings 200000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from processQuest.SpeechAnalysis import DERIVATIONAL_SUFFIXES, _derivational_suffix_count
+
+def legacy_suffix_count(word):
+    """The original endswith loop, kept here as the reference"""
+    return sum(1 for suffix in DERIVATIONAL_SUFFIXES if word.endswith(suffix) and len(word) > len(suffix) + 1)
+
+def random_word(rng, suffixes):
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'-é"
+    word = "".join(rng.choice(letters) for _ in range(rng.randint(0, 6)))
+    for _ in range(rng.choice([0, 1, 1, 2, 3])):
+        suffix = rng.choice(suffixes)
+        # Sometimes only the tail of a suffix, or with its case changed
+        if rng.random() < 0.2:
+            suffix = suffix[rng.randrange(len(suffix)):]
+        if rng.random() < 0.1:
+            suffix = suffix.upper()
+        word += suffix
+    return word
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strings", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    suffixes = sorted(DERIVATIONAL_SUFFIXES)
+    words = [random_word(rng, suffixes) for _ in range(args.strings)]
+
+    start = time.perf_counter()
+    expected = [legacy_suffix_count(word) for word in words]
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [_derivational_suffix_count(word) for word in words]
+    trie_time = time.perf_counter() - start
+
+    for word, expected_count, actual_count in zip(words, expected, actual):
+        if expected_count != actual_count:
+            raise SystemExit(f"Mismatch for {word!r}: endswith {expected_count}, trie {actual_count}")
+
+    with_suffix = sum(1 for count in expected if count)
+    print(f"{len(words)} strings match ({with_suffix} with at least one suffix, up to {max(expected)})")
+    print(f"endswith loop {legacy_time * 1000:.1f} ms, suffix trie {trie_time * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""
+Load test for the Flask API, e.g. as served by flask_api/serve.py.
+
+Concurrent clients (threads with keep-alive sessions) send a weighted mix of
+/analyze-pauses, /analyze-text, /semantic-content and /compute-points requests
+for a fixed duration and the script reports throughput and p50/p90/p99 latency
+per endpoint. Payloads cycle through --distinct synthetic inputs so the result
+cache does not answer everything after the first round.
+
+With --serve the script starts serve.py itself (the arguments are passed on),
+waits until it answers, and after the run also reports RSS and PSS of the
+master and its workers: PSS counts shared pages once per sharer, so a total
+PSS well below the total RSS shows the preloaded model is shared copy-on-write.
+
+Usage:
+    cd demo
+    python benchmarks/load_test.py --serve "--workers 4 --threads 4" --concurrency 16 --duration 30
+    python benchmarks/load_test.py --url http://127.0.0.1:5000 --mix analyze_pauses=1
+"""
+import argparse
+import os
+import random
+import shlex
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic import synthetic_transcribe_json, synthetic_transcript, synthetic_word_bank
+
+SERVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "flask_api", "serve.py")
+
+# Endpoint -> (path, payload builder for input number i)
+ENDPOINTS = {
+    "analyze_pauses": ("/analyze-pauses", lambda i: {"full_transcription": synthetic_transcribe_json(400, seed=i)}),
+    "analyze_text": ("/analyze-text", lambda i: {
+        "transcript": synthetic_transcript(150, seed=i), "audio_segments": [{"end_time": "60"}]}),
+    "semantic_content": ("/semantic-content", lambda i: {
+        "transcript": synthetic_transcript(150, seed=i), "word_bank": synthetic_word_bank(20, seed=i % 5),
+        "audio_segments": [{"end_time": "60"}]}),
+    "compute_points": ("/compute-points", lambda i: {
+        "presented_word": synthetic_word_bank(1, seed=i)[0], "recalled_word": synthetic_word_bank(1, seed=i + 1)[0]}),
+}
+DEFAULT_MIX = "analyze_pauses=4,analyze_text=3,semantic_content=2,compute_points=1"
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}' (choose from {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+def memory_kb(pid):
+    """(RSS, PSS) of a process in KB from /proc (Linux only)"""
+    values = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    values[key] = int(rest.split()[0])
+    except OSError:
+        return None
+    return values.get("Rss"), values.get("Pss")
+
+def child_pids(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+def start_server(serve_args, url):
+    command = [sys.executable, SERVE_PATH, "--bind", url.split("://", 1)[-1]] + shlex.split(serve_args)
+    # The mix never uses /jobs or transcript sessions, so they are turned off to allow --workers above 1
+    env = dict(os.environ, STATEFUL_ENDPOINTS="0")
+    process = subprocess.Popen(command, cwd=os.path.dirname(SERVE_PATH), env=env)
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"serve.py exited with code {process.returncode}")
+        try:
+            requests.get(f"{url}/api/subsystems", timeout=1)
+            return process
+        except requests.RequestException:
+            time.sleep(0.5)
+    process.terminate()
+    raise SystemExit("serve.py did not start within 300s")
+
+def client(url, plan, payloads, stop_at, results, seed):
+    """One simulated client: send requests back to back until stop_at"""
+    rng = random.Random(seed)
+    names, weights = zip(*plan.items())
+    session = requests.Session()
+    while time.perf_counter() < stop_at:
+        name = rng.choices(names, weights)[0]
+        path, _ = ENDPOINTS[name]
+        payload = rng.choice(payloads[name])
+        start = time.perf_counter()
+        try:
+            status = session.post(f"{url}{path}", json=payload, timeout=120).status_code
+        except requests.RequestException:
+            status = "error"
+        results.append((name, status, time.perf_counter() - start))
+
+def report(results, elapsed):
+    print(f"\n{'endpoint':>18} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 (ms)':>9} {'p90 (ms)':>9} "
+          f"{'p99 (ms)':>9} {'max (ms)':>9}")
+    for name in sorted({entry[0] for entry in results}) + ["all"]:
+        entries = [entry for entry in results if name == "all" or entry[0] == name]
+        latencies = np.array([entry[2] for entry in entries]) * 1000
+        errors = sum(1 for entry in entries if entry[1] != 200)
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        print(f"{name:>18} {len(entries):>9} {errors:>7} {len(entries) / elapsed:>8.1f} {p50:>9.1f} {p90:>9.1f} "
+              f"{p99:>9.1f} {latencies.max():>9.1f}")
+
+    statuses = {}
+    for entry in results:
+        statuses[entry[1]] = statuses.get(entry[1], 0) + 1
+    print("Status codes: " + ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items(), key=str)))
+
+def report_memory(master_pid):
+    pids = [master_pid] + child_pids(master_pid)
+    rows = [(pid, memory_kb(pid)) for pid in pids]
+    rows = [(pid, usage) for pid, usage in rows if usage is not None]
+    if not rows:
+        return
+    print(f"\n{'pid':>8} {'role':>7} {'RSS MB':>9} {'PSS MB':>9}")
+    for pid, (rss, pss) in rows:
+        print(f"{pid:>8} {'master' if pid == master_pid else 'worker':>7} {rss / 1024:>9.1f} {pss / 1024:>9.1f}")
+    total_rss = sum(usage[0] for _, usage in rows) / 1024
+    total_pss = sum(usage[1] for _, usage in rows) / 1024
+    print(f"{'total':>16} {total_rss:>9.1f} {total_pss:>9.1f}  ({1 - total_pss / total_rss:.0%} of RSS shared)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--serve", metavar="ARGS", help="Start flask_api/serve.py with these arguments first")
+    parser.add_argument("--concurrency", type=int, default=8, help="Simultaneous clients")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load after the warm-up")
+    parser.add_argument("--warm-up", type=float, default=3.0, help="Seconds of load not counted in the results")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Endpoint weights (default {DEFAULT_MIX})")
+    parser.add_argument("--distinct", type=int, default=200, help="Distinct payloads per endpoint")
+    args = parser.parse_args()
+
+    payloads = {name: [ENDPOINTS[name][1](i) for i in range(args.distinct)] for name in args.mix}
+    server = start_server(args.serve, args.url) if args.serve is not None else None
+    try:
+        if args.warm_up > 0:
+            warm_up_results = []
+            stop_at = time.perf_counter() + args.warm_up
+            threads = [threading.Thread(target=client, args=(args.url, args.mix, payloads, stop_at, warm_up_results, -i))
+                       for i in range(1, args.concurrency + 1)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        results = []
+        start = time.perf_counter()
+        stop_at = start + args.duration
+        threads = [threading.Thread(target=client, args=(args.url, args.mix, payloads, stop_at, results, i))
+                   for i in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"{args.concurrency} clients, {elapsed:.1f}s, {len(results)} requests against {args.url}")
+        if results:
+            report(results, elapsed)
+        if server is not None:
+            report_memory(server.pid)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=60)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+Synthetic inputs shared by the benchmark scripts.
+
+Transcripts imitate a Process Quest picture description (Cookie Theft style):
+short sentences, fillers, immediate and phrase repetitions, and a few
+subordinate clauses, so every branch of analyze_text is exercised.
+"""
+import random
+import numpy as np
+
+SUBJECTS = ["the boy", "the girl", "the mother", "she", "he", "the little boy", "the woman", "they"]
+VERBS = ["is reaching for", "is washing", "was taking", "is standing on", "dropped", "is looking at",
+         "is drying", "spilled", "wants", "is falling off"]
+OBJECTS = ["the cookie jar", "the dishes", "the stool", "the cookies", "the plate", "the window",
+           "the water", "the sink", "the curtains", "the cupboard", "a cup", "the kitchen floor"]
+ADVERBIALS = ["quickly", "carefully", "outside", "in the kitchen", "right now", "again", "happily"]
+CLAUSES = ["because the water is overflowing", "while the mother is not looking", "when the stool tips",
+           "that she is drying", "which is on the shelf", "if he is not careful", "although it is sunny"]
+FILLERS = ["um", "uh", "well", "oh", "hmm"]
+
+# Frequent English nouns, used for word banks of graded size
+BANK_WORDS = [
+    "boy", "girl", "mother", "woman", "cookie", "jar", "stool", "sink", "water", "dish", "plate",
+    "window", "curtain", "cupboard", "cup", "kitchen", "floor", "shelf", "garden", "tree", "grass",
+    "house", "door", "wall", "table", "chair", "towel", "apron", "faucet", "bowl", "spoon", "knife",
+    "fork", "glass", "bottle", "basket", "bread", "milk", "sugar", "cake", "apple", "banana", "orange",
+    "lemon", "carrot", "potato", "tomato", "onion", "egg", "cheese", "butter", "soup", "rice", "meat",
+    "fish", "chicken", "dog", "cat", "bird", "horse", "cow", "sheep", "pig", "mouse", "rabbit", "duck",
+    "car", "bus", "train", "bicycle", "boat", "plane", "road", "street", "bridge", "river", "lake",
+    "sea", "beach", "mountain", "hill", "forest", "field", "farm", "city", "town", "village", "school",
+    "teacher", "student", "book", "pencil", "paper", "desk", "clock", "lamp", "bed", "pillow", "blanket",
+    "shirt", "shoe", "hat", "coat", "dress", "sock", "glove", "bag", "box", "key", "phone", "picture",
+    "camera", "television", "radio", "computer", "music", "song", "game", "ball", "toy", "doll", "kite",
+    "sun", "moon", "star", "cloud", "rain", "snow", "wind", "storm", "sky", "fire", "smoke", "light",
+    "morning", "evening", "night", "day", "week", "summer", "winter", "spring", "autumn", "flower",
+    "leaf", "rose", "seed", "stone", "sand", "mud", "ice", "salt", "pepper", "honey", "tea", "coffee",
+    "juice", "wine", "money", "coin", "letter", "card", "gift", "party", "friend", "family", "baby",
+    "father", "brother", "sister", "uncle", "aunt", "doctor", "nurse", "hospital", "church", "market",
+]
+
+def synthetic_transcript(n_tokens, seed=0):
+    """Picture-description style transcript of roughly n_tokens words"""
+    rng = random.Random(seed)
+    words = []
+    while len(words) < n_tokens:
+        sentence = []
+        if rng.random() < 0.3:
+            sentence.append(rng.choice(FILLERS))
+        subject = rng.choice(SUBJECTS)
+        sentence.append(subject)
+        if rng.random() < 0.1:
+            sentence.append(subject)  # phrase repetition
+        verb = rng.choice(VERBS)
+        sentence.append(verb)
+        sentence.append(rng.choice(OBJECTS))
+        if rng.random() < 0.4:
+            sentence.append(rng.choice(ADVERBIALS))
+        if rng.random() < 0.3:
+            sentence.append(rng.choice(CLAUSES))
+        text = " ".join(sentence).split()
+        if rng.random() < 0.15:
+            i = rng.randrange(len(text))
+            text.insert(i, text[i])  # immediate repetition
+        text[0] = text[0].capitalize()
+        text[-1] += rng.choice([".", ".", ".", "?", "!"])
+        words.extend(text)
+    return " ".join(words[:n_tokens])
+
+def synthetic_word_bank(size, seed=0):
+    """
+    Word bank of the given size drawn from BANK_WORDS.
+
+    Banks larger than BANK_WORDS are padded with numbered variants ("boy1"),
+    which have no vectors, like misspelled or rare bank entries.
+    """
+    rng = random.Random(seed)
+    bank = rng.sample(BANK_WORDS, min(size, len(BANK_WORDS)))
+    for i in range(len(bank), size):
+        bank.append(f"{BANK_WORDS[i % len(BANK_WORDS)]}{i // len(BANK_WORDS)}")
+    return bank
+
+def synthetic_transcribe_json(n_items, seed=0, pause_rate=0.1):
+    """
+    AWS Transcribe style JSON with roughly n_items entries in results.items.
+
+    Words from synthetic_transcript become "pronunciation" items with string
+    start/end times; trailing punctuation becomes a "punctuation" item without
+    timing. About pause_rate of the gaps between words are pauses of 0.5-3 s.
+    """
+    rng = random.Random(seed)
+    items = []
+    time = 0.0
+    for word in synthetic_transcript(n_items, seed).split():
+        if len(items) >= n_items:
+            break
+        time += rng.uniform(0.5, 3.0) if rng.random() < pause_rate else rng.uniform(0.0, 0.2)
+        end = time + rng.uniform(0.1, 0.6)
+        content = word.rstrip(".?!")
+        items.append({
+            "start_time": f"{time:.3f}",
+            "end_time": f"{end:.3f}",
+            "alternatives": [{"confidence": f"{rng.uniform(0.6, 1.0):.4f}", "content": content}],
+            "type": "pronunciation",
+        })
+        time = end
+        if content != word and len(items) < n_items:
+            items.append({"alternatives": [{"confidence": "0.0", "content": word[-1]}], "type": "punctuation"})
+
+    transcript = " ".join(item["alternatives"][0]["content"] for item in items)
+    return {
+        "jobName": f"synthetic-{n_items}-{seed}",
+        "results": {"transcripts": [{"transcript": transcript}], "items": items},
+        "status": "COMPLETED",
+    }
+
+SACCADE_TRIAL_TYPES = [("prosaccade", "gap"), ("prosaccade", "overlap"), ("antisaccade", "gap"), ("antisaccade", "overlap")]
+
+def synthetic_gaze_results(n_trials, gaze_points, seed=0):
+    """
+    A /api/natures-gaze/results response as natures_gaze_api builds it.
+
+    raw_results imitates processed_trial_data_with_gaze.json: every trial has
+    gaze_points gaze samples whose timestamps are NumPy floats, as written by
+    Saccade_Fixation.py, followed by the summary metrics strings.
+    """
+    rng = random.Random(seed)
+    raw_results = {}
+    time = 0.0
+    for trial in range(1, n_trials + 1):
+        task_type, game_type = SACCADE_TRIAL_TYPES[(trial - 1) % len(SACCADE_TRIAL_TYPES)]
+        start = time + rng.uniform(0.5, 1.5)
+        onset = start + rng.uniform(0.8, 1.2)
+        end = onset + rng.uniform(1.0, 2.0)
+        time = end
+        raw_results[str(trial)] = {
+            "task_type": task_type,
+            "game_type": game_type,
+            "target_position": [rng.choice([200, 1720]), 540],
+            "trial_start_time": start,
+            "stimulus_onset_time": onset,
+            "trial_end_time": end,
+            "gaze_data": [{
+                "timestamp": timestamp,
+                "vector_x": rng.uniform(-1, 1),
+                "vector_y": rng.uniform(-1, 1),
+                "vector_z": rng.uniform(-1, 1),
+                "gaze_pitch": rng.uniform(-30, 30),
+                "gaze_yaw": rng.uniform(-30, 30),
+                "roll": rng.uniform(-30, 30),
+                "pitch": rng.uniform(-30, 30),
+                "yaw": rng.uniform(-30, 30),
+                "distance": rng.uniform(40, 70),
+            } for timestamp in np.linspace(start, end, gaze_points)],
+        }
+    raw_results["summary"] = {f"{task_type}-{game_type}": {
+        "Total_number_of_trials": f"{n_trials / len(SACCADE_TRIAL_TYPES):.3f}",
+        "saccade_omission_percentage (%)": "0.000",
+        "average_reaction_time (ms)": f"{rng.uniform(150, 350):.3f}",
+        "average_saccade_duration (ms)": f"{rng.uniform(20, 100):.3f}",
+        "saccade_error_percentage (%)": f"{rng.uniform(0, 20):.3f}",
+        "average_fixation_duration (ms)": f"{rng.uniform(200, 500):.3f}",
+    } for task_type, game_type in SACCADE_TRIAL_TYPES}
+
+    metrics = {f"{task_type}-{game_type}": [] for task_type, game_type in SACCADE_TRIAL_TYPES}
+    for trial_num, trial in raw_results.items():
+        if trial_num != "summary":
+            metrics[f"{trial['task_type']}-{trial['game_type']}"].append({
+                "trial_num": trial_num,
+                "target_position": trial["target_position"],
+                "start_time": trial["trial_start_time"],
+                "end_time": trial["trial_end_time"],
+            })
+    return {
+        "success": True,
+        "message": "Game results retrieved successfully",
+        "status": "completed",
+        "metrics": metrics,
+        "summary": raw_results["summary"],
+        "raw_results": raw_results,
+        "trials": dict(metrics),
+    }
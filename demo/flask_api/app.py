@@ -1,8 +1,8 @@
 from flask import Flask, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
-import pandas as pd
 import sys
 import os
+import io
 import subprocess
 import threading
 import time
@@ -10,110 +10,603 @@ import json
 import csv
 import numpy as np
 from pathlib import Path
+from concurrent.futures.process import BrokenProcessPool
 
 # Add  parent directory of flask_api ("demo") to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from memoryVault.GeneratePoints import compute_points
-from processQuest.SpeechAnalysis import (
-    analyze_text,
-    analyze_semantic_content_with_word_bank,
+from memoryVault.GeneratePoints import get_cache_stats as get_points_cache_stats
+from processQuest.pause_analysis import (
     analyze_pauses,
+    analyze_pauses_stream,
+    analyze_speech_timing,
+    analyze_speech_timing_stream,
+    MAX_PAUSE_THRESHOLDS,
+    PAUSE_THRESHOLDS,
+    SPEECH_RATE_WINDOW,
+    ijson,
 )
-
-# Import gaze calibration functions
-from gazeCalibration.gaze_calibration_api import (
-    start_gaze_tracking,
-    stop_gaze_tracking,
-    collect_calibration_point,
-    check_calibration_status,
-    get_calibration_results
-)
-
-# Import Saccade Fixation functions (Nature's Gaze Game)
-from gazeCalibration.natures_gaze_api import (
-    start_saccade_game,
-    get_saccade_game_status,
-    get_saccade_game_results
+from shared.lazy_loader import lazy_module, lazy_subsystem, warm_up, get_subsystem_stats
+from shared.model_registry import get_nlp, get_registry_stats, get_model_version
+from shared.stage_metrics import get_stage_metrics, stage_metrics
+from shared.result_cache import ResultCache
+from shared.worker_pool import WorkerPool, PoolBusy, JobTimeout
+from shared.job_manager import JobManager
+from shared.json_response import use_serializer, compress_response
+from flask_api.nlp_jobs import (
+    init_worker,
+    load_lexicon_index,
+    analyze_text_job,
+    analyze_text_batch_job,
+    semantic_content_job,
+    semantic_content_batch_job,
+    session_parse_job,
+    compute_points_job,
+    compute_points_bulk_job,
 )
 
 app = Flask(__name__)
 CORS(app) # Allows React app to communicate with this API
 
-# Load SUBTLEXus dataset at startup
+# jsonify() serializes with JSON_SERIALIZER ("orjson" when installed, or "json"), NumPy values included.
+# JSON responses of at least RESPONSE_COMPRESS_MIN_BYTES are compressed with the first of
+# RESPONSE_ENCODINGS the client accepts (empty = never compress).
+JSON_SERIALIZER = use_serializer(app, os.environ.get("JSON_SERIALIZER", "orjson"))
+RESPONSE_ENCODINGS = [name.strip() for name in os.environ.get("RESPONSE_ENCODINGS", "br,gzip").split(",") if name.strip()]
+if set(RESPONSE_ENCODINGS) - {"br", "gzip"}:
+    raise ValueError(f"Unknown RESPONSE_ENCODINGS: {', '.join(sorted(set(RESPONSE_ENCODINGS) - {'br', 'gzip'}))}")
+RESPONSE_COMPRESS_MIN_BYTES = int(os.environ.get("RESPONSE_COMPRESS_MIN_BYTES", 1024))
+
 # Define the path relative to the app.py location
 base_path = os.path.dirname(os.path.abspath(__file__))  # Get the directory of the current file
 subtlexus_path = os.path.join(base_path, '../processQuest/SUBTLEXusExcel2007.xlsx')  # Navigate to the file
-subtlexus_df = pd.read_excel(subtlexus_path)
-subtlexus_df.columns = ['Word', 'FREQcount', 'CDcount', 'FREQlow', 'Cdlow', 'SUBTLWF', 'Lg10WF', 'SUBTLCD', 'Lg10CD']
+
+# Heavy dependencies load the first time an endpoint group needs them, so a process that only
+# serves e.g. /analyze-pauses never imports spaCy, pycaret or the lexicon. See /api/warm-up.
+speech_analysis = lazy_module("speech_analysis", "processQuest.SpeechAnalysis")  # imports spaCy
+text_sessions = lazy_module("text_sessions", "processQuest.transcript_sessions")
+gaze_calibration = lazy_module("gaze_calibration", "gazeCalibration.gaze_calibration_api")  # pycaret, sklearn
+natures_gaze = lazy_module("natures_gaze", "gazeCalibration.natures_gaze_api")
+
+def _lexicon_version():
+    """SHA-256 of the SUBTLEXus spreadsheet for cache keys, read without loading the lexicon"""
+    from processQuest.lexicon_cache import source_sha256
+    return source_sha256(subtlexus_path)
+
+# SUBTLEXus lowercased word -> SUBTLWF index, the same object the inline NLP jobs use
+lexicon = lazy_subsystem("lexicon", lambda: load_lexicon_index(subtlexus_path))
+lexicon_version = lazy_subsystem("lexicon_version", _lexicon_version)
+spacy_model = lazy_subsystem("spacy_model", get_nlp)
+
+# Cache of /analyze-text and /semantic-content results; set RESULT_CACHE_DB to keep them across restarts.
+# Bump RESULT_CACHE_VERSION whenever the analysis output changes.
+RESULT_CACHE_VERSION = 1
+result_cache = ResultCache(
+    maxsize=int(os.environ.get("RESULT_CACHE_SIZE", 1024)),
+    ttl_seconds=float(os.environ.get("RESULT_CACHE_TTL", 24 * 60 * 60)),
+    db_path=os.environ.get("RESULT_CACHE_DB") or None,
+)
+
+# Word bank similarity threshold for /semantic-content
+SIMILARITY_THRESHOLD = 0.5
+
+# spaCy jobs run on NLP_WORKERS processes that each load the model once (0 = on the request thread).
+# At most NLP_QUEUE_SIZE further jobs wait for a worker; beyond that requests get a 503.
+nlp_pool = WorkerPool(
+    workers=int(os.environ.get("NLP_WORKERS", 0)),
+    max_queue=int(os.environ.get("NLP_QUEUE_SIZE", 32)),
+    timeout=float(os.environ.get("NLP_JOB_TIMEOUT", 60)),
+    initializer=init_worker,
+    initargs=(subtlexus_path,),
+)
+
+# Most spaCy processes one batch request may ask for (each one holds a full copy of the model)
+NLP_BATCH_MAX_PROCESSES = int(os.environ.get("NLP_BATCH_MAX_PROCESSES", 1))
+
+# Background analyses for long recordings (/jobs endpoints), sharing the pool and result cache
+job_manager = JobManager(nlp_pool, result_cache)
+
+# /jobs and /analyze-text/sessions keep their state in this process's memory, so a request that
+# reaches another server process would not find it. STATEFUL_ENDPOINTS=0 turns them off (404),
+# which serve.py requires for more than one worker process.
+STATEFUL_ENDPOINTS = os.environ.get("STATEFUL_ENDPOINTS", "1") != "0"
+STATEFUL_VIEWS = {
+    'create_text_session', 'add_text_session_chunk', 'get_text_session', 'delete_text_session',
+    'submit_analyze_text_job', 'submit_semantic_content_job', 'get_job_status', 'get_job_result', 'job_stats',
+}
+
+# Starts the NLP worker processes (or loads the model inline when NLP_WORKERS is 0)
+nlp_workers = lazy_subsystem("nlp_workers", nlp_pool.warm_up)
+
+# Subsystems `python app.py` loads in the background right after startup: "all" or comma-separated
+# names. serve.py preloads its own list in the gunicorn master instead.
+APP_WARM_UP = os.environ.get("APP_WARM_UP", "")
+warm_up_names = None if APP_WARM_UP == "all" else [name.strip() for name in APP_WARM_UP.split(",") if name.strip()]
+unknown_names = sorted(set(warm_up_names or []) - set(get_subsystem_stats()))
+if unknown_names:
+    raise ValueError(f"Unknown APP_WARM_UP subsystems: {', '.join(unknown_names)}")
+
+def start_warm_up():
+    """Load the APP_WARM_UP subsystems on a background thread"""
+    if APP_WARM_UP:
+        threading.Thread(target=warm_up, args=(warm_up_names,), daemon=True).start()
+
+@app.before_request
+def reject_disabled_endpoints():
+    if not STATEFUL_ENDPOINTS and request.endpoint in STATEFUL_VIEWS:
+        return jsonify({'error': 'Jobs and transcript sessions are disabled on this server (STATEFUL_ENDPOINTS=0)'}), 404
+
+@app.after_request
+def compress_json_response(response):
+    return compress_response(response, request.headers.get('Accept-Encoding', ''),
+                             RESPONSE_ENCODINGS, RESPONSE_COMPRESS_MIN_BYTES)
+
+@app.errorhandler(PoolBusy)
+def nlp_pool_busy(e):
+    return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
+
+@app.errorhandler(JobTimeout)
+def nlp_job_timeout(e):
+    return jsonify({'error': str(e)}), 504
+
+@app.errorhandler(BrokenProcessPool)
+def nlp_workers_restarted(e):
+    # A worker died, or the workers were restarted to stop another request's timed-out job
+    return jsonify({'error': 'NLP workers were restarted, please retry'}), 503, {'Retry-After': '1'}
+
+# With NLP_WORKERS > 0 the NLP caches live in the workers: each one's counters as of its latest job
+worker_cache_stats = {}
+worker_cache_stats_lock = threading.Lock()
+
+def _record_cache_stats(stats):
+    stats['reported_at'] = time.time()
+    with worker_cache_stats_lock:
+        worker_cache_stats[stats.pop('pid')] = stats
+
+def _traced(operation, output):
+    """Record the stage timings and cache counters returned by an nlp_jobs analysis job; returns (result, timings)"""
+    result, trace, cache_stats = output
+    stage_metrics.record(operation, trace)
+    _record_cache_stats(cache_stats)
+    return result, trace
+
+def _untraced(output):
+    """Record the cache counters returned by an nlp_jobs job without stage timings; returns its result"""
+    result, cache_stats = output
+    _record_cache_stats(cache_stats)
+    return result
+
+def _debug_requested(data):
+    """Clients can ask for per-stage timings in a 'debug' field of the response"""
+    return bool(data.get('debug')) or request.args.get('debug') == '1'
+
+def _result_key(kind, params):
+    """Hash of an analysis' inputs and the model version, for the result cache and job deduplication"""
+    return result_cache.make_key(kind, RESULT_CACHE_VERSION, get_model_version(), params)
 
 @app.route('/compute-points', methods=['POST'])
 def compute_points_endpoint():
     data = request.get_json()
     presented_word = data.get('presented_word')
     recalled_word = data.get('recalled_word')
+    hint_used = bool(data.get('hint_used', False))
     if not presented_word or not recalled_word:
         return jsonify({'error': 'Missing parameters'}), 400
 
-    points = compute_points(presented_word, recalled_word)
+    points = _untraced(nlp_pool.run(compute_points_job, presented_word, recalled_word, hint_used))
     return jsonify({'points': points})
 
-@app.route('/analyze-text', methods=['POST'])
-def analyze_text_endpoint():
-    data = request.get_json()
+# Most presented/recalled pairs one /compute-points/bulk request may score
+MAX_BULK_RECORDS = int(os.environ.get("MAX_BULK_RECORDS", 1000))
 
+@app.route('/compute-points/bulk', methods=['POST'])
+def compute_points_bulk_endpoint():
+    """Score every presented/recalled pair of a Memory Vault session"""
+    data = request.get_json()
+    records = data.get('records')
+    if not records or not isinstance(records, list):
+        return jsonify({'error': 'Missing records'}), 400
+    if len(records) > MAX_BULK_RECORDS:
+        return jsonify({'error': f'Too many records (at most {MAX_BULK_RECORDS})'}), 400
+
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            return jsonify({'error': f'Invalid record at index {i}'}), 400
+        presented_word = record.get('presented')
+        recalled_word = record.get('recalled')
+        if not isinstance(presented_word, str) or not isinstance(recalled_word, str) \
+                or not presented_word or not recalled_word:
+            return jsonify({'error': f'Missing parameters at index {i}'}), 400
+
+    # Only the fields compute_points_bulk reads are sent to the worker
+    records = [{'presented': record['presented'], 'recalled': record['recalled'],
+                'hint_used': bool(record.get('hint_used', False))} for record in records]
+    return jsonify(_untraced(nlp_pool.run(compute_points_bulk_job, records)))
+
+def _analyze_text_request(data):
+    """Validate an /analyze-text body; returns (text, max_phrase_length, speech_duration_minutes)"""
     text = data.get('transcript')
     if not text:
-        return jsonify({'error': 'Missing transcript'}), 400
+        raise ValueError('Missing transcript')
 
     audio_segments = data.get('audio_segments')
     speech_duration_minutes = None
-    words_per_minute = None
 
     if audio_segments:
         try:
             speech_duration_minutes = float(audio_segments[-1]['end_time']) / 60
         except (KeyError, ValueError, TypeError) as e:
-            return jsonify({'error': f'Invalid audio segment data: {str(e)}'}), 400
+            raise ValueError(f'Invalid audio segment data: {str(e)}')
+
+    try:
+        max_phrase_length = _max_phrase_length(data)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f'Invalid max_phrase_length: {str(e)}')
+
+    return text, max_phrase_length, speech_duration_minutes
 
-    results = analyze_text(text, subtlexus_df)
+def _analyze_text_key(text, max_phrase_length):
+    return _result_key('analyze-text', [text, max_phrase_length, lexicon_version.get()])
 
+def _add_speech_rate(results, speech_duration_minutes):
+    """Add speech duration and words per minute to analyze_text results"""
     if speech_duration_minutes:
         total_words = results.get('Total Tokens', 0)
         words_per_minute = total_words / speech_duration_minutes
         results['Speech Duration'] = round(speech_duration_minutes, 2)
         results['Words per Minute'] = round(words_per_minute, 2)
+    return results
+
+@app.route('/analyze-text', methods=['POST'])
+def analyze_text_endpoint():
+    data = request.get_json()
+
+    try:
+        text, max_phrase_length, speech_duration_minutes = _analyze_text_request(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    trace = None
+
+    def compute():
+        nonlocal trace
+        result, trace = _traced('analyze_text', nlp_pool.run(analyze_text_job, text, max_phrase_length))
+        return result
+
+    results = _add_speech_rate(
+        result_cache.get_or_compute(_analyze_text_key(text, max_phrase_length), compute),
+        speech_duration_minutes,
+    )
+    if _debug_requested(data):
+        results['debug'] = {'cached': trace is None, 'timings': trace}
 
     return jsonify(results)
 
-@app.route('/semantic-content', methods=['POST'])
-def semantic_content_endpoint():
+def _parse_session_text(text, final):
+    """Transcript session parsing on the NLP worker pool, like the other spaCy endpoints"""
+    return _traced('transcript_session', nlp_pool.run(session_parse_job, text, final))[0]
+
+@app.route('/analyze-text/sessions', methods=['POST'])
+def create_text_session():
+    """Start an incremental analysis session for a live transcript"""
+    data = request.get_json(silent=True) or {}
+    try:
+        max_phrase_length = _max_phrase_length(data)
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': f'Invalid max_phrase_length: {str(e)}'}), 400
+
+    lexicon_index = lexicon.get()
+    sessions = text_sessions.get()
+    try:
+        session_id = sessions.create_session(lexicon_index, max_phrase_length, _parse_session_text)
+    except sessions.TooManySessions as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '60'}
+    return jsonify({'session_id': session_id}), 201
+
+@app.route('/analyze-text/sessions/<session_id>/chunks', methods=['POST'])
+def add_text_session_chunk(session_id):
+    """Append an ASR transcript chunk and return the updated analysis"""
+    session = text_sessions.get().get_session(session_id)
+    if session is None:
+        return jsonify({'error': 'Unknown session'}), 404
+
     data = request.get_json()
-    
+    text = data.get('text')
+    if not isinstance(text, str):
+        return jsonify({'error': 'Missing text'}), 400
+
+    try:
+        session.add_chunk(text, final=bool(data.get('final', False)))
+    except text_sessions.get().ChunkTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    return jsonify(session.snapshot())
+
+@app.route('/analyze-text/sessions/<session_id>', methods=['GET'])
+def get_text_session(session_id):
+    """Current analysis of everything received so far"""
+    session = text_sessions.get().get_session(session_id)
+    if session is None:
+        return jsonify({'error': 'Unknown session'}), 404
+    return jsonify(session.snapshot())
+
+@app.route('/analyze-text/sessions/<session_id>', methods=['DELETE'])
+def delete_text_session(session_id):
+    """End a session and return its final analysis"""
+    session = text_sessions.get().close_session(session_id)
+    if session is None:
+        return jsonify({'error': 'Unknown session'}), 404
+    return jsonify(session.snapshot())
+
+def _semantic_content_request(data):
+    """Validate a /semantic-content body; returns (text, word_bank, speech_duration)"""
     text = data.get('transcript')
     if not text:
-        return jsonify({'error': 'Missing transcript'}), 400
+        raise ValueError('Missing transcript')
 
     word_bank = data.get('word_bank', [])
     if not isinstance(word_bank, list):
-        return jsonify({'error': 'Word bank must be a list'}), 400
+        raise ValueError('Word bank must be a list')
 
-    try:
-        audio_segments = data.get('audio_segments')
-        if not audio_segments:
-            return jsonify({'error': 'Missing audio segment data'}), 400
+    audio_segments = data.get('audio_segments')
+    if not audio_segments:
+        raise ValueError('Missing audio segment data')
 
+    try:
         # assuming the last segment's end_time represents total speech duration
         speech_duration = float(audio_segments[-1]['end_time'])
     except (KeyError, ValueError, TypeError) as e:
-        return jsonify({'error': f'Invalid speech duration: {str(e)}'}), 400
+        raise ValueError(f'Invalid speech duration: {str(e)}')
+
+    return text, word_bank, speech_duration
+
+def _semantic_content_key(text, word_bank, speech_duration):
+    return _result_key('semantic-content', [text, word_bank, speech_duration, SIMILARITY_THRESHOLD])
+
+@app.route('/semantic-content', methods=['POST'])
+def semantic_content_endpoint():
+    data = request.get_json()
+
+    try:
+        text, word_bank, speech_duration = _semantic_content_request(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
-    results = analyze_semantic_content_with_word_bank(text, word_bank, speech_duration)
+    trace = None
+
+    def compute():
+        nonlocal trace
+        result, trace = _traced(
+            'semantic_content',
+            nlp_pool.run(semantic_content_job, text, word_bank, speech_duration, SIMILARITY_THRESHOLD),
+        )
+        return result
+
+    results = result_cache.get_or_compute(_semantic_content_key(text, word_bank, speech_duration), compute)
+    if _debug_requested(data):
+        results['debug'] = {'cached': trace is None, 'timings': trace}
 
     return jsonify(results)
 
+# Longest phrase repetition clients may ask for. The scan costs O(tokens * max_phrase_length), and a
+# live session keeps the last ~2 * max_phrase_length tokens unscanned until more text arrives.
+MAX_PHRASE_LENGTH_LIMIT = 50
+
+def _max_phrase_length(data):
+    """Read the optional phrase repetition length for the analyze-text endpoints"""
+    max_phrase_length = int(data.get('max_phrase_length', speech_analysis.get().MAX_PHRASE_LENGTH))
+    if not 2 <= max_phrase_length <= MAX_PHRASE_LENGTH_LIMIT:
+        raise ValueError(f'max_phrase_length must be between 2 and {MAX_PHRASE_LENGTH_LIMIT}')
+    return max_phrase_length
+
+# Most transcripts one batch request may carry. A batch runs as a single pool job under NLP_JOB_TIMEOUT,
+# and a timeout restarts every worker, so whole cohorts go through processQuest/batch_rescore.py instead.
+MAX_BATCH_TRANSCRIPTS = int(os.environ.get("MAX_BATCH_TRANSCRIPTS", 100))
+
+def _batch_items(data):
+    """The transcripts list of a batch request body"""
+    items = data.get('transcripts')
+    if not items or not isinstance(items, list):
+        raise ValueError('Missing transcripts')
+    if len(items) > MAX_BATCH_TRANSCRIPTS:
+        raise ValueError(f'Too many transcripts (at most {MAX_BATCH_TRANSCRIPTS}); '
+                         'rescore larger cohorts offline with processQuest/batch_rescore.py')
+    return items
+
+def _batch_options(data):
+    """Read nlp.pipe options for the batch endpoints"""
+    batch_size = int(data.get('batch_size', speech_analysis.get().DEFAULT_BATCH_SIZE))
+    n_process = int(data.get('n_process', 1))
+    if batch_size < 1 or n_process < 1:
+        raise ValueError('batch_size and n_process must be positive integers')
+    if n_process > NLP_BATCH_MAX_PROCESSES:
+        raise ValueError(f'n_process must be at most {NLP_BATCH_MAX_PROCESSES}')
+    return batch_size, n_process
+
+@app.route('/analyze-text/batch', methods=['POST'])
+def analyze_text_batch_endpoint():
+    """Analyze a list of transcripts in one nlp.pipe pass"""
+    data = request.get_json()
+
+    try:
+        items = _batch_items(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        batch_size, n_process = _batch_options(data)
+        max_phrase_length = _max_phrase_length(data)
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': f'Invalid batch options: {str(e)}'}), 400
+
+    texts = []
+    durations = []
+    for i, item in enumerate(items):
+        text = item.get('transcript') if isinstance(item, dict) else None
+        if not text:
+            return jsonify({'error': f'Missing transcript at index {i}'}), 400
+        if not isinstance(text, str):
+            return jsonify({'error': f'Transcript must be a string at index {i}'}), 400
+
+        speech_duration_minutes = None
+        audio_segments = item.get('audio_segments')
+        if audio_segments:
+            try:
+                speech_duration_minutes = float(audio_segments[-1]['end_time']) / 60
+            except (KeyError, ValueError, TypeError) as e:
+                return jsonify({'error': f'Invalid audio segment data at index {i}: {str(e)}'}), 400
+
+        texts.append(text)
+        durations.append(speech_duration_minutes)
+
+    results, _ = _traced('analyze_text_batch',
+                         nlp_pool.run(analyze_text_batch_job, texts, max_phrase_length, batch_size, n_process))
+
+    for result, speech_duration_minutes in zip(results, durations):
+        if speech_duration_minutes:
+            total_words = result.get('Total Tokens', 0)
+            result['Speech Duration'] = round(speech_duration_minutes, 2)
+            result['Words per Minute'] = round(total_words / speech_duration_minutes, 2)
+
+    return jsonify({'results': results})
+
+@app.route('/semantic-content/batch', methods=['POST'])
+def semantic_content_batch_endpoint():
+    """Semantic content analysis for a list of transcripts in one nlp.pipe pass"""
+    data = request.get_json()
+
+    try:
+        items = _batch_items(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        batch_size, n_process = _batch_options(data)
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': f'Invalid batch options: {str(e)}'}), 400
+
+    texts = []
+    banks = []
+    durations = []
+    for i, item in enumerate(items):
+        text = item.get('transcript') if isinstance(item, dict) else None
+        if not text:
+            return jsonify({'error': f'Missing transcript at index {i}'}), 400
+        if not isinstance(text, str):
+            return jsonify({'error': f'Transcript must be a string at index {i}'}), 400
+
+        word_bank = item.get('word_bank', [])
+        if not isinstance(word_bank, list) or not all(isinstance(word, str) for word in word_bank):
+            return jsonify({'error': f'Word bank must be a list of strings at index {i}'}), 400
+
+        try:
+            audio_segments = item.get('audio_segments')
+            if not audio_segments:
+                return jsonify({'error': f'Missing audio segment data at index {i}'}), 400
+            speech_duration = float(audio_segments[-1]['end_time'])
+        except (KeyError, ValueError, TypeError) as e:
+            return jsonify({'error': f'Invalid speech duration at index {i}: {str(e)}'}), 400
+
+        texts.append(text)
+        banks.append(word_bank)
+        durations.append(speech_duration)
+
+    results, _ = _traced('semantic_content_batch', nlp_pool.run(
+        semantic_content_batch_job, texts, banks, durations, SIMILARITY_THRESHOLD, batch_size, n_process))
+
+    return jsonify({'results': results})
+
+def _job_response(job, deduplicated=False):
+    body = job.to_dict()
+    body['deduplicated'] = deduplicated
+    body['status_url'] = f'/jobs/{job.id}'
+    body['result_url'] = f'/jobs/{job.id}/result'
+    return jsonify(body), 202
+
+@app.route('/jobs/analyze-text', methods=['POST'])
+def submit_analyze_text_job():
+    """Queue an /analyze-text analysis and return its job ID without waiting"""
+    data = request.get_json()
+
+    try:
+        text, max_phrase_length, speech_duration_minutes = _analyze_text_request(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    cache_key = _analyze_text_key(text, max_phrase_length)
+    job, deduplicated = job_manager.submit(
+        'analyze-text',
+        result_cache.make_key(cache_key, speech_duration_minutes),
+        analyze_text_job, text, max_phrase_length,
+        cache_key=cache_key,
+        prepare=lambda output: _traced('analyze_text', output)[0],
+        finalize=lambda results: _add_speech_rate(results, speech_duration_minutes),
+    )
+    return _job_response(job, deduplicated)
+
+@app.route('/jobs/semantic-content', methods=['POST'])
+def submit_semantic_content_job():
+    """Queue a /semantic-content analysis and return its job ID without waiting"""
+    data = request.get_json()
+
+    try:
+        text, word_bank, speech_duration = _semantic_content_request(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    cache_key = _semantic_content_key(text, word_bank, speech_duration)
+    job, deduplicated = job_manager.submit(
+        'semantic-content', cache_key,
+        semantic_content_job, text, word_bank, speech_duration, SIMILARITY_THRESHOLD,
+        cache_key=cache_key,
+        prepare=lambda output: _traced('semantic_content', output)[0],
+    )
+    return _job_response(job, deduplicated)
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """Status and timing of a background analysis"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """Result of a finished job; 202 with the status while it is still queued or running"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+
+    status = job.status
+    if status == 'done':
+        return jsonify(job.result)
+    if status == 'failed':
+        return jsonify({'error': job.error, 'job_id': job.id}), 500
+    return jsonify(job.to_dict()), 202
+
+@app.route('/jobs', methods=['GET'])
+def job_stats():
+    """Queue depth, job counts by status and mean run time"""
+    stats = job_manager.stats()
+    stats['pool'] = nlp_pool.stats()
+    return jsonify(stats)
+
+# /analyze-pauses bodies at least this large (or sent with ?stream=1) are parsed incrementally
+STREAM_PAUSES_MIN_BYTES = int(os.environ.get("STREAM_PAUSES_MIN_BYTES", 1024 * 1024))
+
 @app.route('/analyze-pauses', methods=['POST'])
 def analyze_pauses_endpoint():
+    stream_requested = request.args.get('stream') == '1' or (request.content_length or 0) >= STREAM_PAUSES_MIN_BYTES
+    if stream_requested and ijson is not None:
+        # Read full_transcription.results.items one item at a time instead of building the whole body
+        try:
+            # Buffered: ijson probes with read(0), which Werkzeug's raw stream reports as a disconnect
+            body = io.BufferedReader(request.stream)
+            pauses = analyze_pauses_stream(body, prefix='full_transcription.results.items.item')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(pauses)
+
     data = request.get_json()
 
     full_transcription = data.get('full_transcription')
@@ -125,6 +618,102 @@ def analyze_pauses_endpoint():
 
     return jsonify(pauses)
 
+def _speech_timing_options(data):
+    """Read the thresholds and window of /analyze-speech-timing (JSON body or query string)"""
+    thresholds = data.get('pause_thresholds', PAUSE_THRESHOLDS)
+    if isinstance(thresholds, str):
+        thresholds = thresholds.split(',')
+    if not isinstance(thresholds, (list, tuple)) or not 0 < len(thresholds) <= MAX_PAUSE_THRESHOLDS:
+        raise ValueError(f'pause_thresholds must be a list of 1 to {MAX_PAUSE_THRESHOLDS} numbers')
+    try:
+        thresholds = [float(threshold) for threshold in thresholds]
+        window_seconds = float(data.get('window_seconds', SPEECH_RATE_WINDOW))
+    except TypeError:
+        raise ValueError('pause_thresholds and window_seconds must be numbers')
+    if min(thresholds) < 0 or window_seconds <= 0:
+        raise ValueError('pause_thresholds must not be negative and window_seconds must be positive')
+    return {'pause_thresholds': thresholds, 'window_seconds': window_seconds}
+
+@app.route('/analyze-speech-timing', methods=['POST'])
+def analyze_speech_timing_endpoint():
+    """Pause summaries for several thresholds, pause histogram, speech rates and fillers in one call"""
+    stream_requested = request.args.get('stream') == '1' or (request.content_length or 0) >= STREAM_PAUSES_MIN_BYTES
+    if stream_requested and ijson is not None:
+        # Options come from the query string since the body is only read for its items
+        try:
+            options = _speech_timing_options(request.args)
+            body = io.BufferedReader(request.stream)
+            timing = analyze_speech_timing_stream(body, prefix='full_transcription.results.items.item', **options)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(timing)
+
+    data = request.get_json()
+
+    full_transcription = data.get('full_transcription')
+
+    if not full_transcription:
+        return jsonify({'error': 'Missing transcript'}), 400
+
+    try:
+        options = _speech_timing_options(data)
+        timing = analyze_speech_timing(full_transcription, **options)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(timing)
+
+@app.route('/api/nlp/models', methods=['GET'])
+def nlp_models():
+    """Report loaded spaCy models and process memory before/after loading"""
+    return jsonify(get_registry_stats())
+
+@app.route('/api/nlp/workers', methods=['GET'])
+def nlp_worker_stats():
+    """Report NLP worker pool size, queue occupancy and job counters"""
+    return jsonify(nlp_pool.stats())
+
+@app.route('/api/nlp/metrics', methods=['GET'])
+def nlp_metrics():
+    """Per-stage latency histograms (parse, token features, morphemes, repetitions, lexicon lookup, ...)"""
+    return jsonify(get_stage_metrics())
+
+@app.route('/api/nlp/cache-stats', methods=['GET'])
+def nlp_cache_stats():
+    """
+    Report hit/miss/eviction counters of the NLP caches.
+
+    word_banks and memory_vault are this process's caches, used when NLP_WORKERS is 0.
+    Otherwise workers holds each worker process's caches by PID, as of its latest job.
+    """
+    with worker_cache_stats_lock:
+        workers = {str(pid): stats for pid, stats in worker_cache_stats.items()} if nlp_pool.workers else None
+    return jsonify({
+        'word_banks': speech_analysis.get().get_bank_cache_stats() if speech_analysis.loaded else None,
+        'memory_vault': get_points_cache_stats(),
+        'workers': workers,
+        'results': result_cache.stats(),
+    })
+
+@app.route('/api/subsystems', methods=['GET'])
+def subsystem_stats():
+    """Which heavy subsystems this process has loaded, and how long each took"""
+    return jsonify(get_subsystem_stats())
+
+@app.route('/api/warm-up', methods=['POST'])
+def warm_up_endpoint():
+    """Load the listed subsystems (all when none are given) before real traffic arrives"""
+    data = request.get_json(silent=True) or {}
+    names = data.get('subsystems')
+    if names is not None and (not isinstance(names, list) or not all(isinstance(name, str) for name in names)):
+        return jsonify({'error': 'subsystems must be a list of names'}), 400
+
+    try:
+        stats = warm_up(names)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(stats)
+
 # Gaze Calibration Routes
 @app.route('/gaze-calibration-test')
 def gaze_calibration_page():
@@ -135,7 +724,7 @@ def gaze_calibration_page():
 def start_gaze_calibration():
     """Start the gaze tracking process"""
     try:
-        result = start_gaze_tracking()
+        result = gaze_calibration.get().start_gaze_tracking()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -144,7 +733,7 @@ def start_gaze_calibration():
 def stop_gaze_calibration():
     """Stop the gaze tracking process"""
     try:
-        result = stop_gaze_tracking()
+        result = gaze_calibration.get().stop_gaze_tracking()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -161,7 +750,7 @@ def collect_point():
         return jsonify({'error': 'Missing parameters'}), 400
     
     try:
-        result = collect_calibration_point(point_key, x_position, y_position)
+        result = gaze_calibration.get().collect_calibration_point(point_key, x_position, y_position)
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -170,7 +759,7 @@ def collect_point():
 def check_status():
     """Check the status of the calibration"""
     try:
-        result = check_calibration_status()
+        result = gaze_calibration.get().check_calibration_status()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -179,7 +768,7 @@ def check_status():
 def get_results():
     """Get the calibration results"""
     try:
-        result = get_calibration_results()
+        result = gaze_calibration.get().get_calibration_results()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -194,7 +783,7 @@ def natures_gaze_page():
 def start_natures_gaze():
     """Start the Nature's Gaze game process"""
     try:
-        result = start_saccade_game()
+        result = natures_gaze.get().start_saccade_game()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -203,7 +792,7 @@ def start_natures_gaze():
 def check_natures_gaze_status():
     """Check the status of the Nature's Gaze game"""
     try:
-        result = get_saccade_game_status()
+        result = natures_gaze.get().get_saccade_game_status()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -212,7 +801,7 @@ def check_natures_gaze_status():
 def get_natures_gaze_results():
     """Get the Nature's Gaze game results"""
     try:
-        result = get_saccade_game_results()
+        result = natures_gaze.get().get_saccade_game_results()
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -280,4 +869,8 @@ def send_static(path):
     return send_from_directory('static', path)
 
 if __name__ == '__main__':
+    # Not at import time: spawned NLP workers import this file again (as __mp_main__), and the
+    # debug reloader's watcher process runs it too; only the process serving requests warms up
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_warm_up()
     app.run(debug=True)
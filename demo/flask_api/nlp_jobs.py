@@ -0,0 +1,103 @@
+"""
+Jobs the Flask API runs on the NLP worker pool (shared/worker_pool.py).
+
+init_worker runs once in every worker process and loads the spaCy model, so
+each job only pays for inference. The SUBTLEXus lexicon is loaded by the first
+analyze-text job, since other jobs (e.g. compute_points) never need it, and
+with NLP_WORKERS=0 the initializer runs in the Flask process. The job functions
+are module-level so they can be pickled by name. Analysis jobs return
+(result, stage timings, cache counters) and the other jobs (result, cache
+counters), so the Flask process can aggregate the timings of every worker and
+report the caches, which live in the workers, per worker process.
+
+The analysis modules are imported inside the functions, so the Flask process can
+reference the jobs without importing spaCy until it runs one inline.
+"""
+import os
+import sys
+import threading
+
+# Add parent directory of flask_api ("demo") to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.model_registry import get_nlp
+from shared.stage_metrics import StageTrace
+
+# Global variables (per worker process)
+subtlexus_path = None
+lexicon_index = None
+lexicon_lock = threading.Lock()
+
+def load_lexicon_index(subtlexus_path):
+    """
+    SUBTLEXus lowercased word -> SUBTLWF index, built once per process.
+
+    With NLP_WORKERS=0 the jobs run in the Flask process, whose lexicon subsystem
+    calls this too, so both share one index.
+    """
+    global lexicon_index
+    with lexicon_lock:
+        if lexicon_index is None:
+            from processQuest.SpeechAnalysis import build_lexicon_index
+            from processQuest.lexicon_cache import load_lexicon
+            lexicon_index = build_lexicon_index(load_lexicon(subtlexus_path))
+    return lexicon_index
+
+def init_worker(lexicon_path):
+    """Load the spaCy model before the first job arrives and remember where the lexicon is"""
+    global subtlexus_path
+    subtlexus_path = lexicon_path
+    get_nlp()
+    print(f"NLP worker {os.getpid()} ready")
+
+def cache_stats():
+    """Counters of the NLP caches this process has loaded, tagged with its PID"""
+    # Only modules a job already imported, so compute_points never loads SpeechAnalysis
+    speech_analysis = sys.modules.get("processQuest.SpeechAnalysis")
+    generate_points = sys.modules.get("memoryVault.GeneratePoints")
+    return {
+        "pid": os.getpid(),
+        "word_banks": speech_analysis.get_bank_cache_stats() if speech_analysis else None,
+        "memory_vault": generate_points.get_cache_stats() if generate_points else None,
+    }
+
+def analyze_text_job(text, max_phrase_length):
+    from processQuest.SpeechAnalysis import analyze_text
+    trace = StageTrace()
+    result = analyze_text(text, lexicon_index=load_lexicon_index(subtlexus_path),
+                          max_phrase_length=max_phrase_length, trace=trace)
+    return result, trace.to_dict(), cache_stats()
+
+def semantic_content_job(text, word_bank, speech_duration, similarity_threshold):
+    from processQuest.SpeechAnalysis import analyze_semantic_content_with_word_bank
+    trace = StageTrace()
+    result = analyze_semantic_content_with_word_bank(text, word_bank, speech_duration, similarity_threshold, trace)
+    return result, trace.to_dict(), cache_stats()
+
+def analyze_text_batch_job(texts, max_phrase_length, batch_size, n_process):
+    from processQuest.SpeechAnalysis import analyze_text_batch
+    trace = StageTrace()
+    results = analyze_text_batch(texts, lexicon_index=load_lexicon_index(subtlexus_path), batch_size=batch_size,
+                                 n_process=n_process, max_phrase_length=max_phrase_length, trace=trace)
+    return results, trace.to_dict(), cache_stats()
+
+def semantic_content_batch_job(texts, banks, speech_durations, similarity_threshold, batch_size, n_process):
+    from processQuest.SpeechAnalysis import analyze_semantic_content_batch
+    trace = StageTrace()
+    results = analyze_semantic_content_batch(texts, banks, speech_durations, similarity_threshold,
+                                             batch_size=batch_size, n_process=n_process, trace=trace)
+    return results, trace.to_dict(), cache_stats()
+
+def session_parse_job(text, final):
+    from processQuest.transcript_sessions import parse_open_text
+    trace = StageTrace()
+    result = parse_open_text(text, final, trace)
+    return result, trace.to_dict(), cache_stats()
+
+def compute_points_job(presented_word, recalled_word, hint_used):
+    from memoryVault.GeneratePoints import compute_points
+    return compute_points(presented_word, recalled_word, hint_used), cache_stats()
+
+def compute_points_bulk_job(records):
+    from memoryVault.GeneratePoints import compute_points_bulk
+    return compute_points_bulk(records), cache_stats()
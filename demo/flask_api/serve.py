@@ -0,0 +1,148 @@
+"""
+Production entry point: the Flask app under gunicorn with a preloading master.
+
+The master imports app.py, loads the spaCy model, the lexicon and the analysis
+modules once (see /api/warm-up), runs a full garbage collection and freezes
+the surviving objects with gc.freeze(), then forks the workers. The workers
+share the model's read-only pages copy-on-write instead of each loading their
+own copy, and because frozen objects are never scanned by the collector, a
+worker's garbage collections do not write to (and so unshare) those pages.
+
+Every setting has an environment variable, so the same command works in a
+container:
+
+    cd demo/flask_api
+    python serve.py --bind 0.0.0.0:5000 --threads 8 --timeout 120
+    STATEFUL_ENDPOINTS=0 WEB_WORKERS=4 WEB_THREADS=4 python serve.py
+
+The /jobs and /analyze-text/sessions endpoints keep their state in the memory
+of the process that created it, so with several workers a follow-up request
+could reach a worker that has never seen the job or session. serve.py
+therefore runs one worker by default and refuses --workers above 1 unless
+STATEFUL_ENDPOINTS=0 turns those endpoints off. With one worker, NLP_WORKERS
+runs the analyses in parallel: the pool is started in the worker after the
+fork, never in the master.
+
+With several workers, NLP_WORKERS should stay 0: gunicorn's workers already
+run requests in parallel. APP_WARM_UP is ignored because the master preloads
+synchronously before forking.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Add parent directory of flask_api ("demo") to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.model_registry import current_rss_mb
+
+# gunicorn is optional: app.py's development server still works without it
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+    print("Warning: gunicorn not available. Use 'python app.py' for the development server.")
+
+# Subsystems (shared/lazy_loader.py) the master loads before forking; nlp_workers is added when
+# NLP_WORKERS is 0, where it loads the job functions' model and lexicon inline
+DEFAULT_PRELOAD = "speech_analysis,text_sessions,lexicon,spacy_model"
+
+def load_app(preload):
+    """Import the app and load the preload subsystems; returns the Flask app"""
+    # A warm-up thread running while the master forks could leave a lock held in the workers
+    os.environ.pop("APP_WARM_UP", None)
+
+    start = time.perf_counter()
+    rss_before = current_rss_mb()
+    import app as app_module
+
+    names = list(preload)
+    if app_module.nlp_pool.workers == 0 and "nlp_workers" not in names:
+        names.append("nlp_workers")
+    elif app_module.nlp_pool.workers and "nlp_workers" in names:
+        names.remove("nlp_workers")
+        print("Not preloading nlp_workers: each gunicorn worker starts its own pool after the fork")
+
+    stats = app_module.warm_up(names)
+    for name in names:
+        if stats[name]["error"]:
+            print(f"Preloading {name} failed, it will load on first use: {stats[name]['error']}")
+
+    # Everything loaded so far lives as long as the process: move it out of the collector's reach
+    gc.collect()
+    gc.freeze()
+    print(f"Preloaded {', '.join(names)} in {time.perf_counter() - start:.1f}s "
+          f"(RSS {current_rss_mb() - rss_before:+.0f} MB, {gc.get_freeze_count()} objects frozen)")
+    return app_module.app
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bind", default=os.environ.get("WEB_BIND", "127.0.0.1:5000"))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_WORKERS", 1)),
+                        help="Forked worker processes; above 1 needs STATEFUL_ENDPOINTS=0 (WEB_WORKERS)")
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("WEB_THREADS", 4)),
+                        help="Request threads per worker; above 1 uses gthread workers (WEB_THREADS)")
+    parser.add_argument("--timeout", type=int, default=int(os.environ.get("WEB_TIMEOUT", 120)),
+                        help="Seconds a request may run before its worker is restarted (WEB_TIMEOUT)")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.environ.get("WEB_GRACEFUL_TIMEOUT", 30)))
+    parser.add_argument("--keepalive", type=int, default=int(os.environ.get("WEB_KEEPALIVE", 5)))
+    parser.add_argument("--max-requests", type=int, default=int(os.environ.get("WEB_MAX_REQUESTS", 0)),
+                        help="Restart a worker after this many requests, 0 = never (WEB_MAX_REQUESTS)")
+    parser.add_argument("--preload", default=os.environ.get("WEB_PRELOAD", DEFAULT_PRELOAD),
+                        help="Comma-separated subsystems the master loads before forking, '' for none")
+    parser.add_argument("--log-level", default=os.environ.get("WEB_LOG_LEVEL", "info"))
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.threads < 1 or args.timeout <= 0:
+        parser.error("workers and threads must be at least 1 and timeout positive")
+    # Same variable as app.py's STATEFUL_ENDPOINTS, read here so the check runs before the app is loaded
+    if args.workers > 1 and os.environ.get("STATEFUL_ENDPOINTS", "1") != "0":
+        parser.error("the /jobs and /analyze-text/sessions endpoints only work with one worker process: "
+                     "use --workers 1 (with more --threads or NLP_WORKERS) or set STATEFUL_ENDPOINTS=0")
+    return args
+
+def gunicorn_options(args):
+    return {
+        "bind": args.bind,
+        "workers": args.workers,
+        "threads": args.threads,
+        "worker_class": "gthread" if args.threads > 1 else "sync",
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "keepalive": args.keepalive,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests // 10,
+        "preload_app": True,
+        "loglevel": args.log_level,
+        "accesslog": "-" if args.log_level == "debug" else None,
+    }
+
+if BaseApplication is not None:
+    class PreloadedApplication(BaseApplication):
+        """gunicorn application whose master runs load_app once before forking the workers"""
+
+        def __init__(self, options, preload):
+            self.options = options
+            self.preload = preload
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return load_app(self.preload)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if BaseApplication is None:
+        raise SystemExit("serve.py needs gunicorn (pip install gunicorn)")
+
+    preload = [name.strip() for name in args.preload.split(",") if name.strip()]
+    PreloadedApplication(gunicorn_options(args), preload).run()
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,85 @@
-import spacy
+import os
+import sys
+import numpy as np
 
-nlp = spacy.load("en_core_web_lg")
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-def compute_points(presented_word, recalled_word, hint_used=False):
-    token1 = nlp(presented_word.lower().strip())
-    token2 = nlp(recalled_word.lower().strip())
-    similarity = token1.similarity(token2)  
+from shared.model_registry import get_pipeline
+from shared.lru_cache import LRUCache
+
+# Similarity only reads the static word vectors, so the tagger/parser/NER never run
+nlp = get_pipeline("vectors")
+
+# Normalized word -> (vector keys, doc vector, norm). Presented words are a small fixed
+# set and recalled words repeat heavily across patients.
+word_vector_cache = LRUCache(maxsize=int(os.environ.get("WORD_VECTOR_CACHE_SIZE", 50000)))
+
+# Look single-token words up straight in nlp.vocab.vectors instead of building a Doc
+FAST_VECTOR_LOOKUP = os.environ.get("FAST_VECTOR_LOOKUP", "1") != "0"
+
+# Optional (presented, recalled) -> similarity cache, disabled when the size is 0
+PAIR_CACHE_SIZE = int(os.environ.get("PAIR_SCORE_CACHE_SIZE", 0))
+pair_score_cache = LRUCache(maxsize=PAIR_CACHE_SIZE) if PAIR_CACHE_SIZE else None
+
+def _is_single_token(word):
+    """Alphabetic words without a tokenizer special case (e.g. "cannot") stay one token"""
+    tokenizer = nlp.nlp.tokenizer
+    return word.isalpha() and word not in tokenizer.rules
+
+def _vector_table_entry(word):
+    """Vector keys, vector and norm of a single-token word read from the static vector table"""
+    vocab = nlp.vocab
+    key = vocab.strings.add(word)
+    row = vocab.vectors.find(key=key)
+    if row < 0:
+        vector = np.zeros((vocab.vectors_length,), dtype=np.float32)
+    else:
+        vector = np.array(vocab.vectors.data[row], dtype=np.float32)
+
+    # Same float32 squares accumulated in double as Doc.vector_norm
+    norm = float(np.sqrt(np.square(vector).astype(np.float64).sum()))
+    return (key,), vector, norm
+
+def _pipeline_entry(word):
+    """Vector keys, doc vector and norm of a word parsed by the pipeline"""
+    doc = nlp(word)
+    keys = tuple(doc.to_array(nlp.vocab.vectors.attr).tolist())
+    return keys, doc.vector, doc.vector_norm
+
+def _word_entry(word, fast=None):
+    """Vector keys, doc vector and norm of a normalized word, computed once"""
+    if fast is None:
+        fast = FAST_VECTOR_LOOKUP
+
+    def compute():
+        if fast and nlp.vocab.vectors.mode == "default" and _is_single_token(word):
+            return _vector_table_entry(word)
+        return _pipeline_entry(word)
+
+    return word_vector_cache.get_or_compute(word, compute)
+
+def word_similarity(word1, word2):
+    """
+    Doc.similarity between two normalized words, using the cached vectors.
+
+    Identical token sequences score 1.0 and words without vectors score 0.0,
+    exactly like spaCy's Doc.similarity.
+    """
+    return _entry_similarity(_word_entry(word1), _word_entry(word2))
+
+def _entry_similarity(entry1, entry2):
+    keys1, vector1, norm1 = entry1
+    keys2, vector2, norm2 = entry2
+
+    if keys1 == keys2:
+        return 1.0
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return (np.dot(vector1, vector2) / (norm1 * norm2)).item()
+
+def _points_from_similarity(similarity, hint_used=False):
     similarity_percent = similarity * 100
-    
+
     if similarity_percent == 100:
         points = 4  # Exact match
     elif similarity_percent < 25:
@@ -21,5 +93,77 @@ def compute_points(presented_word, recalled_word, hint_used=False):
 
     if hint_used:
         points = max(points - 1, 0)
-    
+
     return points
+
+def compute_points(presented_word, recalled_word, hint_used=False):
+    word1 = presented_word.lower().strip()
+    word2 = recalled_word.lower().strip()
+
+    if pair_score_cache is not None:
+        similarity = pair_score_cache.get_or_compute((word1, word2), lambda: word_similarity(word1, word2))
+    else:
+        similarity = word_similarity(word1, word2)
+
+    return _points_from_similarity(similarity, hint_used)
+
+def compute_points_bulk(records):
+    """
+    Score a whole recall session at once.
+
+    Each distinct word is embedded once (through the word vector cache) and all
+    pair similarities are computed as one vectorized operation, with the same
+    point bands and hint penalty as compute_points. Dot products are summed in
+    float64 here, while compute_points (like Token.similarity) takes a float32
+    dot, so a pair whose similarity is within float32 rounding of a band edge
+    (25%, 35%, 70% or 100%, e.g. distinct recalls with exactly parallel
+    vectors) can land in the neighbouring band.
+
+    Args:
+        records (list): Dicts with 'presented', 'recalled' and optional 'hint_used'.
+
+    Returns:
+        dict: {'points': per-record points in input order, 'total': session total}
+    """
+    if not records:
+        return {"points": [], "total": 0}
+
+    presented = [record["presented"].lower().strip() for record in records]
+    recalled = [record["recalled"].lower().strip() for record in records]
+    hints = np.array([bool(record.get("hint_used", False)) for record in records])
+
+    words = list(dict.fromkeys(presented + recalled))
+    rows = {word: i for i, word in enumerate(words)}
+    entries = [_word_entry(word) for word in words]
+
+    vectors = np.vstack([vector for _, vector, _ in entries])
+    norms = np.array([norm for _, _, norm in entries], dtype=np.float64)
+    key_ids = {}
+    word_key_ids = np.array([key_ids.setdefault(keys, len(key_ids)) for keys, _, _ in entries])
+
+    p = np.array([rows[word] for word in presented])
+    r = np.array([rows[word] for word in recalled])
+
+    vectors = vectors.astype(np.float64)
+    dots = np.einsum("ij,ij->i", vectors[p], vectors[r])
+    norm_products = norms[p] * norms[r]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarity = np.where(norm_products == 0, 0.0, dots / norm_products)
+    similarity = np.where(word_key_ids[p] == word_key_ids[r], 1.0, similarity)
+
+    similarity_percent = similarity * 100
+    points = np.select(
+        [similarity_percent == 100, similarity_percent < 25, similarity_percent < 35, similarity_percent < 70],
+        [4, 0, 1, 2],
+        default=3,
+    )
+    points = np.maximum(points - hints, 0)
+
+    return {"points": points.tolist(), "total": int(points.sum())}
+
+def get_cache_stats():
+    """Size and hit rate of the word vector and pair score caches"""
+    return {
+        "word_vectors": word_vector_cache.stats(),
+        "pair_scores": pair_score_cache.stats() if pair_score_cache is not None else None,
+    }
@@ -1,9 +1,38 @@
-import spacy
+import os
+import hashlib
 from collections import Counter
+import numpy as np
 import pandas as pd
+from spacy.attrs import IS_ALPHA, IS_STOP, POS, TAG, MORPH, ORTH, LOWER
+from spacy.parts_of_speech import IDS as POS_IDS
+from spacy.tokens import MorphAnalysis
 
-# Load the model
-nlp = spacy.load("en_core_web_lg")
+from shared.model_registry import get_pipeline
+from shared.lru_cache import LRUCache
+from shared.stage_metrics import NULL_TRACE, StageTrace, stage_metrics
+# Pause and speech timing analysis needs no spaCy and lives in its own module; re-exported here
+from processQuest.pause_analysis import (
+    analyze_pauses,
+    analyze_pauses_stream,
+    analyze_speech_timing,
+    analyze_speech_timing_stream,
+    iter_pauses,
+    ijson,
+    FILLER_WORDS,
+    MAX_PAUSE_THRESHOLDS,
+    MIN_PAUSE,
+    PAUSE_HISTOGRAM_EDGES,
+    PAUSE_THRESHOLDS,
+    SPEECH_RATE_WINDOW,
+)
+
+# Views of the shared spaCy model: analyze_text needs tags, morphology and sentences,
+# semantic content only needs token vectors, and analyze_pauses needs no NLP at all
+syntax_nlp = get_pipeline("syntax")
+vectors_nlp = get_pipeline("vectors")
+
+# Embedded word banks keyed by a hash of the sorted bank; stimuli reuse a few fixed banks
+bank_cache = LRUCache(maxsize=int(os.environ.get("BANK_CACHE_SIZE", 64)))
 
 DERIVATIONAL_SUFFIXES = {
     "ly": "Adverbial -ly",
@@ -19,156 +48,332 @@ DERIVATIONAL_SUFFIXES = {
     "er": "Agentive -er",
 }
 
-def analyze_text(text, subtlexus_df=None):
+# Part-of-speech groups counted by analyze_text
+NOUN_TAGS = {"NOUN", "PROPN"}
+VERB_TAGS = {"VERB", "AUX"}
+FILLER_WORD_TAGS = {"INTJ"}
+OPEN_CLASS_TAGS = NOUN_TAGS | {"VERB", "ADJ", "ADV"}
+
+NOUN_POS_IDS = [POS_IDS[tag] for tag in NOUN_TAGS]
+VERB_POS_IDS = [POS_IDS[tag] for tag in VERB_TAGS]
+FILLER_WORD_POS_IDS = [POS_IDS[tag] for tag in FILLER_WORD_TAGS]
+OPEN_CLASS_POS_IDS = [POS_IDS[tag] for tag in OPEN_CLASS_TAGS]
+
+# Longest repeated phrase (in tokens) counted as a phrase repetition
+MAX_PHRASE_LENGTH = 5
+
+SUBORDINATING_CONJUNCTIONS = {"although", "because", "since", "unless", "while", "if", "when", "that", "which", "who"}
+
+def build_lexicon_index(subtlexus_df):
+    """
+    Build a lowercased word -> SUBTLWF lookup from the SUBTLEXus dataset.
+
+    Only the first row for each lowercased word is kept, which matches the
+    row the previous per-noun DataFrame scan picked up.
+
+    Args:
+        subtlexus_df (pd.DataFrame): SUBTLEXus dataset.
+
+    Returns:
+        dict: Mapping of lowercased word to its SUBTLWF frequency.
+    """
+    if subtlexus_df is None or subtlexus_df.empty:
+        return {}
+
+    lowered = subtlexus_df['Word'].str.lower()
+    frequencies = subtlexus_df['SUBTLWF']
+
+    # Non-string entries (NaN, numbers parsed by Excel) lower to NaN and never match
+    valid = lowered.notna() & ~lowered.duplicated(keep='first')
+    return dict(zip(lowered[valid].tolist(), frequencies[valid].tolist()))
+
+def lookup_frequencies(lexicon_index, words):
+    """
+    Resolve a batch of words against a lexicon index in one pass.
+
+    Args:
+        lexicon_index (dict): Output of build_lexicon_index.
+        words (list): Words to look up (any casing).
+
+    Returns:
+        list: SUBTLWF frequency for each word, 0 when the word is unknown.
+    """
+    get = lexicon_index.get
+    return [get(word.lower(), 0) for word in words]
+
+# Defaults for the nlp.pipe based batch analyses
+DEFAULT_BATCH_SIZE = 64
+
+def analyze_text(text, subtlexus_df=None, lexicon_index=None, max_phrase_length=MAX_PHRASE_LENGTH, trace=None):
     """
     Consolidated analysis of lexical content, syntactic complexity, and noun frequency.
     
     Args:
         text (str): Transcript text.
         subtlexus_df (pd.DataFrame): SUBTLEXus dataset (optional).
+        lexicon_index (dict): Prebuilt index from build_lexicon_index (optional).
+            Preferred over subtlexus_df, which is only indexed when no index is given.
+        max_phrase_length (int): Longest phrase counted as a phrase repetition.
+        trace (StageTrace): Collects per-stage timings (optional). Without one,
+            timings are recorded in stage_metrics; with one, recording is up to the caller.
     
     Returns:
         dict: Aggregated analysis results.
     """
-    doc = nlp(text)
-    
-    ### Initialize counts and containers
-    total_tokens = 0
-    total_nouns = 0
-    total_verbs = 0
-    total_filler_words = 0
-    total_open_class_words = 0
-    total_closed_class_words = 0
-    repetitions = 0
-    morpheme_count = 0
+    own_trace = trace is None
+    trace = trace or StageTrace()
+    with trace.stage("parse"):
+        doc = syntax_nlp(text)
+    results = _analyze_doc(doc, _resolve_lexicon_index(subtlexus_df, lexicon_index), max_phrase_length, trace)
+    if own_trace:
+        stage_metrics.record("analyze_text", trace)
+    return results
+
+def analyze_text_batch(texts, subtlexus_df=None, lexicon_index=None, batch_size=DEFAULT_BATCH_SIZE, n_process=1,
+                       max_phrase_length=MAX_PHRASE_LENGTH, trace=None):
+    """
+    Batched analyze_text for many transcripts, parsed together with nlp.pipe.
+
+    Args:
+        texts (list): Transcript texts.
+        subtlexus_df (pd.DataFrame): SUBTLEXus dataset (optional).
+        lexicon_index (dict): Prebuilt index from build_lexicon_index (optional).
+        batch_size (int): Number of transcripts spaCy parses per batch.
+        n_process (int): Number of processes spaCy uses for parsing.
+        max_phrase_length (int): Longest phrase counted as a phrase repetition.
+        trace (StageTrace): Collects stage timings summed over the batch (optional).
+
+    Returns:
+        list: One analyze_text result dict per transcript, in input order.
+    """
+    own_trace = trace is None
+    trace = trace or StageTrace()
+    lexicon_index = _resolve_lexicon_index(subtlexus_df, lexicon_index)
+    docs = iter(syntax_nlp.pipe(texts, batch_size=batch_size, n_process=n_process))
+    results = []
+    while True:
+        with trace.stage("parse"):
+            doc = next(docs, None)
+        if doc is None:
+            break
+        results.append(_analyze_doc(doc, lexicon_index, max_phrase_length, trace))
+    if own_trace:
+        stage_metrics.record("analyze_text_batch", trace)
+    return results
+
+def _resolve_lexicon_index(subtlexus_df, lexicon_index):
+    if lexicon_index is None and subtlexus_df is not None and not subtlexus_df.empty:
+        return build_lexicon_index(subtlexus_df)
+    return lexicon_index
+
+def _bound_morphemes(morph_dict, tag):
+    """Inflectional bound morphemes for one morphological analysis and fine-grained tag"""
+    bound_morphemes = 0
+    if morph_dict.get("Number") == "Plur":
+        bound_morphemes += 1
+    if "Tense" in morph_dict:
+        if "Past" in morph_dict["Tense"]:
+            bound_morphemes += 1
+        if "Pres" in morph_dict["Tense"] and tag not in ["VBZ", "VBP"]:
+            bound_morphemes += 1
+    if morph_dict.get("Degree"):
+        bound_morphemes += 1
+    if morph_dict.get("Poss"):
+        bound_morphemes += 1
+    return bound_morphemes
+
+def _compile_suffix_trie(suffixes):
+    """Trie over the reversed suffixes; a node's _SUFFIX_END entry holds the suffix length"""
+    root = {}
+    for suffix in suffixes:
+        node = root
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node[_SUFFIX_END] = len(suffix)
+    return root
+
+_SUFFIX_END = None
+SUFFIX_TRIE = _compile_suffix_trie(DERIVATIONAL_SUFFIXES)
+
+# ORTH id -> derivational suffix count, shared across tokens and requests. It only
+# grows with the vocabulary, which spaCy's StringStore keeps in memory anyway.
+suffix_count_cache = {}
+
+def _derivational_suffix_count(word):
+    """Number of DERIVATIONAL_SUFFIXES the word ends with (case-sensitive), in one backwards walk"""
+    count = 0
+    node = SUFFIX_TRIE
+    for char in reversed(word):
+        node = node.get(char)
+        if node is None:
+            break
+        length = node.get(_SUFFIX_END)
+        if length is not None and len(word) > length + 1:
+            count += 1
+    return count
+
+def _lexeme_suffix_count(orth, strings):
+    """_derivational_suffix_count cached on the word's vocab hash"""
+    count = suffix_count_cache.get(orth)
+    if count is None:
+        count = suffix_count_cache[orth] = _derivational_suffix_count(strings[orth])
+    return count
+
+def _per_type_sum(values, counter):
+    """
+    Sum counter(value) over an array, calling counter once per distinct value.
+    """
+    if not len(values):
+        return 0
+    unique_values, inverse = np.unique(values, axis=0, return_inverse=True)
+    per_type = np.array([counter(value) for value in unique_values.tolist()], dtype=np.int64)
+    return int(per_type[inverse.reshape(-1)].sum())
+
+def _doc_counts(doc, trace=NULL_TRACE):
+    """
+    Token-level counts behind analyze_text for one parsed document.
+
+    All token attributes are exported once with doc.to_array and counted with
+    NumPy masks; morphology and derivational suffixes are resolved once per
+    distinct (morph, tag) pair and word form rather than once per token.
+    """
+    vocab = doc.vocab
+    strings = vocab.strings
+    trace.tokens += len(doc)
+
+    with trace.stage("token_features"):
+        attrs = doc.to_array([IS_ALPHA, POS, TAG, MORPH, ORTH, LOWER])
+        is_alpha = attrs[:, 0] == 1
+
+        alpha = attrs[is_alpha]
+        pos = alpha[:, 1]
+        lowers = alpha[:, 5]
+
+        is_noun = np.isin(pos, NOUN_POS_IDS)
+        is_open_class = np.isin(pos, OPEN_CLASS_POS_IDS)
+
+        conjunction_ids = [strings.add(word) for word in SUBORDINATING_CONJUNCTIONS]
+
+        counts = {
+            "sentences": sum(1 for _ in doc.sents),
+            "tokens": len(alpha),
+            "nouns": int(is_noun.sum()),
+            "verbs": int(np.isin(pos, VERB_POS_IDS).sum()),
+            "filler_words": int(np.isin(pos, FILLER_WORD_POS_IDS).sum()),
+            "open_class_words": int(is_open_class.sum()),
+            "closed_class_words": int((~is_open_class).sum()),
+            "embedded_clauses": int(np.isin(attrs[:, 5], conjunction_ids).sum()),
+            "token_ids": lowers,
+            "nouns_lower": [strings[noun] for noun in lowers[is_noun].tolist()],
+        }
+
+    with trace.stage("morphemes"):
+        # Each alpha token is one base morpheme plus its inflectional and derivational ones
+        inflections = _per_type_sum(
+            alpha[:, [3, 2]],
+            lambda pair: _bound_morphemes(MorphAnalysis.from_id(vocab, pair[0]).to_dict(), strings[pair[1]]),
+        )
+        derivations = _per_type_sum(alpha[:, 4], lambda orth: _lexeme_suffix_count(orth, strings))
+        counts["morphemes"] = len(alpha) + inflections + derivations
+
+    return counts
+
+def count_phrase_repetitions(token_ids, max_phrase_length=MAX_PHRASE_LENGTH):
+    """
+    Count phrase repetitions: a run of 2 to max_phrase_length tokens immediately repeated.
+
+    Scans left to right taking the longest repeated phrase first and resuming
+    after both copies. For each phrase length L, a[j] == a[j + L] is compared
+    for all positions at once and a sliding window count over those matches
+    marks every start where a[i:i+L] == a[i+L:i+2L], so no slices are built.
+    Cost is O(n * max_phrase_length).
+
+    Args:
+        token_ids (array-like): Integer-encoded tokens (e.g. spaCy LOWER ids).
+        max_phrase_length (int): Longest phrase length to look for.
+
+    Returns:
+        int: Number of phrase repetition events.
+    """
+    return _scan_phrase_repetitions(token_ids, max_phrase_length)[0]
+
+def _scan_phrase_repetitions(token_ids, max_phrase_length, final=True):
+    """
+    Greedy phrase repetition scan behind count_phrase_repetitions.
+
+    With final=False only starts whose longest possible phrase pair already fits
+    in token_ids are decided, so the scan can resume once more tokens arrive.
+
+    Returns:
+        tuple: (phrase repetitions found, index where scanning should resume)
+    """
+    tokens = np.asarray(token_ids)
+    n = len(tokens)
+    longest = np.zeros(n, dtype=np.int64)
+
+    for L in range(2, min(max_phrase_length, n // 2) + 1):
+        matches = np.concatenate(([0], np.cumsum(tokens[:n - L] == tokens[L:])))
+        window = matches[L:n - L + 1] - matches[:n - 2 * L + 1]
+        longest[np.flatnonzero(window == L)] = L
+
+    stop = n if final else max(n - 2 * max_phrase_length + 1, 0)
     phrase_reps = 0
-    
-    noun_tags = {"NOUN", "PROPN"}
-    verb_tags = {"VERB", "AUX"}
-    filler_words_tags = {"INTJ"}
-    open_class_tags = noun_tags | {"VERB", "ADJ", "ADV"}
-    
-    previous_word = None
-    tokens_alpha_lower = []
-    
-    sentences = list(doc.sents)
-    subordinating_conjunctions = {"although", "because", "since", "unless", "while", "if", "when", "that", "which", "who"}
-    
-    embedded_clauses = 0
-    total_sentence_words = 0
-    total_verbs_doc = 0
-    
-    nouns_for_frequency = []
-    
-    ### Loop through sentences and tokens
-    for sentence in sentences:
-        for token in sentence:
-            if not token.is_alpha:
-                continue
-            
-            word = token.text
-            tag = token.pos_
-            
-            # Token counts
-            total_tokens += 1
-            tokens_alpha_lower.append(word.lower())
-            
-            # Nouns & verbs
-            if tag in noun_tags:
-                total_nouns += 1
-                nouns_for_frequency.append(word)
-            if tag in verb_tags:
-                total_verbs += 1
-            
-            # Filler words
-            if tag in filler_words_tags:
-                total_filler_words += 1
-            
-            # Open/closed class words
-            if tag in open_class_tags:
-                total_open_class_words += 1
-            else:
-                total_closed_class_words += 1
-            
-            # Repetitions (immediate)
-            if word.lower() == previous_word:
-                repetitions += 1
-            previous_word = word.lower()
-            
-            # Morphemes
-            base_morphemes = 1
-            bound_morphemes = 0
-            morph_dict = token.morph.to_dict()
-            
-            if morph_dict.get("Number") == "Plur":
-                bound_morphemes += 1
-            if "Tense" in morph_dict:
-                if "Past" in morph_dict["Tense"]:
-                    bound_morphemes += 1
-                if "Pres" in morph_dict["Tense"] and token.tag_ not in ["VBZ", "VBP"]:
-                    bound_morphemes += 1
-            if morph_dict.get("Degree"):
-                bound_morphemes += 1
-            if morph_dict.get("Poss"):
-                bound_morphemes += 1
-            
-            for suffix in DERIVATIONAL_SUFFIXES.keys():
-                if word.endswith(suffix) and len(word) > len(suffix) + 1:
-                    bound_morphemes += 1
-            
-            total_morphemes = base_morphemes + bound_morphemes
-            morpheme_count += total_morphemes
-        
-        # Syntactic complexity sentence analysis
-        sentence_words = len([token for token in sentence if token.is_alpha])
-        total_sentence_words += sentence_words
-        
-    # Embedded clauses & verbs (document-level)
-    embedded_clauses = sum(1 for token in doc if token.text.lower() in subordinating_conjunctions)
-    total_verbs_doc = total_verbs
-    num_sentences = len(sentences)
-    
+    i = 0
+    for start in np.flatnonzero(longest[:stop]).tolist():
+        if start < i:
+            continue
+        phrase_reps += 1
+        i = start + 2 * int(longest[start])
+    return phrase_reps, max(i, stop)
+
+def _analyze_doc(doc, lexicon_index, max_phrase_length=MAX_PHRASE_LENGTH, trace=NULL_TRACE):
+    """
+    analyze_text counts for an already parsed document.
+    """
+    counts = _doc_counts(doc, trace)
+    tokens = counts["token_ids"]
+
+    with trace.stage("repetitions"):
+        # Repetitions (immediate)
+        repetitions = int((tokens[1:] == tokens[:-1]).sum())
+
+        # Phrase repetitions
+        phrase_reps = count_phrase_repetitions(tokens, max_phrase_length)
+
+    # Average noun frequency from SUBTLEXus
+    avg_noun_frequency = None
+    if lexicon_index is not None:
+        with trace.stage("lexicon_lookup"):
+            frequencies = lookup_frequencies(lexicon_index, counts["nouns_lower"])
+            avg_noun_frequency = (sum(frequencies) / len(frequencies)) if frequencies else 0
+
+    return _build_text_results(counts, repetitions, phrase_reps, avg_noun_frequency)
+
+def _build_text_results(counts, repetitions, phrase_reps, avg_noun_frequency):
+    """Turn raw counts into the analyze_text response"""
+    num_sentences = counts["sentences"]
+    total_verbs = counts["verbs"]
+    total_open_class_words = counts["open_class_words"]
+    total_closed_class_words = counts["closed_class_words"]
+    morpheme_count = counts["morphemes"]
+
     # Mean length of utterance & verb index
-    mean_length_of_utterance = (total_sentence_words / num_sentences) if num_sentences else 0
-    verb_index = (total_verbs_doc / num_sentences) if num_sentences else 0
-    
+    mean_length_of_utterance = (counts["tokens"] / num_sentences) if num_sentences else 0
+    verb_index = (total_verbs / num_sentences) if num_sentences else 0
+
     # Open/Closed class ratio
     open_closed_ratio = (total_open_class_words / total_closed_class_words) if total_closed_class_words else 0
-    
-    # Phrase repetitions
-    i = 0
-    n = len(tokens_alpha_lower)
-    while i < n:
-        event_detected = False
-        for L in range(min(5, (n - i) // 2), 1, -1):
-            if tokens_alpha_lower[i:i+L] == tokens_alpha_lower[i+L:i+2*L]:
-                phrase_reps += 1
-                i += 2 * L
-                event_detected = True
-                break
-        if not event_detected:
-            i += 1
-    
+
     repetition_ratio = ((repetitions + phrase_reps) / morpheme_count) if morpheme_count else 0
-    
-    # Average noun frequency from SUBTLEXus
-    avg_noun_frequency = None
-    if subtlexus_df is not None and not subtlexus_df.empty:
-        frequencies = []
-        for noun in nouns_for_frequency:
-            match = subtlexus_df[subtlexus_df['Word'].str.lower() == noun.lower()]
-            freq = match['SUBTLWF'].values[0] if not match.empty else 0
-            frequencies.append(freq)
-        avg_noun_frequency = (sum(frequencies) / len(frequencies)) if frequencies else 0
-    
+
     # Results
     return {
         # Lexical content
         "Total Sentences": num_sentences,
-        "Total Tokens": total_tokens,
-        "Frequency of Nouns": total_nouns,
-        "Frequency of Verbs and auxillary verbs": total_verbs_doc,
-        "Frequency of Filler Words": total_filler_words,
+        "Total Tokens": counts["tokens"],
+        "Frequency of Nouns": counts["nouns"],
+        "Frequency of Verbs and auxillary verbs": total_verbs,
+        "Frequency of Filler Words": counts["filler_words"],
         "Open-Class Words": total_open_class_words,
         "Closed-Class Words": total_closed_class_words,
         "Open/Closed Class Ratio": round(open_closed_ratio, 3),
@@ -177,101 +382,140 @@ def analyze_text(text, subtlexus_df=None):
         
         # Syntactic complexity
         "Mean Length of Utterance (MLU) (Average number of words per sentence)": round(mean_length_of_utterance, 2),
-        "Embedded Clauses": embedded_clauses,
+        "Embedded Clauses": counts["embedded_clauses"],
         "Verb Index (verbs to utterances ratio)": round(verb_index, 2),
         
         # Average noun frequency
         "Average Noun Frequency": round(avg_noun_frequency, 2) if avg_noun_frequency is not None else "N/A",
     }
 
-def analyze_semantic_content_with_word_bank(text, bank, speech_duration, similarity_threshold=0.5):
+def embed_word_bank(bank):
     """
-    Identifies words in the text that are semantically similar to words in a word bank.
+    Embed a word bank as a matrix of unit-length vectors.
+
+    Each row is the spaCy doc vector of one bank word (the mean of its token
+    vectors) divided by its norm. Words without a vector get a zero row, which
+    scores 0 against every token, like Token.similarity does.
+
+    Args:
+        bank (list): Word bank.
+
+    Returns:
+        np.ndarray: Array of shape (len(bank), vector width), float32.
     """
-    doc = nlp(text)
-    semantic_units = []
+    width = vectors_nlp.vocab.vectors_length
+    matrix = np.zeros((len(bank), width), dtype=np.float32)
+    for i, doc in enumerate(vectors_nlp.pipe(bank)):
+        norm = doc.vector_norm
+        if norm:
+            matrix[i] = doc.vector / norm
+    return matrix
 
-    # Convert bank words into spaCy tokens
-    bank_tokens = [nlp(word) for word in bank]
+def get_bank_embedding(bank):
+    """
+    Cached embed_word_bank for a bank, keyed by a hash of its sorted unique words.
 
-    for token in doc:
-        if token.is_alpha and not token.is_stop:  
-            token_vector = token.vector
-            max_similarity = max(token.similarity(ref) for ref in bank_tokens)
+    Order and duplicates do not change the best match per token, so the same
+    stimulus bank sent in any order reuses one read-only matrix.
+    """
+    words = sorted(set(bank))
+    key = hashlib.sha256("\x1f".join(words).encode("utf-8")).hexdigest()
 
-            if max_similarity >= similarity_threshold:
-                semantic_units.append(token.text.lower())
+    def compute():
+        matrix = embed_word_bank(words)
+        matrix.setflags(write=False)
+        return matrix
 
-    total_words = len([token for token in doc if token.is_alpha])
-    num_semantic_units = len(semantic_units)
-    idea_density = num_semantic_units / total_words if total_words else 0
-    semantic_efficiency = (
-        num_semantic_units / speech_duration if speech_duration and speech_duration > 0 else None
-    )
+    return bank_cache.get_or_compute(key, compute)
 
-    return {
-        "Semantic Units": num_semantic_units,
-        "Semantic Idea Density": round(idea_density, 2),
-        "Semantic Efficiency": round(semantic_efficiency, 2)
-        if semantic_efficiency is not None else "Duration not provided",
-    }
+def get_bank_cache_stats():
+    """Hit/miss/eviction counters of the word bank cache"""
+    return bank_cache.stats()
 
-def analyze_pauses(json, pause_threshold=0.5):
+def analyze_semantic_content_with_word_bank(text, bank, speech_duration, similarity_threshold=0.5, trace=None):
     """
-    Analyze pauses based on the time gaps in the transcript.
+    Identifies words in the text that are semantically similar to words in a word bank.
 
-    Parameters:
-    - json (dict): The AWS Transcribe JSON response
-    - pause_threshold (float): Minimum gap (in seconds) to be considered a pause
+    trace (StageTrace) optionally collects per-stage timings, as in analyze_text.
+    """
+    own_trace = trace is None
+    trace = trace or StageTrace()
+    with trace.stage("tokenize"):
+        doc = vectors_nlp(text)
+    with trace.stage("bank_embedding"):
+        bank_matrix = get_bank_embedding(bank)
+
+    results = _semantic_content_from_doc(doc, bank_matrix, speech_duration, similarity_threshold, trace)
+    if own_trace:
+        stage_metrics.record("semantic_content", trace)
+    return results
+
+def analyze_semantic_content_batch(texts, banks, speech_durations, similarity_threshold=0.5,
+                                   batch_size=DEFAULT_BATCH_SIZE, n_process=1, trace=None):
+    """
+    Batched analyze_semantic_content_with_word_bank, parsed together with nlp.pipe.
+
+    Args:
+        texts (list): Transcript texts.
+        banks (list): One word bank (list of words) per transcript.
+        speech_durations (list): One speech duration (seconds) per transcript.
+        similarity_threshold (float): Minimum similarity to count a semantic unit.
+        batch_size (int): Number of transcripts spaCy parses per batch.
+        n_process (int): Number of processes spaCy uses for parsing.
+        trace (StageTrace): Collects stage timings summed over the batch (optional).
 
     Returns:
-    - list: List of dict objects containing start and end times of pauses
+        list: One analyze_semantic_content_with_word_bank result dict per transcript.
     """
+    if not (len(texts) == len(banks) == len(speech_durations)):
+        raise ValueError("texts, banks and speech_durations must have the same length.")
 
-    # Validate the structure of the JSON
-    if not isinstance(json, dict):
-        raise ValueError("Expected 'json' to be a dictionary.")
+    own_trace = trace is None
+    trace = trace or StageTrace()
+    with trace.stage("tokenize"):
+        docs = list(vectors_nlp.pipe(texts, batch_size=batch_size, n_process=n_process))
 
-    results = json.get('results')
-    if not results or not isinstance(results, dict):
-        raise ValueError("Missing or invalid 'results' field in JSON.")
+    results = []
+    for doc, bank, speech_duration in zip(docs, banks, speech_durations):
+        # Stimulus banks repeat across a cohort, so each distinct bank is embedded once
+        with trace.stage("bank_embedding"):
+            bank_matrix = get_bank_embedding(bank)
+        results.append(_semantic_content_from_doc(doc, bank_matrix, speech_duration, similarity_threshold, trace))
+    if own_trace:
+        stage_metrics.record("semantic_content_batch", trace)
+    return results
 
-    items = results.get('items')
-    if not items or not isinstance(items, list):
-        raise ValueError("Missing or invalid 'items' field in 'results'.")
+def _semantic_content_from_doc(doc, bank_matrix, speech_duration, similarity_threshold, trace=NULL_TRACE):
+    vocab = doc.vocab
+    trace.tokens += len(doc)
+    attrs = doc.to_array([vocab.vectors.attr, IS_ALPHA, IS_STOP])
+    is_alpha = attrs[:, 1].astype(bool)
+    content_keys = attrs[is_alpha & ~attrs[:, 2].astype(bool), 0]
 
-    # filter out only 'pronunciation' items, since punctuation has no timing
-    words = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        if item.get('type') == 'pronunciation':
-            # Validate timing keys
-            if 'start_time' not in item or 'end_time' not in item:
-                continue
-            words.append(item)
-
-    pauses = []
-
-    for i in range(len(words) - 1):
-        current_word = words[i]
-        next_word = words[i + 1]
-
-        try:
-            current_end = float(current_word['end_time'])
-            next_start = float(next_word['start_time'])
-        except (KeyError, ValueError, TypeError) as e:
-            # Skip if the time values are missing or invalid
-            continue
+    num_semantic_units = 0
+    if len(content_keys) and len(bank_matrix):
+        with trace.stage("similarity"):
+            # Repeated transcript words share one row, then a single product scores every pair
+            unique_keys, token_rows = np.unique(content_keys, return_inverse=True)
+            token_matrix = np.zeros((len(unique_keys), bank_matrix.shape[1]), dtype=np.float32)
+            for i, key in enumerate(unique_keys.tolist()):
+                vector = vocab.get_vector(key)
+                norm = np.sqrt((vector ** 2).sum())
+                if norm:
+                    token_matrix[i] = vector / norm
 
-        gap = next_start - current_end
+            max_similarity = (token_matrix @ bank_matrix.T).max(axis=1)
+            num_semantic_units = int((max_similarity[token_rows] >= similarity_threshold).sum())
 
-        # if the gap exceeds the pause threshold, we record it
-        if gap >= pause_threshold:
-            pause = {
-                'StartTime': round(current_end, 2),
-                'EndTime': round(next_start, 2)
-            }
-            pauses.append(pause)
+    total_words = int(is_alpha.sum())
+    idea_density = num_semantic_units / total_words if total_words else 0
+    semantic_efficiency = (
+        num_semantic_units / speech_duration if speech_duration and speech_duration > 0 else None
+    )
 
-    return pauses
+    return {
+        "Semantic Units": num_semantic_units,
+        "Semantic Idea Density": round(idea_density, 2),
+        "Semantic Efficiency": round(semantic_efficiency, 2)
+        if semantic_efficiency is not None else "Duration not provided",
+    }
@@ -0,0 +1,448 @@
+"""
+Offline re-scoring of archived Process Quest / Scene Detective sessions.
+
+Streams session records from a directory of .json / .jsonl files, re-runs
+analyze_text, semantic content and speech timing on them over a process pool
+(each worker parses its chunk of transcripts with nlp.pipe) and appends one
+row per session to a CSV file or a Parquet dataset as chunks finish.
+
+A session record looks like the bodies the Flask endpoints take:
+
+    {"session_id": "...", "transcript": "...", "audio_segments": [...],
+     "word_bank": [...], "full_transcription": {...AWS Transcribe JSON...}}
+
+Only transcript is needed for the text measures; semantic content runs when a
+word_bank is present and speech timing when full_transcription is. A .json file
+holds one record or a list of them, a .jsonl file one record per line.
+
+Progress is checkpointed after every chunk written, so an interrupted run picks
+up where it stopped when started again with the same inputs and options.
+
+Usage:
+    cd demo
+    python processQuest/batch_rescore.py sessions/ --output rescored.csv --workers 4
+    python processQuest/batch_rescore.py sessions/ --output rescored.parquet --pause-thresholds 0.25 0.5 1
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+
+# Add parent directory of processQuest ("demo") to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from processQuest.SpeechAnalysis import (
+    analyze_semantic_content_batch,
+    analyze_speech_timing,
+    analyze_text_batch,
+    build_lexicon_index,
+    ijson,
+    DEFAULT_BATCH_SIZE,
+    MAX_PHRASE_LENGTH,
+)
+from processQuest.lexicon_cache import load_lexicon
+from shared.model_registry import get_model_version, get_nlp
+from shared.stage_metrics import StageMetrics, StageTrace
+from shared.worker_pool import WorkerPool
+
+# pyarrow is optional: without it only CSV output is available
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+    print("Warning: pyarrow not available. Parquet output is disabled.")
+
+CHECKPOINT_VERSION = 1
+DEFAULT_LEXICON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SUBTLEXusExcel2007.xlsx")
+META_COLUMNS = ["session_id", "source", "error"]
+
+# Each worker loads its own en_core_web_lg (1 GB+), so the default stays small whatever the core count
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 2)
+
+# Probe record run once per batch to learn the full set of output columns
+PROBE_RECORD = {
+    "session_id": "probe",
+    "transcript": "The boy is reaching for the cookie jar.",
+    "audio_segments": [{"end_time": "2.0"}],
+    "word_bank": ["boy", "cookie"],
+    "full_transcription": {"results": {"items": [
+        {"start_time": "0.0", "end_time": "0.4", "type": "pronunciation", "alternatives": [{"content": "um"}]},
+        {"start_time": "1.0", "end_time": "1.4", "type": "pronunciation", "alternatives": [{"content": "boy"}]},
+    ]}},
+}
+
+# Global variables (per worker process)
+lexicon_index = None
+
+def init_worker(subtlexus_path):
+    """Load the lexicon (when available) and spaCy model before the first chunk arrives"""
+    global lexicon_index
+    if subtlexus_path and os.path.exists(subtlexus_path):
+        lexicon_index = build_lexicon_index(load_lexicon(subtlexus_path))
+    get_nlp()
+
+def _speech_duration(record):
+    """Seconds from the last audio segment (as the endpoints do) or an explicit speech_duration"""
+    try:
+        return float(record["audio_segments"][-1]["end_time"])
+    except (KeyError, IndexError, ValueError, TypeError):
+        pass
+    try:
+        return float(record["speech_duration"])
+    except (KeyError, ValueError, TypeError):
+        return None
+
+def _flatten_timing(timing):
+    """Scalar columns of an analyze_speech_timing result"""
+    columns = {
+        key: value for key, value in timing.items()
+        if not isinstance(value, (list, dict))
+    }
+    for summary in timing["Pause Summary"]:
+        prefix = f"Pauses >= {summary['Threshold']}s"
+        columns.update({f"{prefix}: {key}": value for key, value in summary.items() if key != "Threshold"})
+    for bucket in timing["Pause Histogram"]:
+        upper = bucket["To"] if bucket["To"] is not None else "inf"
+        columns[f"Pause Histogram: {bucket['From']}-{upper}s"] = bucket["Count"]
+    columns.update({
+        f"Filler Words: {key}": value for key, value in timing["Filler Words"].items() if key != "Occurrences"
+    })
+    return columns
+
+def _set_error(row, message):
+    """Record an analysis error, keeping the first one a record hits"""
+    if row["error"] is None:
+        row["error"] = message
+
+def _analyze_each(analyze, indices, rows, label):
+    """
+    Run a batch analysis over the records at indices; returns {index: result}.
+
+    If the batch raises (e.g. a transcript longer than nlp.max_length), the
+    records are analyzed one at a time, and only those that fail get an error,
+    so one bad record neither fails the chunk nor stops every --resume on it.
+    """
+    try:
+        return dict(zip(indices, analyze(indices)))
+    except Exception:
+        pass
+    results = {}
+    for i in indices:
+        try:
+            results[i] = analyze([i])[0]
+        except Exception as e:
+            _set_error(rows[i], f"{label} failed: {type(e).__name__}: {e}")
+    return results
+
+def rescore_chunk_job(records, options):
+    """
+    Analyze one chunk of (source, record) pairs in a worker.
+
+    Returns (rows, stage timings); a record that cannot be analyzed gets a row
+    with only its error set, and one whose analysis fails keeps the results of
+    the other sections and has its error set.
+    """
+    trace = StageTrace()
+    rows = []
+    for source, record in records:
+        row = {"session_id": None, "source": source, "error": None}
+        if not isinstance(record, dict):
+            row["error"] = record if isinstance(record, str) else "Record is not a JSON object"
+        else:
+            row["session_id"] = record.get("session_id", record.get("id"))
+            transcript = record.get("transcript")
+            if not transcript or not isinstance(transcript, str):
+                row["error"] = "Missing transcript"
+        rows.append(row)
+
+    valid = [i for i, row in enumerate(rows) if row["error"] is None]
+
+    text_results = _analyze_each(lambda indices: analyze_text_batch(
+        [records[i][1]["transcript"] for i in indices],
+        lexicon_index=lexicon_index,
+        batch_size=options["batch_size"],
+        max_phrase_length=options["max_phrase_length"],
+        trace=trace,
+    ), valid, rows, "analyze_text")
+    for i, result in text_results.items():
+        rows[i].update({f"text: {key}": value for key, value in result.items()})
+
+    semantic = []
+    for i in valid:
+        word_bank = records[i][1].get("word_bank")
+        if not isinstance(word_bank, list):
+            continue
+        if all(isinstance(word, str) for word in word_bank):
+            semantic.append(i)
+        else:
+            _set_error(rows[i], "Invalid word_bank: entries must be strings")
+
+    semantic_results = _analyze_each(lambda indices: analyze_semantic_content_batch(
+        [records[i][1]["transcript"] for i in indices],
+        [records[i][1]["word_bank"] for i in indices],
+        [_speech_duration(records[i][1]) for i in indices],
+        options["similarity_threshold"],
+        batch_size=options["batch_size"],
+        trace=trace,
+    ), semantic, rows, "semantic content")
+    for i, result in semantic_results.items():
+        rows[i].update({f"semantic: {key}": value for key, value in result.items()})
+
+    with trace.stage("speech_timing"):
+        for i in valid:
+            full_transcription = records[i][1].get("full_transcription")
+            if not full_transcription:
+                continue
+            try:
+                timing = analyze_speech_timing(full_transcription, pause_thresholds=options["pause_thresholds"],
+                                               pause_threshold=options["pause_threshold"])
+            except Exception as e:
+                _set_error(rows[i], f"Invalid full_transcription: {type(e).__name__}: {e}")
+                continue
+            rows[i].update({f"timing: {key}": value for key, value in _flatten_timing(timing).items()})
+
+    return rows, trace.to_dict()
+
+def columns_job(options):
+    """Output columns, in order, of a record that has every section"""
+    rows, _ = rescore_chunk_job([("probe", PROBE_RECORD)], options)
+    return list(rows[0])
+
+def find_inputs(input_dir):
+    """Every .json and .jsonl file under input_dir, in a stable order"""
+    paths = []
+    for root, dirs, files in os.walk(input_dir):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith((".json", ".jsonl")))
+    return paths
+
+def iter_records(paths):
+    """
+    Yield (source, record) for every session in the files, reading them incrementally.
+
+    A line or file that is not valid JSON yields its error message as the record.
+    """
+    for path in paths:
+        if path.endswith(".jsonl"):
+            with open(path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield f"{path}:{line_number}", json.loads(line)
+                    except ValueError as e:
+                        yield f"{path}:{line_number}", f"Invalid JSON: {e}"
+            continue
+
+        with open(path, "rb") as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            f.seek(0)
+            try:
+                if first == b"[" and ijson is not None:
+                    # Large exports are lists of sessions: read one at a time
+                    for index, record in enumerate(ijson.items(f, "item", use_float=True)):
+                        yield f"{path}:{index}", record
+                    continue
+                document = json.load(f)
+            except ValueError as e:  # ijson.JSONError is a ValueError
+                yield path, f"Invalid JSON: {e}"
+                continue
+        if isinstance(document, list):
+            for index, record in enumerate(document):
+                yield f"{path}:{index}", record
+        else:
+            yield path, document
+
+class CsvSink:
+    """Appends rows to one CSV file; its position is the file size after the last chunk"""
+
+    def __init__(self, path, columns, position=0):
+        self.columns = columns
+        self.file = open(path, "r+" if position else "w", newline="", encoding="utf-8")
+        # Drop rows written after the last checkpoint
+        self.file.truncate(position)
+        self.file.seek(position)
+        self.writer = csv.DictWriter(self.file, fieldnames=columns, restval="", extrasaction="ignore")
+        if not position:
+            self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+class ParquetSink:
+    """Writes every chunk as a part file of a Parquet dataset directory; its position is the part count"""
+
+    def __init__(self, path, columns, position=0):
+        self.path = path
+        self.columns = columns
+        self.position = position
+        self.schema = pa.schema(
+            [(name, pa.string()) for name in META_COLUMNS]
+            + [(name, pa.float64()) for name in columns if name not in META_COLUMNS]
+        )
+        os.makedirs(path, exist_ok=True)
+        # Drop parts written after the last checkpoint
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(".parquet") and int(name[5:-8]) >= position:
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows):
+        table = pa.Table.from_pylist([
+            {name: _parquet_value(name, row.get(name)) for name in self.columns} for row in rows
+        ], schema=self.schema)
+        part_path = os.path.join(self.path, f"part-{self.position:05d}.parquet")
+        pq.write_table(table, f"{part_path}.tmp")
+        os.replace(f"{part_path}.tmp", part_path)
+        self.position += 1
+        return self.position
+
+    def close(self):
+        pass
+
+def _parquet_value(name, value):
+    if name in META_COLUMNS:
+        return None if value is None else str(value)
+    # Placeholders such as "N/A" or "Duration not provided" become nulls in a numeric column
+    return float(value) if isinstance(value, (int, float)) else None
+
+def read_checkpoint(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_checkpoint(path, checkpoint):
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input_dir", help="Directory of .json / .jsonl session files")
+    parser.add_argument("--output", required=True, help="Output .csv file or .parquet dataset directory")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and overwrite the output")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Worker processes, each with its own copy of the model (0 = analyze in this process)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Sessions per worker job and per checkpoint")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="nlp.pipe batch size")
+    parser.add_argument("--lexicon", default=DEFAULT_LEXICON, help="SUBTLEXus spreadsheet for noun frequency")
+    parser.add_argument("--max-phrase-length", type=int, default=MAX_PHRASE_LENGTH)
+    parser.add_argument("--similarity-threshold", type=float, default=0.5)
+    parser.add_argument("--pause-threshold", type=float, default=0.5,
+                        help="Pause threshold for filler timing (seconds)")
+    parser.add_argument("--pause-thresholds", type=float, nargs="+", default=[0.25, 0.5, 1.0, 2.0],
+                        help="Thresholds (seconds) to summarise pauses for")
+    parser.add_argument("--progress-seconds", type=float, default=5.0, help="Seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1 or args.batch_size < 1 or args.workers < 0 or args.max_phrase_length < 2:
+        parser.error("chunk and batch sizes must be positive, workers >= 0 and max phrase length >= 2")
+    if args.output.endswith(".parquet") and pq is None:
+        parser.error("Parquet output requires pyarrow; install it or write a .csv file")
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"{args.input_dir} is not a directory")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint.json"
+    options = {
+        "max_phrase_length": args.max_phrase_length,
+        "similarity_threshold": args.similarity_threshold,
+        "pause_threshold": args.pause_threshold,
+        "pause_thresholds": args.pause_thresholds,
+        "batch_size": args.batch_size,
+    }
+    inputs = find_inputs(args.input_dir)
+    # Settings that change the output; a checkpoint is only resumed when they match
+    settings = {key: value for key, value in options.items() if key != "batch_size"}
+    settings.update({"model": get_model_version(), "lexicon": os.path.abspath(args.lexicon),
+                     "output": os.path.abspath(args.output)})
+
+    checkpoint = None if args.restart else read_checkpoint(checkpoint_path)
+    if checkpoint is not None:
+        if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("settings") != settings:
+            raise SystemExit(f"{checkpoint_path} was written with different options; pass --restart to start over")
+        if checkpoint.get("inputs") != inputs:
+            raise SystemExit(f"Input files changed since {checkpoint_path}; pass --restart to start over")
+        print(f"Resuming after {checkpoint['records_done']} sessions")
+    elif os.path.exists(args.output) and not args.restart:
+        raise SystemExit(f"{args.output} exists without a checkpoint; pass --restart to overwrite it")
+    else:
+        checkpoint = {"version": CHECKPOINT_VERSION, "settings": settings, "inputs": inputs,
+                      "records_done": 0, "errors": 0, "position": 0, "finished": False}
+
+    pool = WorkerPool(workers=args.workers, max_queue=max(args.workers, 1), timeout=None,
+                      initializer=init_worker, initargs=(args.lexicon,))
+    metrics = StageMetrics()
+    try:
+        columns = pool.submit(columns_job, options).result()
+        sink_class = ParquetSink if args.output.endswith(".parquet") else CsvSink
+        sink = sink_class(args.output, columns, checkpoint["position"])
+
+        records = itertools.islice(iter_records(inputs), checkpoint["records_done"], None)
+        chunks = iter(lambda: list(itertools.islice(records, args.chunk_size)), [])
+        pending = deque()
+        max_pending = args.workers + max(args.workers, 1)  # workers + max_queue: never PoolBusy
+
+        start = time.perf_counter()
+        last_report = start
+        processed = tokens = 0
+
+        def write_oldest():
+            nonlocal processed, tokens
+            rows, trace = pending.popleft().result()
+            checkpoint["position"] = sink.write(rows)
+            checkpoint["records_done"] += len(rows)
+            checkpoint["errors"] += sum(1 for row in rows if row["error"])
+            write_checkpoint(checkpoint_path, checkpoint)
+            metrics.record("rescore_chunk", trace)
+            processed += len(rows)
+            tokens += trace["tokens"]
+
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                write_oldest()
+            pending.append(pool.submit(rescore_chunk_job, chunk, options))
+
+            now = time.perf_counter()
+            if now - last_report >= args.progress_seconds:
+                last_report = now
+                elapsed = now - start
+                print(f"{checkpoint['records_done']} sessions done ({checkpoint['errors']} errors), "
+                      f"{processed / elapsed:.1f} sessions/s, {tokens / elapsed:.0f} tokens/s")
+        while pending:
+            write_oldest()
+        sink.close()
+
+        checkpoint["finished"] = True
+        write_checkpoint(checkpoint_path, checkpoint)
+    finally:
+        pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(f"Done: {processed} sessions this run ({checkpoint['records_done']} total, {checkpoint['errors']} errors) "
+          f"in {elapsed:.1f}s, {processed / elapsed if elapsed else 0:.1f} sessions/s, "
+          f"{tokens / elapsed if elapsed else 0:.0f} tokens/s")
+    stages = metrics.snapshot().get("rescore_chunk", {}).get("stages", {})
+    for name, histogram in stages.items():
+        print(f"  {name:>16}: {histogram['total_ms'] / 1000:.1f}s worker time")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import os
+import json
+import hashlib
+import numpy as np
+
+# pandas is imported by the functions that build DataFrames, so reading the source hash
+# (source_sha256) stays cheap in processes that never load the lexicon itself
+
+# Bump when the on-disk layout changes so stale caches are rebuilt
+CACHE_FORMAT_VERSION = 1
+
+SUBTLEXUS_COLUMNS = ['Word', 'FREQcount', 'CDcount', 'FREQlow', 'Cdlow', 'SUBTLWF', 'Lg10WF', 'SUBTLCD', 'Lg10CD']
+
+def _file_sha256(path):
+    """Hash the source spreadsheet in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cache_paths(cache_dir, stem, sha256):
+    prefix = os.path.join(cache_dir, f"{stem}-{sha256[:16]}")
+    return {
+        "meta": os.path.join(cache_dir, f"{stem}.json"),
+        "words": f"{prefix}.words.npy",
+        "values": f"{prefix}.values.npy",
+    }
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_atomic(path, write):
+    """Write to a temp file first so concurrent workers never see partial files"""
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def _write_meta(meta_path, meta):
+    def write(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+    _write_atomic(meta_path, write)
+
+def _build_cache(source_path, columns, paths, meta):
+    """Parse the spreadsheet once and store it as two .npy files"""
+    import pandas as pd
+    df = pd.read_excel(source_path)
+    df.columns = columns
+
+    # Excel cells that are not text (NaN, numbers, booleans) are stored as '' and
+    # restored as NaN so they keep never matching a word lookup
+    words = np.array([w if isinstance(w, str) else "" for w in df[columns[0]]], dtype=str)
+    values = np.ascontiguousarray(df[columns[1:]].to_numpy(dtype=np.float64))
+
+    def save_npy(array):
+        def write(tmp_path):
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+        return write
+
+    _write_atomic(paths["words"], save_npy(words))
+    _write_atomic(paths["values"], save_npy(values))
+    _write_meta(paths["meta"], meta)
+
+def _remove_stale(cache_dir, stem, keep_paths):
+    """Best-effort cleanup of arrays left behind by older versions of the spreadsheet"""
+    keep = {os.path.basename(p) for p in keep_paths}
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{stem}-") and name.endswith(".npy") and name not in keep:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+def _default_cache_dir(source_path, cache_dir=None):
+    return cache_dir or os.environ.get("LEXICON_CACHE_DIR") or os.path.join(
+        os.path.dirname(source_path), ".lexicon_cache"
+    )
+
+def source_sha256(source_path, cache_dir=None):
+    """
+    SHA-256 of a lexicon spreadsheet without loading it.
+
+    Taken from the cache metadata when the file's mtime and size still match it,
+    otherwise computed from the file.
+    """
+    source_path = os.path.abspath(source_path)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    meta = _read_meta(os.path.join(_default_cache_dir(source_path, cache_dir), f"{stem}.json"))
+    stat = os.stat(source_path)
+    if meta is not None and meta.get("sha256") and (meta.get("mtime_ns"), meta.get("size")) == (stat.st_mtime_ns, stat.st_size):
+        return meta["sha256"]
+    return _file_sha256(source_path)
+
+def load_lexicon(source_path, columns=SUBTLEXUS_COLUMNS, cache_dir=None):
+    """
+    Load a lexicon spreadsheet through a binary parse cache.
+
+    The first call parses the spreadsheet with pandas and writes the words and the
+    numeric columns to .npy files keyed by the source file's mtime and SHA-256.
+    Later calls load those files (memory-mapped) instead of parsing Excel, which
+    is what saves the startup time. It is not shared memory: the word column is
+    copied into an object array here, and build_lexicon_index builds its dict in
+    every process that loads the lexicon.
+
+    Args:
+        source_path (str): Path to the spreadsheet (e.g. SUBTLEXusExcel2007.xlsx).
+        columns (list): Column names; the first is the word column, the rest numeric.
+        cache_dir (str): Cache location (defaults to $LEXICON_CACHE_DIR or a
+            .lexicon_cache folder next to the spreadsheet).
+
+    Returns:
+        pd.DataFrame: Lexicon with the given columns. Numeric columns are float64 and
+            df.attrs["sha256"] holds the source file's hash.
+    """
+    import pandas as pd
+    source_path = os.path.abspath(source_path)
+    cache_dir = _default_cache_dir(source_path, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+
+    stat = os.stat(source_path)
+    meta_path = os.path.join(cache_dir, f"{stem}.json")
+    meta = _read_meta(meta_path)
+    is_current = (
+        meta is not None
+        and meta.get("format_version") == CACHE_FORMAT_VERSION
+        and meta.get("columns") == list(columns)
+    )
+
+    if is_current and (meta.get("mtime_ns"), meta.get("size")) != (stat.st_mtime_ns, stat.st_size):
+        # mtime changed (e.g. fresh checkout); only rebuild if the content did too
+        sha256 = _file_sha256(source_path)
+        is_current = sha256 == meta.get("sha256")
+        if is_current:
+            meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            _write_meta(meta_path, meta)
+
+    if is_current:
+        paths = _cache_paths(cache_dir, stem, meta["sha256"])
+        is_current = os.path.exists(paths["words"]) and os.path.exists(paths["values"])
+
+    if not is_current:
+        sha256 = _file_sha256(source_path)
+        meta = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "source": os.path.basename(source_path),
+            "columns": list(columns),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+        }
+        paths = _cache_paths(cache_dir, stem, sha256)
+        print(f"Building lexicon cache for {source_path}")
+        _build_cache(source_path, list(columns), paths, meta)
+        _remove_stale(cache_dir, stem, [paths["words"], paths["values"]])
+
+    words = np.load(paths["words"], mmap_mode="r")
+    values = np.load(paths["values"], mmap_mode="r")
+
+    # A single 2-D float block is wrapped without copying, so it stays memory-mapped
+    df = pd.DataFrame(values, columns=list(columns[1:]), copy=False)
+    word_column = pd.Series(words.astype(object)).mask(lambda column: column == "")
+    df.insert(0, columns[0], word_column)
+    df.attrs["sha256"] = meta["sha256"]
+    return df
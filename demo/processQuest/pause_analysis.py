@@ -0,0 +1,350 @@
+"""
+Pause and speech timing analysis of AWS Transcribe responses.
+
+Only NumPy is needed here (and optionally ijson for streaming), so processes that
+serve /analyze-pauses never import spaCy. SpeechAnalysis re-exports everything.
+"""
+import itertools
+import operator
+import numpy as np
+
+# ijson is optional: without it, streaming pause analysis is unavailable and callers parse the full JSON
+try:
+    import ijson
+except ImportError:
+    ijson = None
+    print("Warning: ijson not available. Streaming pause analysis is disabled.")
+
+def analyze_pauses(json, pause_threshold=0.5):
+    """
+    Analyze pauses based on the time gaps in the transcript.
+
+    Every word's end time and the next word's start time are converted once into
+    two float arrays (feeding float() straight from the items, without building
+    intermediate lists) and all gaps are computed and thresholded at once. A time
+    that cannot be parsed becomes NaN, which skips the pairs it belongs to as before.
+
+    Parameters:
+    - json (dict): The AWS Transcribe JSON response
+    - pause_threshold (float): Minimum gap (in seconds) to be considered a pause
+
+    Returns:
+    - list: List of dict objects containing start and end times of pauses
+    """
+    words = _timed_pronunciations(json)
+    if len(words) < 2:
+        return []
+
+    current_ends = _float_array(words, 'end_time', 0, len(words) - 1)
+    next_starts = _float_array(words, 'start_time', 1, len(words))
+    with np.errstate(invalid='ignore'):
+        gaps = next_starts - current_ends
+    pause_index = np.flatnonzero(gaps >= pause_threshold)
+
+    # if the gap exceeds the pause threshold, we record it
+    return [
+        {'StartTime': current_end, 'EndTime': next_start}
+        for current_end, next_start in zip(_round_2(current_ends[pause_index]), _round_2(next_starts[pause_index]))
+    ]
+
+def _timed_pronunciations(json):
+    """Validate an AWS Transcribe response and return its pronunciation items that carry timings"""
+    # Validate the structure of the JSON
+    if not isinstance(json, dict):
+        raise ValueError("Expected 'json' to be a dictionary.")
+
+    results = json.get('results')
+    if not results or not isinstance(results, dict):
+        raise ValueError("Missing or invalid 'results' field in JSON.")
+
+    items = results.get('items')
+    if not items or not isinstance(items, list):
+        raise ValueError("Missing or invalid 'items' field in 'results'.")
+
+    # filter out only 'pronunciation' items, since punctuation has no timing
+    return [
+        item for item in items
+        if isinstance(item, dict) and item.get('type') == 'pronunciation' and 'start_time' in item and 'end_time' in item
+    ]
+
+def _float_array(words, key, start, stop):
+    """float(word[key]) for words[start:stop] as an array; values float() rejects become NaN"""
+    return _float_values(list(map(operator.itemgetter(key), itertools.islice(words, start, stop))))
+
+def _float_values(values):
+    """float() of every value in a list as an array; values float() rejects become NaN"""
+    try:
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    except (ValueError, TypeError):
+        # Some time value is invalid: convert one by one
+        return np.fromiter(map(_to_float, values), dtype=np.float64, count=len(values))
+
+def iter_pauses(items, pause_threshold=0.5):
+    """
+    Yield the pauses analyze_pauses would return, one at a time, from any iterable
+    of AWS Transcribe items (e.g. a streaming parser), keeping only the previous
+    word's end time in memory.
+    """
+    previous_end = None
+    for item in items:
+        if not (isinstance(item, dict) and item.get('type') == 'pronunciation'
+                and 'start_time' in item and 'end_time' in item):
+            continue
+
+        if previous_end is not None:
+            try:
+                current_end = float(previous_end)
+                next_start = float(item['start_time'])
+            except (ValueError, TypeError):
+                # Skip if the time values are invalid
+                current_end = next_start = None
+
+            if current_end is not None and next_start - current_end >= pause_threshold:
+                yield {'StartTime': round(current_end, 2), 'EndTime': round(next_start, 2)}
+
+        previous_end = item['end_time']
+
+def analyze_pauses_stream(stream, pause_threshold=0.5, prefix='results.items.item'):
+    """
+    analyze_pauses over a JSON byte stream, reading items incrementally with ijson.
+
+    Only one item is held in memory at a time, so peak memory is independent of
+    the number of items and grows only with the pauses found.
+
+    Parameters:
+    - stream (file-like): Binary stream of the JSON document
+    - pause_threshold (float): Minimum gap (in seconds) to be considered a pause
+    - prefix (str): ijson path of the items, e.g. 'full_transcription.results.items.item'
+      for a request body that wraps the AWS Transcribe response
+
+    Returns:
+    - list: List of dict objects containing start and end times of pauses
+    """
+    if ijson is None:
+        raise RuntimeError("Streaming pause analysis requires the ijson package.")
+
+    item_count = 0
+
+    def counted(items):
+        nonlocal item_count
+        for item in items:
+            item_count += 1
+            yield item
+
+    try:
+        pauses = list(iter_pauses(counted(ijson.items(stream, prefix, use_float=True)), pause_threshold))
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+
+    if not item_count:
+        raise ValueError("Missing or invalid 'items' field in 'results'.")
+    return pauses
+
+# Speech timing: thresholds (seconds) summarised per call, pause-length histogram bucket
+# lower bounds (the last bucket is unbounded) and the shortest gap counted as a pause
+PAUSE_THRESHOLDS = (0.25, 0.5, 1.0, 2.0)
+PAUSE_HISTOGRAM_EDGES = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0)
+MIN_PAUSE = 0.25
+SPEECH_RATE_WINDOW = 30.0
+FILLER_WORDS = {"um", "umm", "uh", "uhh", "uhm", "er", "erm", "ah", "hmm", "hm", "mm"}
+MAX_PAUSE_THRESHOLDS = 20
+
+def analyze_speech_timing(json, pause_thresholds=PAUSE_THRESHOLDS, pause_threshold=0.5, min_pause=MIN_PAUSE,
+                          window_seconds=SPEECH_RATE_WINDOW, histogram_edges=PAUSE_HISTOGRAM_EDGES,
+                          filler_words=FILLER_WORDS):
+    """
+    Pause profile, speech rate and filler timing of an AWS Transcribe response.
+
+    Word start/end times are converted once into arrays; the gaps between words
+    are sorted a single time so every threshold and histogram bucket is a
+    searchsorted lookup on cumulative sums instead of another pass over the items.
+
+    Parameters:
+    - json (dict): The AWS Transcribe JSON response
+    - pause_thresholds (iterable of float): Thresholds (in seconds) to summarise pauses for
+    - pause_threshold (float): Threshold of the returned pause list (as analyze_pauses)
+      and of fillers counted as preceded by a pause
+    - min_pause (float): Shortest gap that is a pause rather than articulation, for the articulation rate
+    - window_seconds (float): Length of the speech rate windows
+    - histogram_edges (iterable of float): Lower bounds of the pause-length buckets
+    - filler_words (set): Lowercase words counted as fillers
+
+    Returns:
+    - dict: Word count, speech duration and rates, per-threshold pause summaries,
+      pause histogram, speech rate windows, filler summary and the pause list
+    """
+    words = _timed_pronunciations(json)
+    starts = _float_array(words, 'start_time', 0, len(words))
+    ends = _float_array(words, 'end_time', 0, len(words))
+    contents = [_item_content(word) for word in words]
+    return _speech_timing(starts, ends, contents, pause_thresholds, pause_threshold, min_pause,
+                          window_seconds, histogram_edges, filler_words)
+
+def analyze_speech_timing_stream(stream, prefix='results.items.item', **options):
+    """
+    analyze_speech_timing over a JSON byte stream, reading items incrementally with ijson.
+
+    Only the timings and content of pronunciation items are kept, not the items themselves.
+    Keyword options are those of analyze_speech_timing.
+    """
+    if ijson is None:
+        raise RuntimeError("Streaming speech timing analysis requires the ijson package.")
+
+    starts, ends, contents = [], [], []
+    item_count = 0
+    try:
+        for item in ijson.items(stream, prefix, use_float=True):
+            item_count += 1
+            if (isinstance(item, dict) and item.get('type') == 'pronunciation'
+                    and 'start_time' in item and 'end_time' in item):
+                starts.append(item['start_time'])
+                ends.append(item['end_time'])
+                contents.append(_item_content(item))
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+
+    if not item_count:
+        raise ValueError("Missing or invalid 'items' field in 'results'.")
+    return _speech_timing(_float_values(starts), _float_values(ends), contents, **options)
+
+def _item_content(item):
+    """Lowercase text of an item's first alternative ('' when missing)"""
+    alternatives = item.get('alternatives')
+    if isinstance(alternatives, list) and alternatives and isinstance(alternatives[0], dict):
+        content = alternatives[0].get('content')
+        if isinstance(content, str):
+            return content.lower()
+    return ''
+
+def _speech_timing(starts, ends, contents, pause_thresholds=PAUSE_THRESHOLDS, pause_threshold=0.5,
+                   min_pause=MIN_PAUSE, window_seconds=SPEECH_RATE_WINDOW, histogram_edges=PAUSE_HISTOGRAM_EDGES,
+                   filler_words=FILLER_WORDS):
+    word_count = len(contents)
+    thresholds = np.asarray(list(pause_thresholds), dtype=np.float64)
+    edges = np.asarray(sorted(histogram_edges), dtype=np.float64)
+
+    with np.errstate(invalid='ignore'):
+        # Gap between each word's end and the next word's start; NaN where a time is invalid
+        gaps = starts[1:] - ends[:-1]
+    sorted_gaps = np.sort(gaps[~np.isnan(gaps)])
+    gap_sums = np.concatenate(([0.0], np.cumsum(sorted_gaps)))
+
+    def pauses_from(lower_bounds):
+        """Count and total of the gaps >= each bound"""
+        first = np.searchsorted(sorted_gaps, lower_bounds, side='left')
+        return len(sorted_gaps) - first, gap_sums[-1] - gap_sums[first]
+
+    valid_starts = starts[np.isfinite(starts)]
+    valid_ends = ends[np.isfinite(ends)]
+    if len(valid_starts) and len(valid_ends):
+        speech_start = float(valid_starts.min())
+        duration = max(float(valid_ends.max()) - speech_start, 0.0)
+    else:
+        speech_start, duration = 0.0, 0.0
+
+    # Pause summaries per threshold
+    counts, totals = pauses_from(thresholds)
+    longest = float(sorted_gaps[-1]) if len(sorted_gaps) else 0.0
+    pause_summaries = [
+        {
+            "Threshold": float(threshold),
+            "Count": int(count),
+            "Total Pause Time": round(float(total), 2),
+            "Mean Pause Time": round(float(total) / count, 2) if count else 0.0,
+            "Longest Pause": round(longest, 2) if count else 0.0,
+            "Pauses per 100 Words": round(100 * int(count) / word_count, 2) if word_count else 0.0,
+            "Pause Ratio": round(float(total) / duration, 2) if duration else 0.0,
+        }
+        for threshold, count, total in zip(thresholds.tolist(), counts.tolist(), totals.tolist())
+    ]
+
+    # Pause-length histogram: buckets [edges[i], edges[i + 1]), the last one unbounded
+    bucket_counts, _ = pauses_from(edges)
+    bucket_counts = np.append(bucket_counts[:-1] - bucket_counts[1:], bucket_counts[-1:]) if len(edges) else []
+    histogram = [
+        {"From": lower, "To": upper, "Count": int(count)}
+        for lower, upper, count in zip(edges.tolist(), edges[1:].tolist() + [None], list(bucket_counts))
+    ]
+
+    # Speech rate overall and excluding pauses (articulation rate)
+    _, articulation_pauses = pauses_from(np.array([min_pause]))
+    speaking_time = duration - float(articulation_pauses[0])
+    speech_rate = 60 * word_count / duration if duration else 0.0
+    articulation_rate = 60 * word_count / speaking_time if speaking_time > 0 else 0.0
+
+    # Words per minute in consecutive windows from the first word on
+    windows = []
+    if duration and window_seconds > 0:
+        window_count = max(int(np.ceil(duration / window_seconds)), 1)
+        window_index = np.minimum(((valid_starts - speech_start) // window_seconds).astype(np.int64), window_count - 1)
+        for index, words_in_window in enumerate(np.bincount(window_index, minlength=window_count).tolist()):
+            window_start = speech_start + index * window_seconds
+            window_length = min(window_seconds, speech_start + duration - window_start)
+            windows.append({
+                "StartTime": round(window_start, 2),
+                "EndTime": round(window_start + window_length, 2),
+                "Words": words_in_window,
+                "Words per Minute": round(60 * words_in_window / window_length, 2) if window_length > 0 else 0.0,
+            })
+
+    # Filler words: how many, how long, and how many follow a pause
+    is_filler = np.fromiter((content in filler_words for content in contents), dtype=bool, count=word_count)
+    filler_index = np.flatnonzero(is_filler)
+    with np.errstate(invalid='ignore'):
+        filler_durations = ends[filler_index] - starts[filler_index]
+        after_pause = gaps[filler_index[filler_index > 0] - 1] >= pause_threshold
+    filler_time = float(np.nansum(filler_durations))
+    fillers = {
+        "Count": len(filler_index),
+        "Per 100 Words": round(100 * len(filler_index) / word_count, 2) if word_count else 0.0,
+        "Per Minute": round(60 * len(filler_index) / duration, 2) if duration else 0.0,
+        "Total Filler Time": round(filler_time, 2),
+        "Mean Filler Duration": round(filler_time / len(filler_index), 2) if len(filler_index) else 0.0,
+        "Preceded by Pause": int(after_pause.sum()),
+        "Occurrences": [
+            {"Word": contents[i], "StartTime": start, "EndTime": end}
+            for i, start, end in zip(filler_index.tolist(), _round_2(starts[filler_index]), _round_2(ends[filler_index]))
+        ],
+    }
+
+    # The pause list analyze_pauses returns, so one call covers the stored pauses too
+    pause_index = np.flatnonzero(gaps >= pause_threshold)
+    pauses = [
+        {'StartTime': current_end, 'EndTime': next_start}
+        for current_end, next_start in zip(_round_2(ends[pause_index]), _round_2(starts[pause_index + 1]))
+    ]
+
+    return {
+        "Words": word_count,
+        "Speech Duration": round(duration, 2),
+        "Speech Rate (words per minute)": round(speech_rate, 2),
+        "Articulation Rate (words per minute)": round(articulation_rate, 2),
+        "Pause Summary": pause_summaries,
+        "Pause Histogram": histogram,
+        "Speech Rate Windows": windows,
+        "Filler Words": fillers,
+        "Pauses": pauses,
+    }
+
+def _round_2(values):
+    """
+    [round(value, 2) for value in values], vectorized.
+
+    Python rounds the exact binary value, so 100 * value computed in floating
+    point can land on the other side of a .5 tie; values that close to a tie
+    (or too large for the check to be exact) are rounded with round() itself.
+    """
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = values * 100
+        rounded = (np.rint(scaled) / 100).tolist()
+        distance_to_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5)
+    for i in np.flatnonzero((distance_to_tie < 1e-6) | ~(np.abs(scaled) < 2 ** 50)).tolist():
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+def _to_float(value):
+    """float(value), or NaN if the time value is invalid"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
@@ -0,0 +1,206 @@
+import time
+import uuid
+import threading
+import numpy as np
+
+from shared.stage_metrics import NULL_TRACE
+from processQuest.SpeechAnalysis import (
+    MAX_PHRASE_LENGTH,
+    _build_text_results,
+    _doc_counts,
+    _scan_phrase_repetitions,
+    lookup_frequencies,
+    syntax_nlp,
+)
+
+# Counts that add up across sentences
+SUMMED_COUNTS = (
+    "sentences", "tokens", "nouns", "verbs", "filler_words",
+    "open_class_words", "closed_class_words", "morphemes", "embedded_clauses",
+)
+
+# Sessions idle for longer than this are dropped
+SESSION_TTL_SECONDS = 60 * 60
+
+# Open sessions allowed at once; further create_session calls fail until one ends or expires
+MAX_SESSIONS = 1000
+
+# Longest chunk add_chunk accepts, and longest open (unfinished) sentence: past that the open text
+# is closed as if final, so text without sentence boundaries is not re-parsed from its start forever
+MAX_CHUNK_CHARS = 10000
+MAX_OPEN_TEXT_CHARS = 20000
+
+class TooManySessions(Exception):
+    """Raised when MAX_SESSIONS sessions are already open"""
+
+class ChunkTooLarge(Exception):
+    """Raised when a chunk is longer than MAX_CHUNK_CHARS"""
+
+def parse_open_text(text, final=False, trace=NULL_TRACE):
+    """
+    Parse a session's open text and split it into finished and open sentences.
+
+    Returns (counts of the finished sentences or None, counts of the open
+    sentence or None, offset in text where the open sentence starts). final=True
+    treats every sentence as finished. Module-level so the Flask API can run it
+    on the NLP worker pool.
+    """
+    with trace.stage("parse"):
+        doc = syntax_nlp(text)
+        sentences = list(doc.sents)
+
+    if final:
+        return _doc_counts(doc, trace), None, len(text)
+    if len(sentences) > 1:
+        last = sentences[-1]
+        return _doc_counts(doc[:last.start].as_doc(), trace), _doc_counts(last.as_doc(), trace), last.start_char
+    return None, _doc_counts(doc, trace), 0
+
+class TranscriptSession:
+    """
+    Incremental analyze_text for a transcript that arrives in ASR chunks.
+
+    Every chunk is appended to the open (last, possibly unfinished) sentence and
+    only that text is parsed. Sentences before it are final: their counts are
+    folded into running totals and their text is dropped, so earlier text is
+    never parsed again. snapshot() combines the totals with the open sentence and
+    returns the same fields as analyze_text.
+
+    Sentence boundaries and tags come from parsing each stretch of text on its
+    own, so results can differ slightly from analyze_text on the full transcript
+    where the parser would have used more context.
+
+    parse(text, final) does the parsing, parse_open_text by default; the Flask
+    API passes one that runs it on the NLP worker pool.
+    """
+
+    def __init__(self, lexicon_index=None, max_phrase_length=MAX_PHRASE_LENGTH, parse=parse_open_text):
+        self.lexicon_index = lexicon_index
+        self.max_phrase_length = max_phrase_length
+        self.parse = parse
+        self.lock = threading.Lock()
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+        self.counts = {field: 0 for field in SUMMED_COUNTS}
+        self.repetitions = 0
+        self.phrase_reps = 0
+        self.noun_frequency_total = 0.0
+        self.noun_frequency_count = 0
+
+        # Final tokens the phrase repetition scan has not decided yet (at most ~2x the max phrase length)
+        self.unscanned_tokens = np.zeros(0, dtype=np.uint64)
+        self.last_token_id = None
+
+        self.open_text = ""
+        self.open_counts = None
+
+    def add_chunk(self, text, final=False):
+        """
+        Append a transcript chunk; final=True closes the open sentence too.
+
+        Raises ChunkTooLarge for chunks over MAX_CHUNK_CHARS. An open sentence
+        that grows past MAX_OPEN_TEXT_CHARS is closed as if final.
+        """
+        if len(text) > MAX_CHUNK_CHARS:
+            raise ChunkTooLarge(f"Chunk is longer than {MAX_CHUNK_CHARS} characters")
+
+        with self.lock:
+            open_text = self.open_text
+            if open_text and text and not open_text[-1].isspace() and not text[0].isspace():
+                open_text += " "
+            open_text += text
+
+            # Nothing changes until the parse succeeds, so a failed chunk can be sent again
+            finished, open_counts, open_start = self.parse(open_text, final or len(open_text) > MAX_OPEN_TEXT_CHARS)
+            if finished is not None:
+                self._commit(finished)
+            self.open_text = open_text[open_start:]
+            self.open_counts = open_counts
+            self.updated_at = time.time()
+
+    def _commit(self, counts):
+        """Fold the counts of finished sentences into the running totals"""
+        for field in SUMMED_COUNTS:
+            self.counts[field] += counts[field]
+
+        tokens = counts["token_ids"]
+        self.repetitions += self._immediate_repetitions(tokens)
+        if len(tokens):
+            self.last_token_id = int(tokens[-1])
+
+        self.unscanned_tokens = np.concatenate((self.unscanned_tokens, tokens))
+        phrase_reps, resume = _scan_phrase_repetitions(self.unscanned_tokens, self.max_phrase_length, final=False)
+        self.phrase_reps += phrase_reps
+        self.unscanned_tokens = self.unscanned_tokens[resume:]
+
+        if self.lexicon_index is not None:
+            frequencies = lookup_frequencies(self.lexicon_index, counts["nouns_lower"])
+            self.noun_frequency_total += sum(frequencies)
+            self.noun_frequency_count += len(frequencies)
+
+    def _immediate_repetitions(self, tokens):
+        repetitions = int((tokens[1:] == tokens[:-1]).sum())
+        if len(tokens) and self.last_token_id is not None and int(tokens[0]) == self.last_token_id:
+            repetitions += 1
+        return repetitions
+
+    def snapshot(self):
+        """analyze_text style results for everything received so far"""
+        with self.lock:
+            counts = dict(self.counts)
+            repetitions = self.repetitions
+            noun_frequency_total = self.noun_frequency_total
+            noun_frequency_count = self.noun_frequency_count
+            tokens = self.unscanned_tokens
+
+            open_counts = self.open_counts
+            if open_counts is not None:
+                for field in SUMMED_COUNTS:
+                    counts[field] += open_counts[field]
+                repetitions += self._immediate_repetitions(open_counts["token_ids"])
+                tokens = np.concatenate((tokens, open_counts["token_ids"]))
+                if self.lexicon_index is not None:
+                    frequencies = lookup_frequencies(self.lexicon_index, open_counts["nouns_lower"])
+                    noun_frequency_total += sum(frequencies)
+                    noun_frequency_count += len(frequencies)
+
+            phrase_reps = self.phrase_reps + _scan_phrase_repetitions(tokens, self.max_phrase_length)[0]
+
+            avg_noun_frequency = None
+            if self.lexicon_index is not None:
+                avg_noun_frequency = (noun_frequency_total / noun_frequency_count) if noun_frequency_count else 0
+
+            return _build_text_results(counts, repetitions, phrase_reps, avg_noun_frequency)
+
+# Global variables
+sessions = {}
+sessions_lock = threading.Lock()
+
+def _expire_sessions(now):
+    for session_id in [sid for sid, session in sessions.items() if now - session.updated_at > SESSION_TTL_SECONDS]:
+        del sessions[session_id]
+
+def create_session(lexicon_index=None, max_phrase_length=MAX_PHRASE_LENGTH, parse=parse_open_text):
+    """Start a live transcript session and return its ID, or raise TooManySessions"""
+    session_id = uuid.uuid4().hex
+    with sessions_lock:
+        _expire_sessions(time.time())
+        if len(sessions) >= MAX_SESSIONS:
+            raise TooManySessions(f"Too many open transcript sessions ({MAX_SESSIONS})")
+        sessions[session_id] = TranscriptSession(lexicon_index, max_phrase_length, parse)
+    return session_id
+
+def get_session(session_id):
+    """Return the session or None if it does not exist or has expired"""
+    with sessions_lock:
+        session = sessions.get(session_id)
+        if session is not None and time.time() - session.updated_at > SESSION_TTL_SECONDS:
+            del sessions[session_id]
+            return None
+        return session
+
+def close_session(session_id):
+    """Forget a session, returning it (or None if unknown)"""
+    with sessions_lock:
+        return sessions.pop(session_id, None)
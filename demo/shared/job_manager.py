@@ -0,0 +1,167 @@
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from shared.worker_pool import PoolBusy
+
+# Finished jobs are kept this long for result retrieval
+JOB_TTL_SECONDS = 60 * 60
+
+def timed_call(fn, *args):
+    """Run fn(*args) and return (result, start timestamp, run seconds); runs inside the worker"""
+    started_at = time.time()
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, started_at, time.perf_counter() - start
+
+class Job:
+    def __init__(self, kind, key, cache_key=None, prepare=None, finalize=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.cache_key = cache_key
+        self.prepare = prepare
+        self.finalize = finalize
+        self.future = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.run_seconds = None
+        self.result = None
+        self.error = None
+
+    @property
+    def status(self):
+        if self.finished_at is not None:
+            return "failed" if self.error is not None else "done"
+        if self.future is not None and (self.future.running() or self.future.done()):
+            return "running"
+        return "queued"
+
+    def to_dict(self):
+        end = self.finished_at or time.time()
+        started_at = self.started_at
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": started_at,
+            "finished_at": self.finished_at,
+            "queue_seconds": round((started_at or end) - self.submitted_at, 4),
+            "run_seconds": round(self.run_seconds, 4) if self.run_seconds is not None else None,
+            "total_seconds": round(end - self.submitted_at, 4),
+            "error": self.error,
+        }
+
+class JobManager:
+    """
+    Background analysis jobs with polling, on top of a WorkerPool.
+
+    submit returns immediately with a Job; the work runs on the pool's worker
+    processes (or, for an inline pool, on one background thread) and the result
+    is kept for JOB_TTL_SECONDS. Jobs are deduplicated by a content key: while a
+    job with the same key is queued, running or done, submit returns that job
+    instead of starting another one. Failed jobs are not reused.
+
+    With a result_cache (shared/result_cache.py), results are looked up there
+    before queueing and stored there when a job finishes, so synchronous and
+    background requests share results.
+
+    Pool job timeouts do not apply to background jobs; they exist for long
+    analyses that would time out a synchronous request.
+    """
+
+    def __init__(self, pool, result_cache=None, ttl_seconds=JOB_TTL_SECONDS):
+        self.pool = pool
+        self.result_cache = result_cache
+        self.ttl_seconds = ttl_seconds
+        self.jobs = {}
+        self.jobs_by_key = {}
+        self.lock = threading.Lock()
+        self.background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nlp-jobs") if not pool.workers else None
+        self.deduplicated = 0
+
+    def _expire(self, now):
+        for job_id in [job_id for job_id, job in self.jobs.items()
+                       if job.finished_at is not None and now - job.finished_at > self.ttl_seconds]:
+            job = self.jobs.pop(job_id)
+            if self.jobs_by_key.get(job.key) == job_id:
+                del self.jobs_by_key[job.key]
+
+    def _pending(self):
+        return sum(1 for job in self.jobs.values() if job.finished_at is None)
+
+    def submit(self, kind, key, fn, *args, cache_key=None, prepare=None, finalize=None):
+        """
+        Start fn(*args) in the background, or return the existing job for key.
+
+        cache_key is the result cache key of the job's result. On the Flask
+        process, prepare turns the output of fn into that result before it is
+        cached, and finalize is applied to the result before it is served.
+        Returns (job, deduplicated). Raises PoolBusy when the pool's queue is full.
+        """
+        cached = None
+        if self.result_cache is not None and cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+
+        with self.lock:
+            self._expire(time.time())
+            existing = self.jobs.get(self.jobs_by_key.get(key))
+            if existing is not None and existing.status != "failed":
+                self.deduplicated += 1
+                return existing, True
+
+            job = Job(kind, key, cache_key, prepare, finalize)
+            if cached is not None:
+                job.started_at = job.finished_at = job.submitted_at
+                job.run_seconds = 0.0
+                job.result = finalize(cached) if finalize else cached
+            elif self.background is not None:
+                if self._pending() >= self.pool.max_queue:
+                    raise PoolBusy(f"NLP job queue is full ({self.pool.max_queue} pending)")
+                # pool.run so the inline pool still runs its initializer first
+                job.future = self.background.submit(self.pool.run, timed_call, fn, *args)
+            else:
+                job.future = self.pool.submit(timed_call, fn, *args)
+            self.jobs[job.id] = job
+            self.jobs_by_key[key] = job.id
+
+        if job.future is not None:
+            job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job, False
+
+    def _finish(self, job, future):
+        try:
+            result, job.started_at, job.run_seconds = future.result()
+            if job.prepare:
+                result = job.prepare(result)
+            if self.result_cache is not None and job.cache_key is not None:
+                self.result_cache.put(job.cache_key, result)
+            job.result = job.finalize(result) if job.finalize else result
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            print(f"Job {job.id} ({job.kind}) failed: {job.error}")
+        job.finished_at = time.time()
+
+    def get(self, job_id):
+        """Return the job or None if it does not exist or has expired"""
+        with self.lock:
+            self._expire(time.time())
+            return self.jobs.get(job_id)
+
+    def stats(self):
+        with self.lock:
+            self._expire(time.time())
+            statuses = [job.status for job in self.jobs.values()]
+            finished = [job for job in self.jobs.values() if job.run_seconds is not None]
+            return {
+                "queue_depth": statuses.count("queued"),
+                "running": statuses.count("running"),
+                "done": statuses.count("done"),
+                "failed": statuses.count("failed"),
+                "deduplicated": self.deduplicated,
+                "mean_run_seconds": round(sum(job.run_seconds for job in finished) / len(finished), 4)
+                if finished else 0.0,
+            }
@@ -0,0 +1,85 @@
+import time
+import importlib
+import threading
+
+class LazySubsystem:
+    """
+    A heavy dependency (module import, model, lexicon) loaded the first time it is used.
+
+    loader runs at most once per process even under concurrent requests. If it
+    raises, the error is recorded and re-raised, and the next get() tries again.
+    """
+
+    def __init__(self, name, loader):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.value = None
+        self.loaded = False
+        self.load_seconds = None
+        self.error = None
+        self.attempts = 0
+
+    def get(self):
+        if self.loaded:
+            return self.value
+
+        with self.lock:
+            if not self.loaded:
+                self.attempts += 1
+                start = time.perf_counter()
+                try:
+                    value = self.loader()
+                except Exception as e:
+                    self.error = f"{type(e).__name__}: {e}"
+                    print(f"Loading {self.name} failed: {self.error}")
+                    raise
+                self.load_seconds = round(time.perf_counter() - start, 3)
+                self.value = value
+                self.error = None
+                self.loaded = True
+                print(f"Loaded {self.name} in {self.load_seconds}s")
+        return self.value
+
+    def stats(self):
+        return {
+            "loaded": self.loaded,
+            "load_seconds": self.load_seconds,
+            "attempts": self.attempts,
+            "error": self.error,
+        }
+
+# Global variables
+subsystems = {}
+
+def lazy_subsystem(name, loader):
+    """Register a subsystem that loader() initializes on first use"""
+    subsystem = LazySubsystem(name, loader)
+    subsystems[name] = subsystem
+    return subsystem
+
+def lazy_module(name, module_name):
+    """Register a subsystem that imports module_name on first use and returns the module"""
+    return lazy_subsystem(name, lambda: importlib.import_module(module_name))
+
+def warm_up(names=None):
+    """
+    Load the named subsystems (all registered ones when None) now.
+
+    A subsystem that fails to load does not stop the others; its error shows up
+    in the returned stats.
+    """
+    names = list(subsystems) if names is None else names
+    unknown = [name for name in names if name not in subsystems]
+    if unknown:
+        raise ValueError(f"Unknown subsystems: {', '.join(unknown)}")
+
+    for name in names:
+        try:
+            subsystems[name].get()
+        except Exception:
+            pass
+    return get_subsystem_stats()
+
+def get_subsystem_stats():
+    return {name: subsystem.stats() for name, subsystem in subsystems.items()}
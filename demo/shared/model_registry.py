@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+import resource
+import threading
+
+# Model shared by Process Quest and Memory Vault, overridable for smaller dev models
+DEFAULT_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_lg")
+
+# Pipeline components each analysis profile can skip.
+# "vectors" never runs the pipeline: it only tokenizes, and token/doc vectors
+# come straight from the static vector table in nlp.vocab.
+PIPELINE_PROFILES = {
+    "full": (),
+    "syntax": ("ner", "lemmatizer"),  # POS, tags, morphology and sentences
+    "vectors": None,
+}
+
+# Global variables
+models = {}
+load_stats = {}
+registry_lock = threading.Lock()  # Lock so concurrent requests load the model only once
+
+# spacy itself is imported on first use: importing it takes about a second, which
+# processes that never parse text (e.g. ones serving only /analyze-pauses) skip
+
+def current_rss_mb():
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # No /proc (macOS): fall back to peak RSS, reported in bytes there and KB on Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def get_nlp(model_name=DEFAULT_MODEL):
+    """Load a spaCy model once per process and return the shared instance"""
+    nlp = models.get(model_name)
+    if nlp is not None:
+        return nlp
+
+    with registry_lock:
+        if model_name not in models:
+            import spacy
+            rss_before = current_rss_mb()
+            start = time.perf_counter()
+            models[model_name] = spacy.load(model_name)
+            load_stats[model_name] = {
+                "load_seconds": round(time.perf_counter() - start, 3),
+                "rss_before_mb": round(rss_before, 1),
+                "rss_after_mb": round(current_rss_mb(), 1),
+            }
+            stats = load_stats[model_name]
+            print(f"Loaded spaCy model {model_name} in {stats['load_seconds']}s "
+                  f"(RSS {stats['rss_before_mb']} MB -> {stats['rss_after_mb']} MB)")
+        return models[model_name]
+
+def get_model_version(model_name=DEFAULT_MODEL):
+    """
+    "<name>-<version>" of an installed model package or model directory, without loading it.
+
+    Used in cache keys so cached analysis results are dropped when the model changes.
+    """
+    import spacy.util
+    version = spacy.util.get_package_version(model_name)
+    if version is None and os.path.isdir(model_name):
+        # Model directory rather than an installed package
+        version = spacy.util.get_model_meta(model_name).get("version")
+    return f"{model_name}-{version}" if version else model_name
+
+class PipelineView:
+    """
+    Callable stand-in for an nlp object that runs only part of the shared pipeline.
+
+    The model is resolved on first use, so importing a module that holds a view
+    does not load spaCy.
+    """
+
+    def __init__(self, profile="full", model_name=DEFAULT_MODEL):
+        if profile not in PIPELINE_PROFILES:
+            raise ValueError(f"Unknown pipeline profile '{profile}'.")
+        self.profile = profile
+        self.model_name = model_name
+
+    @property
+    def nlp(self):
+        return get_nlp(self.model_name)
+
+    @property
+    def vocab(self):
+        return self.nlp.vocab
+
+    def __call__(self, text):
+        nlp = self.nlp
+        disabled = PIPELINE_PROFILES[self.profile]
+        if disabled is None:
+            return nlp.make_doc(text)
+        return nlp(text, disable=[name for name in disabled if name in nlp.pipe_names])
+
+    def pipe(self, texts, **kwargs):
+        """nlp.pipe with this profile; kwargs are ignored when only tokenizing"""
+        nlp = self.nlp
+        disabled = PIPELINE_PROFILES[self.profile]
+        if disabled is None:
+            return (nlp.make_doc(text) for text in texts)
+        return nlp.pipe(texts, disable=[name for name in disabled if name in nlp.pipe_names], **kwargs)
+
+def get_pipeline(profile="full", model_name=DEFAULT_MODEL):
+    """Return a view of the shared model for one of PIPELINE_PROFILES"""
+    return PipelineView(profile, model_name)
+
+def get_registry_stats():
+    """Loaded models with their load time and RSS before/after loading"""
+    return {
+        "models": {name: dict(stats) for name, stats in load_stats.items()},
+        "rss_mb": round(current_rss_mb(), 1),
+    }
@@ -0,0 +1,132 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from shared.lru_cache import LRUCache
+
+# Prune expired/excess rows from the SQLite store every this many writes
+PRUNE_EVERY = 100
+
+class ResultCache:
+    """
+    Content-addressed cache of JSON-serializable analysis results.
+
+    Entries live in an in-process LRU and, when db_path is given, in a SQLite
+    file so hits survive restarts. Both tiers share the same TTL; the SQLite
+    tier is trimmed to disk_maxsize rows. Values are stored as JSON text, so
+    every get returns a fresh copy the caller can modify.
+    """
+
+    def __init__(self, maxsize=1024, ttl_seconds=24 * 60 * 60, db_path=None, disk_maxsize=100000):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.disk_maxsize = disk_maxsize
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        self._writes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @staticmethod
+    def make_key(*parts):
+        """SHA-256 over a canonical JSON encoding of the key parts"""
+        encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _db(self):
+        """SQLite connection for this process (connections must not cross a fork)"""
+        if self._connection is None or self._connection_pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.commit()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def get(self, key):
+        """Cached value for key, or None on a miss or expired entry"""
+        now = time.time()
+        expired = False
+        entry = self.memory.get(key)
+        if entry is not None:
+            expires_at, encoded = entry
+            if expires_at > now:
+                with self._lock:
+                    self.memory_hits += 1
+                return json.loads(encoded)
+            expired = True
+
+        with self._lock:
+            if self.db_path:
+                db = self._db()
+                row = db.execute("SELECT value, expires_at FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] > now:
+                    self.disk_hits += 1
+                    self.memory.put(key, (row[1], row[0]))
+                    return json.loads(row[0])
+                if row is not None:
+                    expired = True
+                    db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    db.commit()
+
+            self.misses += 1
+            self.expired += int(expired)
+        return None
+
+    def put(self, key, value):
+        expires_at = time.time() + self.ttl_seconds
+        encoded = json.dumps(value)
+        self.memory.put(key, (expires_at, encoded))
+
+        if self.db_path:
+            with self._lock:
+                db = self._db()
+                db.execute("INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                           (key, encoded, expires_at))
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    self._prune(db)
+                db.commit()
+
+    def _prune(self, db):
+        db.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        db.execute(
+            "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY expires_at DESC LIMIT ?)",
+            (self.disk_maxsize,),
+        )
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value, or compute, store and return it"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            stats = {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "memory": self.memory.stats(),
+                "ttl_seconds": self.ttl_seconds,
+                "disk_path": self.db_path,
+            }
+            if self.db_path:
+                stats["disk_size"] = self._db().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return stats
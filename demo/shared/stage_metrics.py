@@ -0,0 +1,133 @@
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is unbounded)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class StageTrace:
+    """
+    Wall time per stage and token count for one analysis call.
+
+    Stages entered more than once (e.g. once per document of a batch) accumulate.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.tokens = 0
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self):
+        return {
+            "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+            "tokens": self.tokens,
+            "total_ms": round((time.perf_counter() - self.start) * 1000, 3),
+        }
+
+class _NullTrace:
+    """Stand-in when the caller does not want timings"""
+
+    @property
+    def tokens(self):
+        return 0
+
+    @tokens.setter
+    def tokens(self, value):
+        pass
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+NULL_TRACE = _NullTrace()
+
+class _Histogram:
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (None when it is the open-ended bucket)"""
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict(zip([str(bound) for bound in LATENCY_BUCKETS_MS] + ["+Inf"], self.buckets)),
+        }
+
+class StageMetrics:
+    """
+    Per-operation, per-stage latency histograms aggregated from StageTrace dicts.
+
+    Percentiles are reported as histogram bucket upper bounds.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}
+
+    def record(self, operation, trace):
+        """Add one call; trace is a StageTrace or its to_dict()"""
+        if isinstance(trace, StageTrace):
+            trace = trace.to_dict()
+        with self.lock:
+            entry = self.operations.setdefault(operation, {"calls": 0, "tokens": 0, "total": _Histogram(), "stages": {}})
+            entry["calls"] += 1
+            entry["tokens"] += trace["tokens"]
+            entry["total"].add(trace["total_ms"])
+            for name, ms in trace["stages_ms"].items():
+                entry["stages"].setdefault(name, _Histogram()).add(ms)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                operation: {
+                    "calls": entry["calls"],
+                    "tokens": entry["tokens"],
+                    "ms_per_1k_tokens": round(entry["total"].total_ms * 1000 / entry["tokens"], 3)
+                    if entry["tokens"] else None,
+                    "total": entry["total"].to_dict(),
+                    "stages": {name: histogram.to_dict() for name, histogram in entry["stages"].items()},
+                }
+                for operation, entry in self.operations.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.operations = {}
+
+# Process-wide metrics: analyses record the calls they time themselves, the Flask app the worker timings
+stage_metrics = StageMetrics()
+
+def get_stage_metrics():
+    """Per-stage latency histograms of the analyses recorded in stage_metrics"""
+    return stage_metrics.snapshot()
@@ -0,0 +1,203 @@
+import os
+import time
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+def _worker_pid():
+    return os.getpid()
+
+class PoolBusy(Exception):
+    """Raised when every worker is busy and the job queue is full"""
+
+class JobTimeout(Exception):
+    """Raised when a job does not finish within its timeout"""
+
+class WorkerPool:
+    """
+    Process pool with a bounded queue for CPU-bound NLP jobs.
+
+    Each worker runs initializer once (e.g. to load the spaCy model and lexicon)
+    and then serves jobs until shutdown. At most workers + max_queue jobs are
+    accepted at a time; submit raises PoolBusy beyond that so callers can shed
+    load instead of queueing without bound.
+
+    When a job that has started times out, its worker is terminated so the slot
+    is freed. ProcessPoolExecutor cannot stop a single worker, so the whole
+    executor is replaced: jobs running next to the timed-out one fail with
+    BrokenProcessPool, and new jobs go to freshly started workers.
+
+    workers=0 runs jobs inline on the calling thread (the initializer still runs
+    once), which keeps single-process development and debugging simple. Timeouts
+    are not enforced inline.
+    """
+
+    def __init__(self, workers=0, max_queue=32, timeout=60.0, initializer=None, initargs=(), start_method="spawn"):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.initializer = initializer
+        self.initargs = initargs
+        self.start_method = start_method
+        self.slots = threading.BoundedSemaphore(workers + max_queue) if workers else None
+        self.lock = threading.Lock()
+        self.executor = None
+        self.initialized_inline = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+
+    def _get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                # spawn: forking a threaded Flask server (or a loaded model) is not safe
+                context = multiprocessing.get_context(self.start_method)
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=self.initializer,
+                    initargs=self.initargs,
+                )
+                print(f"Started NLP worker pool with {self.workers} processes")
+            return self.executor
+
+    def _reset_executor(self, executor):
+        with self.lock:
+            if self.executor is executor:
+                print("NLP worker pool broke (a worker died), restarting")
+                self.executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recycle_executor(self, executor):
+        """Terminate the executor's workers (e.g. one stuck on a timed-out job) and start new ones on demand"""
+        with self.lock:
+            if self.executor is executor:
+                print("NLP job timed out, restarting the worker pool")
+                self.executor = None
+        # Read before shutdown, which clears it. The executor notices the dead workers and
+        # fails their jobs with BrokenProcessPool, which releases their slots.
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    def _run_inline(self, fn, args):
+        with self.lock:
+            if not self.initialized_inline:
+                if self.initializer is not None:
+                    self.initializer(*self.initargs)
+                self.initialized_inline = True
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def submit(self, fn, *args):
+        """Queue fn(*args) on a worker and return its Future, or raise PoolBusy"""
+        if self.slots is not None and not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.rejected += 1
+            raise PoolBusy(f"NLP queue is full ({self.workers} workers, {self.max_queue} queued)")
+
+        start = time.perf_counter()
+        with self.lock:
+            self.submitted += 1
+            self.in_flight += 1
+
+        def on_done(future):
+            with self.lock:
+                self.in_flight -= 1
+                self.total_seconds += time.perf_counter() - start
+                if future.cancelled() or future.exception() is not None:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+            if self.slots is not None:
+                self.slots.release()
+
+        if not self.workers:
+            future = self._run_inline(fn, args)
+            on_done(future)
+            return future
+
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError):
+                self._reset_executor(executor)
+                executor = self._get_executor()
+                future = executor.submit(fn, *args)
+        except Exception as e:
+            # Nothing was queued, so on_done will never run for this job
+            failed = Future()
+            failed.set_exception(e)
+            on_done(failed)
+            raise
+
+        def restart_if_broken(future):
+            if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+                self._reset_executor(executor)
+
+        future.executor = executor  # for run() to recycle on timeout
+        future.add_done_callback(on_done)
+        future.add_done_callback(restart_if_broken)
+        return future
+
+    def run(self, fn, *args, timeout=None):
+        """
+        Run fn(*args) on a worker and return its result.
+
+        Raises PoolBusy when the queue is full and JobTimeout when the job takes
+        longer than timeout (default: the pool's timeout). A timed-out job that
+        has started is stopped by restarting the workers (see the class docstring).
+        """
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            # cancel only succeeds if the job has not started yet
+            if not future.cancel() and self.workers:
+                self._recycle_executor(future.executor)
+            with self.lock:
+                self.timed_out += 1
+            raise JobTimeout(f"NLP job did not finish within {self.timeout if timeout is None else timeout}s")
+
+    def warm_up(self):
+        """Start every worker now, so the initializer runs before the first job instead of during it"""
+        if not self.workers:
+            return [self._run_inline(_worker_pid, ()).result()]
+        # Each submit to a pool without idle workers spawns one more, up to self.workers
+        executor = self._get_executor()
+        futures = [executor.submit(_worker_pid) for _ in range(self.workers)]
+        return sorted({future.result() for future in futures})
+
+    def stats(self):
+        with self.lock:
+            finished = self.completed + self.failed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "timeout_seconds": self.timeout,
+                "in_flight": self.in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "mean_seconds": round(self.total_seconds / finished, 4) if finished else 0.0,
+            }
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)